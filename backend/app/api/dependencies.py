@@ -1,26 +1,86 @@
 """FastAPI dependencies."""
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import AsyncIterator, FrozenSet, Iterator
+
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.config import settings
+from app.domain.exceptions import BusinessRuleViolation
 from app.domain.models.user import User
-from app.domain.models.value_objects import UserId
+from app.domain.models.value_objects import ProjectId, TaskId, UserId
 from app.infrastructure.auth.jwt_service import JwtService
-from app.infrastructure.database import create_db_engine, create_session_factory
+from app.infrastructure.auth.project_access import ProjectAccessIndex
+from app.infrastructure.cache.ttl_cache import TtlCache
+from app.infrastructure.database import (
+    create_async_db_engine,
+    create_async_session_factory,
+    create_db_router,
+)
 from app.infrastructure.email.email_service import MockEmailService
 from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 from app.infrastructure.llm.llm_service import SimpleLlmService
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.pool import PoolSettings
+from app.infrastructure.sqlite_profile import SqliteProfile
+from app.infrastructure.persistence.async_uow import (
+    AsyncSqlAlchemyReadOnlyUnitOfWork,
+    AsyncSqlAlchemyUnitOfWork,
+)
+from app.infrastructure.persistence.project_locks import ProjectLocks
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 
-engine = create_db_engine(settings.database_url)
-session_factory = create_session_factory(engine)
-jwt_service = JwtService(settings.jwt_secret, settings.jwt_algorithm)
+pool_settings = PoolSettings(
+    size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    timeout=settings.db_pool_timeout,
+    recycle=settings.db_pool_recycle,
+    pre_ping=settings.db_pool_pre_ping,
+)
+sqlite_profile = (
+    SqliteProfile(busy_timeout=settings.sqlite_busy_timeout_ms)
+    if settings.sqlite_profile == "production"
+    else None
+)
+db_router = create_db_router(
+    settings.database_url,
+    settings.database_replica_urls,
+    read_your_writes_seconds=settings.read_your_writes_seconds,
+    retry_seconds=settings.replica_retry_seconds,
+    pool=pool_settings,
+    sqlite_profile=sqlite_profile,
+    storage_mode=settings.db_storage_mode,
+)
+engine = db_router.primary
+session_factory = db_router.session_factory
+async_engines = {
+    sync_engine: create_async_db_engine(
+        sync_engine.url,
+        pool_settings,
+        sqlite_profile,
+        writer=sync_engine is db_router.primary,
+        storage_mode=settings.db_storage_mode,
+    )
+    for sync_engine in dict.fromkeys((db_router.primary, db_router.primary_reader, *db_router.replicas))
+}
+async_session_factory = create_async_session_factory(async_engines[db_router.primary])
+db_router.track_writes(async_session_factory.kw["sync_session_class"])
+async_read_session_factories = {
+    sync_engine: create_async_session_factory(async_engine, read_only=True)
+    for sync_engine, async_engine in async_engines.items()
+}
+jwt_service = JwtService(settings.jwt_secret, settings.jwt_algorithm, settings.jwt_cache_size)
 event_bus = InMemoryEventBus()
 email_service = MockEmailService()
 llm_service = SimpleLlmService(settings.llm_api_url, settings.llm_api_key)
+user_cache: TtlCache[UserId, User] = TtlCache(
+    ttl_seconds=settings.user_cache_ttl_seconds,
+    max_size=settings.user_cache_size,
+)
+project_access = ProjectAccessIndex(ttl_seconds=settings.project_access_ttl_seconds)
+project_locks = ProjectLocks(timeout=settings.project_lock_timeout_seconds)
 
 
 def get_db() -> Session:
@@ -32,38 +92,227 @@ def get_db() -> Session:
         session.close()
 
 
-def get_unit_of_work() -> SqlAlchemyUnitOfWork:
-    """Provide a unit of work."""
-    return SqlAlchemyUnitOfWork(
+def get_unit_of_work(request: Request) -> Iterator[SqlAlchemyUnitOfWork]:
+    """Provide a request-scoped unit of work.
+
+    FastAPI caches the dependency per request, so ``get_current_user``, the
+    authorization checks and the use case all join one session; it is
+    closed once the response has been sent. Commits are tagged with the
+    caller so their next reads stay on the primary.
+    """
+    uow = SqlAlchemyUnitOfWork(
         session_factory=session_factory,
         event_bus=event_bus,
         email_service=email_service,
         llm_service=llm_service,
+        user_cache=user_cache,
+        request_scoped=True,
+        session_info={"sticky_key": getattr(request.state, "user_id", None)},
+        project_locks=project_locks,
     )
+    try:
+        yield uow
+    finally:
+        uow.close()
 
 
-def get_current_user(
-    request: Request,
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
-) -> User:
-    """Extract current user from JWT."""
-    user_id = getattr(request.state, "user_id", None)
-    if user_id is None:
+def get_read_unit_of_work(request: Request) -> Iterator[SqlAlchemyReadOnlyUnitOfWork]:
+    """Provide a read-only unit of work, served by a replica when possible."""
+    uow = SqlAlchemyReadOnlyUnitOfWork(
+        session_factory=db_router.read_session_factory(getattr(request.state, "user_id", None)),
+        event_bus=event_bus,
+        email_service=email_service,
+        llm_service=llm_service,
+    )
+    try:
+        yield uow
+    finally:
+        uow.close()
+
+
+async def get_async_unit_of_work(request: Request) -> AsyncIterator[AsyncSqlAlchemyUnitOfWork]:
+    """Provide a request-scoped async unit of work for ``async def`` routes."""
+    uow = AsyncSqlAlchemyUnitOfWork(
+        session_factory=async_session_factory,
+        event_bus=event_bus,
+        email_service=email_service,
+        llm_service=llm_service,
+        user_cache=user_cache,
+        request_scoped=True,
+        session_info={"sticky_key": getattr(request.state, "user_id", None)},
+    )
+    try:
+        yield uow
+    finally:
+        await uow.close()
+
+
+async def get_async_read_unit_of_work(request: Request) -> AsyncIterator[AsyncSqlAlchemyReadOnlyUnitOfWork]:
+    """Provide a read-only async unit of work, served by a replica when possible."""
+    read_engine = db_router.read_engine(getattr(request.state, "user_id", None))
+    uow = AsyncSqlAlchemyReadOnlyUnitOfWork(
+        session_factory=async_read_session_factories[read_engine],
+        event_bus=event_bus,
+        email_service=email_service,
+        llm_service=llm_service,
+        request_scoped=True,
+    )
+    try:
+        yield uow
+    finally:
+        await uow.close()
+
+
+def _authenticated_user_id(request: Request) -> UserId:
+    """Return the user id of the request's bearer token or raise 401.
+
+    Claims verified by ``JwtAuthMiddleware`` are reused so a token is verified
+    at most once per request.
+    """
+    claims = getattr(request.state, "token_claims", None)
+    if claims is None:
         auth = request.headers.get("Authorization", "")
         if not auth.startswith("Bearer "):
             raise HTTPException(status_code=401, detail="Missing token")
         token = auth.replace("Bearer ", "", 1)
-        claims = jwt_service.verify_token(token)
-        user_id = claims.get("sub")
+        try:
+            claims = jwt_service.verify_token(token)
+        except BusinessRuleViolation as exc:
+            raise HTTPException(status_code=401, detail="Invalid token") from exc
+    user_id = claims.get("sub")
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
     try:
-        user_id_value = UUID(user_id)
+        return UserId(UUID(user_id))
     except ValueError as exc:
         raise HTTPException(status_code=401, detail="Invalid token") from exc
 
+
+def get_current_user(
+    request: Request,
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> User:
+    """Extract current user from JWT.
+
+    Users are served from ``user_cache`` so the common path does not touch
+    the database.
+    """
+    user_id = _authenticated_user_id(request)
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return replace(cached)
+
     with uow:
-        user = uow.users.find_by_id(UserId(user_id_value))
-        if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
+        user = uow.users.find_by_id(user_id)
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    user_cache.put(user.id, replace(user))
+    return user
+
+
+async def get_current_user_async(
+    request: Request,
+    uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_unit_of_work),
+) -> User:
+    """Async variant of ``get_current_user`` for ``async def`` routes."""
+    user_id = _authenticated_user_id(request)
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return replace(cached)
+
+    user = await uow.users.find_by_id(user_id)
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    user_cache.put(user.id, replace(user))
+    return user
+
+
+class ProjectAccess:
+    """Project permissions of the current user for one request.
+
+    Grants come from ``project_access`` so authorized requests do not query
+    the database; the project is only loaded on a denial, to tell a missing
+    project (404) apart from a forbidden one (403).
+    """
+
+    def __init__(self, user: User, uow: SqlAlchemyUnitOfWork, index: ProjectAccessIndex):
+        self.user = user
+        self.uow = uow
+        self.index = index
+
+    def require_manager(self, project_id: ProjectId) -> None:
+        """Raise unless the current user manages the project."""
+        if project_id in self.index.managed_projects(self.uow, self.user.id):
+            return
+        with self.uow:
+            project = self.uow.projects.find_by_id(project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if not project.is_manager(self.user.id):
+            raise HTTPException(status_code=403, detail="Manager access required")
+        self.index.revoke(self.user.id)
+
+    def require_member(self, project_id: ProjectId) -> None:
+        """Raise unless the current user manages or is a member of the project."""
+        if project_id in self.index.managed_projects(self.uow, self.user.id):
+            return
+        with self.uow:
+            member = self.uow.project_members.find_by_project_and_user(project_id, self.user.id)
+            project = self.uow.projects.find_by_id(project_id) if member is None else None
+        if member is not None:
+            return
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        raise HTTPException(status_code=403, detail="Project membership required")
+
+    def readable_projects(self) -> FrozenSet[ProjectId]:
+        """Return IDs of the projects the current user manages or is a member of."""
+        managed = self.index.managed_projects(self.uow, self.user.id)
+        with self.uow:
+            return managed | frozenset(self.uow.project_members.list_project_ids_by_user(self.user.id))
+
+    def require_task_manager(self, task_id: TaskId) -> ProjectId:
+        """Raise unless the current user manages the task's project."""
+        project_id = self.index.project_for_task(self.uow, task_id)
+        if project_id is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        self.require_manager(project_id)
+        return project_id
+
+
+def get_project_access(
+    current_user: User = Depends(get_current_user),
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> ProjectAccess:
+    """Provide the current user's project permissions."""
+    return ProjectAccess(current_user, uow, project_access)
+
+
+def require_project_manager(
+    project_id: UUID,
+    access: ProjectAccess = Depends(get_project_access),
+) -> User:
+    """Require manager access to the ``project_id`` path parameter."""
+    access.require_manager(ProjectId(project_id))
+    return access.user
+
+
+def require_project_member(
+    project_id: UUID,
+    access: ProjectAccess = Depends(get_project_access),
+) -> User:
+    """Require membership of the ``project_id`` path parameter."""
+    access.require_member(ProjectId(project_id))
+    return access.user
+
+
+async def require_project_member_async(
+    project_id: UUID,
+    current_user: User = Depends(get_current_user_async),
+    uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_unit_of_work),
+) -> User:
+    """Async variant of ``require_project_member`` for ``async def`` routes."""
+    await uow.run(
+        lambda sync_uow: ProjectAccess(current_user, sync_uow, project_access).require_member(ProjectId(project_id))
+    )
+    return current_user
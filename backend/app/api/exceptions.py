@@ -2,7 +2,7 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 
-from app.domain.exceptions import BusinessRuleViolation
+from app.domain.exceptions import BusinessRuleViolation, ConcurrencyConflict
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -18,6 +18,16 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc), "code": exc.code},
         )
 
+    @app.exception_handler(ConcurrencyConflict)
+    async def concurrency_conflict_handler(
+        _request: Request,
+        exc: ConcurrencyConflict,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=409,
+            content={"detail": str(exc), "code": exc.code},
+        )
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(
         _request: Request,
@@ -27,6 +27,7 @@ class JwtAuthMiddleware:
             token = auth.replace("Bearer ", "", 1)
             try:
                 claims = jwt_service.verify_token(token)
+                request.state.token_claims = claims
                 request.state.user_id = claims.get("sub")
             except Exception:
                 response = JSONResponse(status_code=401, content={"detail": "Invalid token"})
@@ -0,0 +1,29 @@
+"""Debug routes, mounted only when ``DEBUG_ENDPOINTS`` is enabled."""
+from fastapi import APIRouter, Depends
+
+from app.api import dependencies
+from app.api.dependencies import get_current_user
+from app.domain.models.user import User
+from app.infrastructure.pool import pool_metrics
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def get_pool_metrics(current_user: User = Depends(get_current_user)):
+    """Return connection pool metrics for every engine."""
+    return {
+        "primary": pool_metrics(dependencies.db_router.primary.pool),
+        "primary_reader": pool_metrics(dependencies.db_router.primary_reader.pool),
+        "replicas": [pool_metrics(replica.pool) for replica in dependencies.db_router.replicas],
+        "async": [
+            pool_metrics(async_engine.sync_engine.pool)
+            for async_engine in dependencies.async_engines.values()
+        ],
+    }
+
+
+@router.get("/locks")
+def get_lock_metrics(current_user: User = Depends(get_current_user)):
+    """Return wait-time metrics of the per-project write locks."""
+    return {"project_locks": dependencies.project_locks.metrics.snapshot()}
@@ -1,17 +1,27 @@
 """Employee routes."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
-from app.api.dependencies import get_current_user, get_unit_of_work
+from app.api.dependencies import (
+    get_async_read_unit_of_work,
+    get_current_user,
+    get_current_user_async,
+    get_unit_of_work,
+    require_project_manager,
+    require_project_member_async,
+)
+from app.application.dtos.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Cursor
 from app.application.use_cases.fire_employee import FireEmployeeUseCase
 from app.application.use_cases.get_employee_workload import GetEmployeeWorkloadUseCase
+from app.application.use_cases.get_team_workload import GetTeamWorkloadUseCase
 from app.application.use_cases.list_team import ListTeamUseCase
 from app.application.use_cases.remove_from_task import RemoveFromTaskUseCase
 from app.application.use_cases.resign_from_project import ResignFromProjectUseCase
 from app.domain.models.user import User
 from app.domain.models.value_objects import ProjectId, TaskId, UserId
+from app.infrastructure.persistence.async_uow import AsyncSqlAlchemyReadOnlyUnitOfWork
 from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
 
 router = APIRouter()
@@ -37,15 +47,9 @@ def remove_from_task(
 def fire_employee(
     project_id: UUID,
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_project_manager),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
 
     use_case = FireEmployeeUseCase(uow=uow)
     use_case.execute(ProjectId(project_id), UserId(user_id))
@@ -64,14 +68,18 @@ def resign_from_project(
 
 
 @router.get("/{project_id}/team")
-def list_team(
+async def list_team(
     project_id: UUID,
-    current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_async),
+    uow: AsyncSqlAlchemyReadOnlyUnitOfWork = Depends(get_async_read_unit_of_work),
 ):
-    use_case = ListTeamUseCase(uow=uow)
-    members = use_case.execute(ProjectId(project_id))
-    return [
+    after = Cursor.decode(cursor) if cursor else None
+    page = await uow.run(
+        lambda sync_uow: ListTeamUseCase(uow=sync_uow).execute(ProjectId(project_id), limit, after)
+    )
+    members = [
         {
             "id": str(member.id),
             "user_id": str(member.user_id),
@@ -80,19 +88,41 @@ def list_team(
             "base_capacity": member.base_capacity,
             "is_manager": member.is_manager,
         }
-        for member in members
+        for member in page.items
     ]
+    return {"items": members, "next_cursor": page.next_cursor.encode() if page.next_cursor else None}
+
+
+@router.get("/{project_id}/workload")
+async def get_team_workload(
+    project_id: UUID,
+    current_user: User = Depends(require_project_member_async),
+    uow: AsyncSqlAlchemyReadOnlyUnitOfWork = Depends(get_async_read_unit_of_work),
+):
+    workloads = await uow.run(lambda sync_uow: GetTeamWorkloadUseCase(uow=sync_uow).execute(ProjectId(project_id)))
+    return {
+        "items": [
+            {
+                "user_id": str(workload.user_id),
+                "workload_score": workload.workload_score,
+                "capacity": workload.capacity,
+                "status": workload.status.value,
+            }
+            for workload in workloads
+        ],
+    }
 
 
 @router.get("/{project_id}/workload/{user_id}")
-def get_workload(
+async def get_workload(
     project_id: UUID,
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    current_user: User = Depends(get_current_user_async),
+    uow: AsyncSqlAlchemyReadOnlyUnitOfWork = Depends(get_async_read_unit_of_work),
 ):
-    use_case = GetEmployeeWorkloadUseCase(uow=uow)
-    output = use_case.execute(ProjectId(project_id), UserId(user_id))
+    output = await uow.run(
+        lambda sync_uow: GetEmployeeWorkloadUseCase(uow=sync_uow).execute(ProjectId(project_id), UserId(user_id))
+    )
     return {
         "workload_score": output.workload_score,
         "capacity": output.capacity,
@@ -2,10 +2,10 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from app.api.dependencies import get_current_user, get_unit_of_work
+from app.api.dependencies import get_current_user, get_read_unit_of_work, get_unit_of_work, require_project_manager
 from app.application.dtos.project_dtos import AcceptInviteInput, CreateProjectInviteInput
 from app.application.use_cases.accept_invite import AcceptInviteUseCase
 from app.application.use_cases.create_project_invite import CreateProjectInviteUseCase
@@ -13,7 +13,7 @@ from app.application.use_cases.view_invite import ViewInviteUseCase
 from app.domain.models.enums import MemberLevel
 from app.domain.models.user import User
 from app.domain.models.value_objects import InviteToken, ProjectId, RoleId, UtcDateTime
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 
 router = APIRouter()
 
@@ -34,15 +34,9 @@ class AcceptInviteRequest(BaseModel):
 def create_invite(
     project_id: UUID,
     payload: CreateInviteRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_project_manager),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
 
     use_case = CreateProjectInviteUseCase(uow=uow, event_bus=uow.event_bus)
     output = use_case.execute(CreateProjectInviteInput(
@@ -66,7 +60,7 @@ def create_invite(
 def view_invite(
     token: str,
     _current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
 ):
     use_case = ViewInviteUseCase(uow=uow)
     output = use_case.execute(InviteToken(token))
@@ -1,23 +1,49 @@
 """Project routes."""
+import csv
+import dataclasses
+import hashlib
+import io
+import json
 from datetime import datetime
+from enum import Enum
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
-from app.api.dependencies import get_current_user, get_unit_of_work
+from app.api.dependencies import (
+    get_current_user,
+    get_read_unit_of_work,
+    get_unit_of_work,
+    require_project_manager,
+    require_project_member,
+)
+from app.api.task_import import CSV_MEDIA_TYPES, NDJSON_MEDIA_TYPES, parse_task_import
+from app.application.dtos.change_dtos import DEFAULT_CHANGES_LIMIT, MAX_CHANGES_LIMIT
+from app.application.dtos.export_dtos import ExportDataset, ExportInput
 from app.application.dtos.project_dtos import (
     ConfigureProjectLlmInput,
     CreateProjectInput,
     CreateRoleInput,
+    ProjectSnapshotOutput,
 )
+from app.application.dtos.task_dtos import ImportTasksInput
 from app.application.use_cases.configure_project_llm import ConfigureProjectLlmUseCase
 from app.application.use_cases.create_project import CreateProjectUseCase
 from app.application.use_cases.create_role import CreateRoleUseCase
+from app.application.use_cases.export_project_data import EXPORT_OUTPUTS, ExportProjectDataUseCase
 from app.application.use_cases.get_project import GetProjectUseCase
+from app.application.use_cases.get_project_snapshot import GetProjectSnapshotUseCase
+from app.application.use_cases.get_project_summary import GetProjectSummaryUseCase
+from app.application.use_cases.import_tasks import ImportTasksUseCase
+from app.application.use_cases.list_project_changes import ListProjectChangesUseCase
 from app.domain.models.user import User
 from app.domain.models.value_objects import ProjectId, UserId, UtcDateTime
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 
 router = APIRouter()
 
@@ -65,7 +91,7 @@ def create_project(
 def get_project(
     project_id: UUID,
     current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
 ):
     use_case = GetProjectUseCase(uow=uow)
     output = use_case.execute(ProjectId(project_id))
@@ -83,15 +109,9 @@ def get_project(
 def configure_llm(
     project_id: UUID,
     payload: ConfigureLlmRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_project_manager),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
 
     use_case = ConfigureProjectLlmUseCase(uow=uow)
     output = use_case.execute(ConfigureProjectLlmInput(
@@ -111,15 +131,9 @@ def configure_llm(
 def create_role(
     project_id: UUID,
     payload: CreateRoleRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_project_manager),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
 
     use_case = CreateRoleUseCase(uow=uow)
     output = use_case.execute(CreateRoleInput(
@@ -133,3 +147,269 @@ def create_role(
         "name": output.name,
         "description": output.description,
     }
+
+
+@router.post("/{project_id}/tasks/import")
+async def import_tasks(
+    project_id: UUID,
+    request: Request,
+    current_user: User = Depends(require_project_manager),
+    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+):
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type not in CSV_MEDIA_TYPES + NDJSON_MEDIA_TYPES:
+        raise HTTPException(status_code=415, detail="Expected CSV or NDJSON")
+    tasks, dependencies = await parse_task_import(request.stream(), media_type)
+
+    use_case = ImportTasksUseCase(uow=uow, event_bus=uow.event_bus)
+    output = await run_in_threadpool(use_case.execute, ImportTasksInput(
+        project_id=ProjectId(project_id),
+        tasks=tasks,
+        dependencies=dependencies,
+    ))
+    return {
+        "tasks": {ref: str(task_id) for ref, task_id in output.task_ids.items()},
+        "dependencies": output.dependencies,
+    }
+
+
+@router.get("/{project_id}/changes")
+def list_project_changes(
+    project_id: UUID,
+    since: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    current_user: User = Depends(require_project_member),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
+):
+    output = ListProjectChangesUseCase(uow=uow).execute(ProjectId(project_id), since, limit)
+    return {
+        "tasks": [
+            {
+                "id": str(task.id),
+                "title": task.title,
+                "description": task.description,
+                "status": task.status.value,
+                "difficulty": task.difficulty,
+                "role_id": str(task.role_id) if task.role_id else None,
+                "assigned_to": str(task.assigned_to) if task.assigned_to else None,
+                "expected_start_date": _iso(task.expected_start_date),
+                "expected_end_date": _iso(task.expected_end_date),
+                "actual_start_date": _iso(task.actual_start_date),
+                "actual_end_date": _iso(task.actual_end_date),
+            }
+            for task in output.tasks
+        ],
+        "members": [
+            {
+                "id": str(member.id),
+                "user_id": str(member.user_id),
+                "role_id": str(member.role_id) if member.role_id else None,
+                "level": member.level.value,
+                "base_capacity": member.base_capacity,
+                "is_manager": member.is_manager,
+            }
+            for member in output.members
+        ],
+        "dependencies": [
+            {"task_id": str(edge.task_id), "depends_on_id": str(edge.depends_on_id)}
+            for edge in output.dependencies
+        ],
+        "deleted_dependencies": [
+            {"task_id": str(edge.task_id), "depends_on_id": str(edge.depends_on_id)}
+            for edge in output.deleted_dependencies
+        ],
+        "next_since": output.next_since,
+        "has_more": output.has_more,
+    }
+
+
+@router.get("/{project_id}/summary")
+def get_project_summary(
+    project_id: UUID,
+    current_user: User = Depends(require_project_member),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
+):
+    output = GetProjectSummaryUseCase(uow=uow).execute(ProjectId(project_id))
+    return {
+        "project_id": str(output.project_id),
+        "task_count": output.task_count,
+        "status_counts": {status.value: count for status, count in output.status_counts.items()},
+        "total_difficulty": output.total_difficulty,
+        "doing_difficulty": output.doing_difficulty,
+        "delayed_count": output.delayed_count,
+        "latest_expected_end": _iso(output.latest_expected_end),
+    }
+
+
+@router.get("/{project_id}/snapshot")
+def get_project_snapshot(
+    project_id: UUID,
+    request: Request,
+    current_user: User = Depends(require_project_member),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
+):
+    output = GetProjectSnapshotUseCase(uow=uow).execute(ProjectId(project_id))
+    chunks = _encode_snapshot(output)
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        digest.update(chunk)
+    headers = {"ETag": f'"{digest.hexdigest()}"', "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return StreamingResponse(_stream(chunks), media_type="application/json", headers=headers)
+
+
+_SNAPSHOT_BATCH = 500
+
+
+def _iso(value: UtcDateTime | None) -> str | None:
+    return value.value.isoformat() if value else None
+
+
+def _encode_snapshot(output: ProjectSnapshotOutput) -> List[bytes]:
+    """Encode a snapshot as JSON chunks of up to ``_SNAPSHOT_BATCH`` items.
+
+    Items are encoded one by one, so the document is never built as a single
+    dict or string; the chunks are hashed for the ETag and then streamed.
+    """
+    project = output.project
+    sections: Dict[str, Iterable[Dict[str, Any]]] = {
+        "members": (
+            {
+                "id": str(member.id),
+                "user_id": str(member.user_id),
+                "role_id": str(member.role_id) if member.role_id else None,
+                "level": member.level.value,
+                "base_capacity": member.base_capacity,
+                "is_manager": member.is_manager,
+            }
+            for member in output.members
+        ),
+        "roles": (
+            {"id": str(role.id), "name": role.name, "description": role.description}
+            for role in output.roles
+        ),
+        "tasks": (
+            {
+                "id": str(task.id),
+                "title": task.title,
+                "description": task.description,
+                "status": task.status.value,
+                "difficulty": task.difficulty,
+                "role_id": str(task.role_id) if task.role_id else None,
+                "assigned_to": str(task.assigned_to) if task.assigned_to else None,
+                "expected_start_date": _iso(task.expected_start_date),
+                "expected_end_date": _iso(task.expected_end_date),
+                "actual_start_date": _iso(task.actual_start_date),
+                "actual_end_date": _iso(task.actual_end_date),
+            }
+            for task in output.tasks
+        ),
+        "dependencies": (
+            {
+                "task_id": str(dependency.task_id),
+                "depends_on_id": str(dependency.depends_on_id),
+                "dependency_type": dependency.dependency_type.value,
+            }
+            for dependency in output.dependencies
+        ),
+        "workloads": (
+            {
+                "user_id": str(workload.user_id),
+                "workload_score": workload.workload_score,
+                "capacity": workload.capacity,
+                "status": workload.status.value,
+            }
+            for workload in output.workloads
+        ),
+    }
+    chunks = [b'{"project":' + json.dumps({
+        "id": str(project.id),
+        "name": project.name,
+        "description": project.description,
+        "created_by": str(project.created_by),
+        "expected_end_date": _iso(project.expected_end_date),
+        "status": project.status.value,
+    }).encode()]
+    for name, items in sections.items():
+        chunks.append(f',"{name}":['.encode())
+        items = iter(items)
+        separator = ""
+        while batch := list(islice(items, _SNAPSHOT_BATCH)):
+            chunks.append((separator + ",".join(map(json.dumps, batch))).encode())
+            separator = ","
+        chunks.append(b"]")
+    chunks.append(b"}")
+    return chunks
+
+
+async def _stream(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+@router.get("/{project_id}/export/{dataset}")
+def export_project_data(
+    project_id: UUID,
+    dataset: ExportDataset,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    current_user: User = Depends(require_project_member),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
+):
+    rows = ExportProjectDataUseCase(uow=uow).execute(ExportInput(project_id=ProjectId(project_id), dataset=dataset))
+    names = [field.name for field in dataclasses.fields(EXPORT_OUTPUTS[dataset])]
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+    return StreamingResponse(
+        encode(rows, names),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{dataset.value}.{format}"'},
+    )
+
+
+_EXPORT_BATCH = 1000
+
+
+def _export_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UtcDateTime):
+        return value.value.isoformat()
+    if isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def _encode_ndjson(rows: Iterator[Any], names: List[str]) -> Iterator[bytes]:
+    """Encode DTOs as NDJSON, one chunk per ``_EXPORT_BATCH`` rows.
+
+    A sync generator: Starlette iterates it in a worker thread, so the
+    database reads behind ``rows`` never block the event loop.
+    """
+    while batch := list(islice(rows, _EXPORT_BATCH)):
+        yield "".join(
+            json.dumps({name: _export_value(getattr(row, name)) for name in names}) + "\n"
+            for row in batch
+        ).encode()
+
+
+def _encode_csv(rows: Iterator[Any], names: List[str]) -> Iterator[bytes]:
+    """Encode DTOs as CSV with a header row, one chunk per ``_EXPORT_BATCH`` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    while batch := list(islice(rows, _EXPORT_BATCH)):
+        writer.writerows([_export_value(getattr(row, name)) for name in names] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
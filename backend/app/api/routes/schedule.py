@@ -2,10 +2,11 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
-from app.api.dependencies import get_current_user, get_unit_of_work
+from app.api.dependencies import ProjectAccess, get_current_user, get_project_access, get_read_unit_of_work, get_unit_of_work
+from app.application.dtos.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Cursor
 from app.application.dtos.schedule_dtos import ManualDateOverrideInput, PropagateScheduleInput, UpdateProjectDateInput
 from app.application.use_cases.change_employee_role import ChangeEmployeeRoleUseCase
 from app.application.use_cases.detect_delay import DetectDelayUseCase
@@ -16,7 +17,7 @@ from app.application.use_cases.view_schedule_history import ViewScheduleHistoryU
 from app.domain.models.enums import ScheduleChangeReason
 from app.domain.models.user import User
 from app.domain.models.value_objects import ProjectId, RoleId, TaskId, UtcDateTime, UserId
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 
 router = APIRouter()
 
@@ -48,7 +49,7 @@ class ChangeRoleRequest(BaseModel):
 def detect_delay(
     task_id: UUID,
     current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
 ):
     use_case = DetectDelayUseCase(uow=uow)
     delayed = use_case.execute(TaskId(task_id))
@@ -72,15 +73,10 @@ def propagate_schedule(
 @router.post("/project-date")
 def update_project_date(
     payload: UpdateProjectDateRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(payload.project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_manager(ProjectId(payload.project_id))
 
     use_case = UpdateProjectDateUseCase(uow=uow)
     use_case.execute(UpdateProjectDateInput(
@@ -95,13 +91,19 @@ def update_project_date(
 def view_schedule_history(
     project_id: UUID | None = None,
     task_id: UUID | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    project_cursor: str | None = None,
+    task_cursor: str | None = None,
     current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
 ):
     use_case = ViewScheduleHistoryUseCase(uow=uow)
     projects, tasks = use_case.execute(
         project_id=ProjectId(project_id) if project_id else None,
         task_id=TaskId(task_id) if task_id else None,
+        limit=limit,
+        project_after=Cursor.decode(project_cursor) if project_cursor else None,
+        task_after=Cursor.decode(task_cursor) if task_cursor else None,
     )
     return {
         "projects": [
@@ -112,8 +114,9 @@ def view_schedule_history(
                 "new_end": item.new_end.value.isoformat(),
                 "reason": item.reason.value,
             }
-            for item in projects
+            for item in projects.items
         ],
+        "projects_next_cursor": projects.next_cursor.encode() if projects.next_cursor else None,
         "tasks": [
             {
                 "id": str(item.id),
@@ -124,24 +127,19 @@ def view_schedule_history(
                 "new_end": item.new_end.value.isoformat(),
                 "reason": item.reason.value,
             }
-            for item in tasks
+            for item in tasks.items
         ],
+        "tasks_next_cursor": tasks.next_cursor.encode() if tasks.next_cursor else None,
     }
 
 
 @router.post("/manual-override")
 def manual_override(
     payload: ManualOverrideRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(payload.task_id))
-        project = uow.projects.find_by_id(task.project_id) if task else None
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if project and not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(payload.task_id))
 
     use_case = ManualDateOverrideUseCase(uow=uow)
     use_case.execute(ManualDateOverrideInput(
@@ -155,15 +153,10 @@ def manual_override(
 @router.post("/change-role")
 def change_employee_role(
     payload: ChangeRoleRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(payload.project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_manager(ProjectId(payload.project_id))
 
     use_case = ChangeEmployeeRoleUseCase(uow=uow)
     use_case.execute(
@@ -1,10 +1,18 @@
 """Task routes."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-
-from app.api.dependencies import get_current_user, get_unit_of_work
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+
+from app.api.dependencies import (
+    ProjectAccess,
+    get_async_unit_of_work,
+    get_current_user,
+    get_current_user_async,
+    get_project_access,
+    get_read_unit_of_work,
+    get_unit_of_work,
+)
 from app.application.dtos.task_dtos import (
     AbandonTaskInput,
     CalculateProgressInput,
@@ -17,6 +25,7 @@ from app.application.dtos.task_dtos import (
 from app.application.use_cases.abandon_task import AbandonTaskUseCase
 from app.application.use_cases.add_task_dependency import AddTaskDependencyUseCase
 from app.application.use_cases.add_task_report import AddTaskReportUseCase
+from app.application.use_cases.batch_get_tasks import BatchGetTasksUseCase
 from app.application.use_cases.calculate_progress_llm import CalculateProgressLlmUseCase
 from app.application.use_cases.calculate_task_difficulty_llm import CalculateTaskDifficultyLlmUseCase
 from app.application.use_cases.cancel_task import CancelTaskUseCase
@@ -29,7 +38,8 @@ from app.application.use_cases.update_progress_manual import UpdateProgressManua
 from app.domain.models.enums import AbandonmentType, ProgressSource
 from app.domain.models.user import User
 from app.domain.models.value_objects import ProjectId, RoleId, TaskId
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.persistence.async_uow import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 
 router = APIRouter()
 
@@ -68,18 +78,17 @@ class ProgressUpdateRequest(BaseModel):
     note: str | None = None
 
 
+class BatchGetRequest(BaseModel):
+    ids: list[UUID] = Field(max_length=1000)
+
+
 @router.post("/")
 def create_task(
     payload: CreateTaskRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        project = uow.projects.find_by_id(ProjectId(payload.project_id))
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    if not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_manager(ProjectId(payload.project_id))
 
     use_case = CreateTaskUseCase(uow=uow, event_bus=uow.event_bus)
     output = use_case.execute(CreateTaskInput(
@@ -98,19 +107,49 @@ def create_task(
     }
 
 
+@router.post("/batch-get")
+def batch_get_tasks(
+    payload: BatchGetRequest,
+    access: ProjectAccess = Depends(get_project_access),
+    uow: SqlAlchemyReadOnlyUnitOfWork = Depends(get_read_unit_of_work),
+):
+    use_case = BatchGetTasksUseCase(uow=uow)
+    readable = access.readable_projects()
+    # Tasks of other projects are reported as missing, so IDs cannot be probed.
+    tasks = [
+        task for task in use_case.execute([TaskId(task_id) for task_id in payload.ids])
+        if task.project_id in readable
+    ]
+    found = {task.id.value for task in tasks}
+    return {
+        "items": [
+            {
+                "id": str(task.id),
+                "project_id": str(task.project_id),
+                "title": task.title,
+                "description": task.description,
+                "status": task.status.value,
+                "difficulty": task.difficulty,
+                "role_id": str(task.role_id) if task.role_id else None,
+                "assigned_to": str(task.assigned_to) if task.assigned_to else None,
+                "expected_start_date": task.expected_start_date.value.isoformat() if task.expected_start_date else None,
+                "expected_end_date": task.expected_end_date.value.isoformat() if task.expected_end_date else None,
+                "actual_start_date": task.actual_start_date.value.isoformat() if task.actual_start_date else None,
+                "actual_end_date": task.actual_end_date.value.isoformat() if task.actual_end_date else None,
+            }
+            for task in tasks
+        ],
+        "missing": [str(task_id) for task_id in dict.fromkeys(payload.ids) if task_id not in found],
+    }
+
+
 @router.post("/difficulty/manual")
 def set_task_difficulty(
     payload: SetDifficultyRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(payload.task_id))
-        project = uow.projects.find_by_id(task.project_id) if task else None
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if project and not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(payload.task_id))
 
     use_case = SetTaskDifficultyManualUseCase(uow=uow)
     output = use_case.execute(SetTaskDifficultyInput(
@@ -123,16 +162,10 @@ def set_task_difficulty(
 @router.post("/difficulty/llm/{task_id}")
 def calculate_task_difficulty(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(task_id))
-        if task is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        project = uow.projects.find_by_id(task.project_id)
-        if project and not project.is_manager(current_user.id):
-            raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(task_id))
 
     use_case = CalculateTaskDifficultyLlmUseCase(uow=uow)
     output = use_case.execute(TaskId(task_id))
@@ -142,16 +175,10 @@ def calculate_task_difficulty(
 @router.post("/dependencies")
 def add_dependency(
     payload: DependencyRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(payload.task_id))
-        project = uow.projects.find_by_id(task.project_id) if task else None
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if project and not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(payload.task_id))
 
     use_case = AddTaskDependencyUseCase(uow=uow)
     use_case.execute(TaskDependencyInput(
@@ -164,16 +191,10 @@ def add_dependency(
 @router.delete("/dependencies")
 def remove_dependency(
     payload: DependencyRequest,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(payload.task_id))
-        project = uow.projects.find_by_id(task.project_id) if task else None
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    if project and not project.is_manager(current_user.id):
-        raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(payload.task_id))
 
     use_case = RemoveTaskDependencyUseCase(uow=uow)
     use_case.execute(TaskDependencyInput(
@@ -186,16 +207,10 @@ def remove_dependency(
 @router.post("/{task_id}/cancel")
 def cancel_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
     uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
 ):
-    with uow:
-        task = uow.tasks.find_by_id(TaskId(task_id))
-        if task is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        project = uow.projects.find_by_id(task.project_id)
-        if project and not project.is_manager(current_user.id):
-            raise HTTPException(status_code=403, detail="Manager access required")
+    access.require_task_manager(TaskId(task_id))
 
     use_case = CancelTaskUseCase(uow=uow)
     output = use_case.execute(TaskId(task_id))
@@ -203,16 +218,18 @@ def cancel_task(
 
 
 @router.post("/{task_id}/select")
-def select_task(
+async def select_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    current_user: User = Depends(get_current_user_async),
+    uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_unit_of_work),
 ):
-    use_case = SelectTaskUseCase(uow=uow, event_bus=uow.event_bus)
-    output = use_case.execute(SelectTaskInput(
+    output = await uow.run(lambda sync_uow: SelectTaskUseCase(
+        uow=sync_uow,
+        event_bus=sync_uow.event_bus,
+    ).execute(SelectTaskInput(
         task_id=TaskId(task_id),
         user_id=current_user.id,
-    ))
+    )))
     return {"id": str(output.id), "status": output.status.value, "assigned_to": str(output.assigned_to)}
 
 
@@ -282,11 +299,12 @@ def update_progress(
 
 
 @router.post("/{task_id}/complete")
-def complete_task(
+async def complete_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    current_user: User = Depends(get_current_user_async),
+    uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_unit_of_work),
 ):
-    use_case = CompleteTaskUseCase(uow=uow, event_bus=uow.event_bus)
-    output = use_case.execute(TaskId(task_id))
+    output = await uow.run(
+        lambda sync_uow: CompleteTaskUseCase(uow=sync_uow, event_bus=sync_uow.event_bus).execute(TaskId(task_id))
+    )
     return {"id": str(output.id), "status": output.status.value}
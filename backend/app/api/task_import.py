@@ -0,0 +1,109 @@
+"""Incremental parsing of task import bodies (NDJSON or CSV).
+
+Every record is one line. NDJSON lines are objects and CSV files start with a
+header row; both use the same fields:
+
+* ``type``: ``task`` or ``dependency``
+* ``ref``: the client's key of the task (the dependent task for edges)
+* ``title``, ``description``, ``role_id``, ``difficulty``: task fields
+* ``depends_on``: the ref a dependency points to
+
+CSV fields may be quoted but must not contain line breaks.
+"""
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from app.application.dtos.task_dtos import ImportDependencyRow, ImportTaskRow
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import RoleId
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-lines")
+CSV_MEDIA_TYPES = ("text/csv",)
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _invalid(line_number: int, message: str) -> BusinessRuleViolation:
+    return BusinessRuleViolation(f"Line {line_number}: {message}", code="invalid_import")
+
+
+def _optional(record: Mapping[str, Any], field: str) -> Optional[Any]:
+    value = record.get(field)
+    return None if value in (None, "") else value
+
+
+def _row(record: Mapping[str, Any], line_number: int) -> ImportTaskRow | ImportDependencyRow:
+    kind = record.get("type")
+    ref = _optional(record, "ref")
+    if ref is None:
+        raise _invalid(line_number, "missing ref")
+    if kind == "dependency":
+        depends_on = _optional(record, "depends_on")
+        if depends_on is None:
+            raise _invalid(line_number, "missing depends_on")
+        return ImportDependencyRow(task_ref=str(ref), depends_on_ref=str(depends_on))
+    if kind != "task":
+        raise _invalid(line_number, f"unknown record type {kind!r}")
+    title = _optional(record, "title")
+    if title is None:
+        raise _invalid(line_number, "missing title")
+    role_id = _optional(record, "role_id")
+    difficulty = _optional(record, "difficulty")
+    try:
+        return ImportTaskRow(
+            ref=str(ref),
+            title=str(title),
+            description=_optional(record, "description"),
+            role_id=RoleId(UUID(str(role_id))) if role_id is not None else None,
+            difficulty=int(difficulty) if difficulty is not None else None,
+        )
+    except ValueError as exc:
+        raise _invalid(line_number, str(exc)) from exc
+
+
+async def parse_task_import(
+    chunks: AsyncIterator[bytes],
+    media_type: str,
+) -> Tuple[List[ImportTaskRow], List[ImportDependencyRow]]:
+    """Parse a request body as it arrives into task and dependency rows."""
+    tasks: List[ImportTaskRow] = []
+    dependencies: List[ImportDependencyRow] = []
+    header: Optional[List[str]] = None
+    line_number = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        if media_type in CSV_MEDIA_TYPES:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            record: Mapping[str, Any] = dict(zip(header, values))
+        else:
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise _invalid(line_number, "invalid JSON") from exc
+            if not isinstance(record, dict):
+                raise _invalid(line_number, "expected an object")
+        row = _row(record, line_number)
+        if isinstance(row, ImportTaskRow):
+            tasks.append(row)
+        else:
+            dependencies.append(row)
+    return tasks, dependencies
@@ -0,0 +1,48 @@
+"""Delta sync DTOs."""
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.dtos.project_dtos import ProjectMemberOutput
+from app.application.dtos.task_dtos import TaskOutput
+from app.domain.models.enums import ChangeEntity
+from app.domain.models.value_objects import TaskId
+
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 5000
+
+
+@dataclass(frozen=True)
+class ChangeEntry:
+    """One change log row.
+
+    ``entity_id`` is the task or member ID; dependencies are keyed by
+    ``entity_id`` (the dependent task) and ``related_id`` (its dependency).
+    """
+    seq: int
+    entity: ChangeEntity
+    entity_id: UUID
+    related_id: Optional[UUID]
+    deleted: bool
+
+
+@dataclass(frozen=True)
+class DependencyKey:
+    """Task dependency edge, by its endpoints."""
+    task_id: TaskId
+    depends_on_id: TaskId
+
+
+@dataclass(frozen=True)
+class ProjectChangesOutput:
+    """Current state of the rows changed after a cursor, and the next cursor.
+
+    ``has_more`` is set when the change limit was reached; poll again from
+    ``next_since`` to read the rest.
+    """
+    tasks: List[TaskOutput]
+    members: List[ProjectMemberOutput]
+    dependencies: List[DependencyKey]
+    deleted_dependencies: List[DependencyKey]
+    next_since: int
+    has_more: bool
@@ -0,0 +1,23 @@
+"""Export DTOs."""
+from dataclasses import dataclass
+from enum import Enum
+
+from app.domain.models.value_objects import ProjectId
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+class ExportDataset(str, Enum):
+    """Tables that can be exported for a project."""
+    TASKS = "tasks"
+    TASK_SCHEDULE_HISTORY = "task_schedule_history"
+    TASK_ASSIGNMENT_HISTORY = "task_assignment_history"
+    TASK_REPORTS = "task_reports"
+
+
+@dataclass(frozen=True)
+class ExportInput:
+    """Input for exporting one dataset of a project."""
+    project_id: ProjectId
+    dataset: ExportDataset
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE
@@ -0,0 +1,49 @@
+"""Keyset pagination DTOs."""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+from uuid import UUID
+
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import UtcDateTime
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Sort key of the last item on a page: its timestamp and ID.
+
+    Lists are ordered by ``(timestamp, id)``, so the next page starts
+    strictly after this pair whatever its depth.
+    """
+    timestamp: UtcDateTime
+    id: UUID
+
+    def encode(self) -> str:
+        """Return the cursor as an opaque URL-safe token."""
+        raw = json.dumps([self.timestamp.value.isoformat(), str(self.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(token: str) -> "Cursor":
+        """Parse a token produced by ``encode``."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            timestamp, item_id = json.loads(raw)
+            return Cursor(UtcDateTime(datetime.fromisoformat(timestamp)), UUID(item_id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+            raise BusinessRuleViolation("Invalid pagination cursor", code="invalid_cursor") from exc
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a list and the cursor of the next page, if any."""
+    items: List[T]
+    next_cursor: Optional[Cursor] = None
@@ -1,10 +1,12 @@
 """Project-related DTOs."""
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional
 
+from app.application.dtos.task_dtos import MemberWorkloadOutput, TaskDependencyOutput, TaskOutput
 from app.domain.models.project import Project
 from app.domain.models.project_invite import ProjectInvite
 from app.domain.models.project_member import ProjectMember
+from app.domain.models.project_summary import ProjectSummary
 from app.domain.models.role import Role
 from app.domain.models.value_objects import (
     InviteToken,
@@ -15,7 +17,7 @@ from app.domain.models.value_objects import (
     UserId,
     UtcDateTime,
 )
-from app.domain.models.enums import InviteStatus, MemberLevel, ProjectStatus
+from app.domain.models.enums import InviteStatus, MemberLevel, ProjectStatus, TaskStatus
 
 
 @dataclass(frozen=True)
@@ -152,3 +154,39 @@ class ProjectMemberOutput:
             base_capacity=member.base_capacity,
             is_manager=member.is_manager,
         )
+
+
+@dataclass(frozen=True)
+class ProjectSummaryOutput:
+    """Task counts, difficulty and schedule aggregates of a project."""
+    project_id: ProjectId
+    task_count: int
+    status_counts: Dict[TaskStatus, int]
+    total_difficulty: int
+    doing_difficulty: int
+    delayed_count: int
+    latest_expected_end: Optional[UtcDateTime]
+
+    @staticmethod
+    def from_domain(summary: ProjectSummary) -> "ProjectSummaryOutput":
+        """Create output DTO from domain model."""
+        return ProjectSummaryOutput(
+            project_id=summary.project_id,
+            task_count=summary.task_count,
+            status_counts=dict(summary.status_counts),
+            total_difficulty=summary.total_difficulty,
+            doing_difficulty=summary.doing_difficulty,
+            delayed_count=summary.delayed_count,
+            latest_expected_end=summary.latest_expected_end,
+        )
+
+
+@dataclass(frozen=True)
+class ProjectSnapshotOutput:
+    """Everything needed to render a project board."""
+    project: ProjectOutput
+    members: List[ProjectMemberOutput]
+    roles: List[RoleOutput]
+    tasks: List[TaskOutput]
+    dependencies: List[TaskDependencyOutput]
+    workloads: List[MemberWorkloadOutput]
@@ -53,6 +53,7 @@ class TaskScheduleHistoryOutput:
     new_start: UtcDateTime
     new_end: UtcDateTime
     reason: ScheduleChangeReason
+    created_at: UtcDateTime
 
     @staticmethod
     def from_domain(history: TaskScheduleHistory) -> "TaskScheduleHistoryOutput":
@@ -65,6 +66,7 @@ class TaskScheduleHistoryOutput:
             new_start=history.new_start,
             new_end=history.new_end,
             reason=history.reason,
+            created_at=history.created_at,
         )
 
 
@@ -1,13 +1,16 @@
 """Task-related DTOs."""
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional
 
-from app.domain.models.enums import AbandonmentType, ProgressSource, TaskStatus, WorkloadStatus
+from app.domain.models.enums import AbandonmentType, DependencyType, ProgressSource, TaskStatus, WorkloadStatus
 from app.domain.models.task import Task
+from app.domain.models.task_assignment_history import TaskAssignmentHistory
+from app.domain.models.task_dependency import TaskDependency
 from app.domain.models.task_report import TaskReport
 from app.domain.models.value_objects import (
     ProjectId,
     RoleId,
+    TaskAssignmentHistoryId,
     TaskId,
     TaskReportId,
     UserId,
@@ -39,6 +42,7 @@ class TaskOutput:
     expected_end_date: Optional[UtcDateTime]
     actual_start_date: Optional[UtcDateTime]
     actual_end_date: Optional[UtcDateTime]
+    created_at: UtcDateTime
 
     @staticmethod
     def from_domain(task: Task) -> "TaskOutput":
@@ -56,6 +60,7 @@ class TaskOutput:
             expected_end_date=task.expected_end_date,
             actual_start_date=task.actual_start_date,
             actual_end_date=task.actual_end_date,
+            created_at=task.created_at,
         )
 
 
@@ -131,9 +136,99 @@ class TaskReportOutput:
         )
 
 
+@dataclass(frozen=True)
+class TaskAssignmentHistoryOutput:
+    """Task assignment history output DTO."""
+    id: TaskAssignmentHistoryId
+    task_id: TaskId
+    user_id: UserId
+    assigned_at: UtcDateTime
+    unassigned_at: Optional[UtcDateTime]
+    assignment_reason: Optional[str]
+
+    @staticmethod
+    def from_domain(history: TaskAssignmentHistory) -> "TaskAssignmentHistoryOutput":
+        """Create output DTO from domain model."""
+        return TaskAssignmentHistoryOutput(
+            id=history.id,
+            task_id=history.task_id,
+            user_id=history.user_id,
+            assigned_at=history.assigned_at,
+            unassigned_at=history.unassigned_at,
+            assignment_reason=history.assignment_reason,
+        )
+
+
 @dataclass(frozen=True)
 class WorkloadOutput:
     """Workload output DTO."""
     workload_score: int
     capacity: float
     status: WorkloadStatus
+
+
+@dataclass(frozen=True)
+class MemberWorkloadOutput:
+    """Workload of one project member."""
+    user_id: UserId
+    workload_score: int
+    capacity: float
+    status: WorkloadStatus
+
+
+@dataclass(frozen=True)
+class WorkloadDrift:
+    """A member workload counter that disagrees with the member's DOING tasks."""
+    project_id: ProjectId
+    user_id: UserId
+    stored: int
+    actual: int
+
+
+@dataclass(frozen=True)
+class TaskDependencyOutput:
+    """Task dependency edge output DTO."""
+    task_id: TaskId
+    depends_on_id: TaskId
+    dependency_type: DependencyType
+
+    @staticmethod
+    def from_domain(dependency: TaskDependency) -> "TaskDependencyOutput":
+        """Create output DTO from domain model."""
+        return TaskDependencyOutput(
+            task_id=dependency.task_id,
+            depends_on_id=dependency.depends_on_id,
+            dependency_type=dependency.dependency_type,
+        )
+
+
+@dataclass(frozen=True)
+class ImportTaskRow:
+    """One task of a bulk import; ``ref`` is the client's key for it."""
+    ref: str
+    title: str
+    description: Optional[str] = None
+    role_id: Optional[RoleId] = None
+    difficulty: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ImportDependencyRow:
+    """Dependency edge of a bulk import, between two task refs."""
+    task_ref: str
+    depends_on_ref: str
+
+
+@dataclass(frozen=True)
+class ImportTasksInput:
+    """Input for importing tasks and their dependencies into a project."""
+    project_id: ProjectId
+    tasks: List[ImportTaskRow]
+    dependencies: List[ImportDependencyRow]
+
+
+@dataclass(frozen=True)
+class ImportTasksOutput:
+    """IDs of the imported tasks by ref, and the number of dependencies."""
+    task_ids: Dict[str, TaskId]
+    dependencies: int
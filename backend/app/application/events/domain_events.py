@@ -1,5 +1,6 @@
 """Domain events."""
 from dataclasses import dataclass
+from typing import Tuple
 
 from app.domain.models.enums import AbandonmentType
 from app.domain.models.value_objects import ProjectId, TaskId, UserId, ProjectInviteId
@@ -43,6 +44,13 @@ class TaskCreated:
     project_id: ProjectId
 
 
+@dataclass(frozen=True)
+class TasksCreated:
+    """Emitted once for a batch of tasks created by an import."""
+    project_id: ProjectId
+    task_ids: Tuple[TaskId, ...]
+
+
 @dataclass(frozen=True)
 class TaskAssigned:
     """Emitted when a task is assigned."""
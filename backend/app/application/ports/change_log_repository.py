@@ -0,0 +1,13 @@
+"""Change log repository port."""
+from typing import List, Protocol
+
+from app.application.dtos.change_dtos import ChangeEntry
+from app.domain.models.value_objects import ProjectId
+
+
+class ChangeLogRepository(Protocol):
+    """Read side of the change log written by the task, member and dependency repositories."""
+
+    def list_since(self, project_id: ProjectId, since: int, limit: int) -> List[ChangeEntry]:
+        """List up to ``limit`` changes of a project with ``seq`` above ``since``, oldest first."""
+        ...
@@ -0,0 +1,17 @@
+"""Member workload repository port."""
+from typing import List, Optional, Protocol
+
+from app.application.dtos.task_dtos import WorkloadDrift
+from app.domain.models.value_objects import ProjectId, UserId
+
+
+class MemberWorkloadRepository(Protocol):
+    """Per-member DOING difficulty counters, kept current by the task repository."""
+
+    def get_doing_difficulty(self, project_id: ProjectId, user_id: UserId) -> int:
+        """Get the summed difficulty of a member's DOING tasks in a project."""
+        ...
+
+    def reconcile(self, project_id: Optional[ProjectId] = None, repair: bool = False) -> List[WorkloadDrift]:
+        """List counters that differ from the tasks, and reset them to the tasks' value if ``repair``."""
+        ...
@@ -1,6 +1,7 @@
 """ProjectMember repository port."""
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Sequence, Tuple
 
+from app.application.dtos.pagination import Cursor, Page
 from app.domain.models.project_member import ProjectMember
 from app.domain.models.value_objects import ProjectId, ProjectMemberId, UserId
 
@@ -16,10 +17,23 @@ class ProjectMemberRepository(Protocol):
         """Find project member by ID."""
         ...
 
+    def find_by_ids(self, member_ids: Sequence[ProjectMemberId]) -> List[ProjectMember]:
+        """Find project members by ID, in the given order; missing IDs are skipped."""
+        ...
+
     def list_by_project(self, project_id: ProjectId) -> List[ProjectMember]:
         """List members in a project."""
         ...
 
+    def page_by_project(
+        self,
+        project_id: ProjectId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[ProjectMember]:
+        """List members in a project by (joined_at, id), one page at a time."""
+        ...
+
     def find_by_project_and_user(
         self,
         project_id: ProjectId,
@@ -27,3 +41,11 @@ class ProjectMemberRepository(Protocol):
     ) -> Optional[ProjectMember]:
         """Find a member by project and user."""
         ...
+
+    def list_project_ids_by_user(self, user_id: UserId) -> List[ProjectId]:
+        """List IDs of the projects a user is a member of."""
+        ...
+
+    def list_with_workload_scores(self, project_id: ProjectId) -> List[Tuple[ProjectMember, int]]:
+        """List members in a project with the summed difficulty of their DOING tasks."""
+        ...
@@ -20,6 +20,10 @@ class ProjectRepository(Protocol):
         """Find all projects created by a user."""
         ...
 
+    def list_ids_by_created_by(self, user_id: UserId) -> List[ProjectId]:
+        """List IDs of projects created (managed) by a user."""
+        ...
+
     def delete(self, project_id: ProjectId) -> None:
         """Delete a project."""
         ...
@@ -0,0 +1,17 @@
+"""Project summary repository port."""
+from typing import Optional, Protocol
+
+from app.domain.models.project_summary import ProjectSummary
+from app.domain.models.value_objects import ProjectId
+
+
+class ProjectSummaryRepository(Protocol):
+    """Task aggregates per project, kept current by the task repository."""
+
+    def get(self, project_id: ProjectId) -> ProjectSummary:
+        """Get the summary of a project; an empty summary if it has no tasks."""
+        ...
+
+    def rebuild(self, project_id: Optional[ProjectId] = None) -> int:
+        """Recompute summaries from the tasks, of one project or all; return how many were written."""
+        ...
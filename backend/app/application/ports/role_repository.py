@@ -1,5 +1,5 @@
 """Role repository port."""
-from typing import Protocol, Optional, List
+from typing import Protocol, Optional, List, Sequence
 
 from app.domain.models.role import Role
 from app.domain.models.value_objects import ProjectId, RoleId
@@ -16,6 +16,10 @@ class RoleRepository(Protocol):
         """Find role by ID."""
         ...
 
+    def find_by_ids(self, role_ids: Sequence[RoleId]) -> List[Role]:
+        """Find roles by ID, in the given order; missing IDs are skipped."""
+        ...
+
     def list_by_project(self, project_id: ProjectId) -> List[Role]:
         """List roles in a project."""
         ...
@@ -1,6 +1,7 @@
 """Schedule history repository port."""
-from typing import Protocol, List
+from typing import Iterator, Protocol, List, Optional
 
+from app.application.dtos.pagination import Cursor, Page
 from app.domain.models.project_schedule_history import ProjectScheduleHistory
 from app.domain.models.task_schedule_history import TaskScheduleHistory
 from app.domain.models.value_objects import ProjectId, TaskId
@@ -24,3 +25,25 @@ class ScheduleHistoryRepository(Protocol):
     def list_project_history(self, project_id: ProjectId) -> List[ProjectScheduleHistory]:
         """List schedule history for a project."""
         ...
+
+    def iter_task_history_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskScheduleHistory]:
+        """Stream the schedule history of a project's tasks, one batch in memory at a time."""
+        ...
+
+    def page_task_history(
+        self,
+        task_id: TaskId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[TaskScheduleHistory]:
+        """List schedule history for a task by (created_at, id), one page at a time."""
+        ...
+
+    def page_project_history(
+        self,
+        project_id: ProjectId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[ProjectScheduleHistory]:
+        """List schedule history for a project by (created_at, id), one page at a time."""
+        ...
@@ -1,5 +1,5 @@
 """TaskAbandonment repository port."""
-from typing import Protocol, List
+from typing import Protocol, List, Sequence
 
 from app.domain.models.task_abandonment import TaskAbandonment
 from app.domain.models.value_objects import TaskId
@@ -12,6 +12,10 @@ class TaskAbandonmentRepository(Protocol):
         """Persist a task abandonment."""
         ...
 
+    def add_many(self, abandonments: Sequence[TaskAbandonment]) -> None:
+        """Insert new task abandonments in bulk."""
+        ...
+
     def list_by_task(self, task_id: TaskId) -> List[TaskAbandonment]:
         """List abandonments for a task."""
         ...
@@ -1,8 +1,8 @@
 """TaskAssignmentHistory repository port."""
-from typing import Protocol, List
+from typing import Iterator, Protocol, List
 
 from app.domain.models.task_assignment_history import TaskAssignmentHistory
-from app.domain.models.value_objects import TaskId
+from app.domain.models.value_objects import ProjectId, TaskId
 
 
 class TaskAssignmentHistoryRepository(Protocol):
@@ -15,3 +15,7 @@ class TaskAssignmentHistoryRepository(Protocol):
     def list_by_task(self, task_id: TaskId) -> List[TaskAssignmentHistory]:
         """List assignment history for a task."""
         ...
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskAssignmentHistory]:
+        """Stream the assignment history of a project's tasks, one batch in memory at a time."""
+        ...
@@ -1,8 +1,8 @@
 """TaskDependency repository port."""
-from typing import Protocol, List
+from typing import Protocol, List, Sequence
 
 from app.domain.models.task_dependency import TaskDependency
-from app.domain.models.value_objects import TaskId
+from app.domain.models.value_objects import ProjectId, TaskId
 
 
 class TaskDependencyRepository(Protocol):
@@ -12,10 +12,18 @@ class TaskDependencyRepository(Protocol):
         """Persist a task dependency."""
         ...
 
+    def add_many(self, dependencies: Sequence[TaskDependency]) -> None:
+        """Insert new task dependencies in bulk."""
+        ...
+
     def list_by_task(self, task_id: TaskId) -> List[TaskDependency]:
         """List dependencies for a task."""
         ...
 
+    def list_by_project(self, project_id: ProjectId) -> List[TaskDependency]:
+        """List dependencies between the tasks of a project."""
+        ...
+
     def delete(self, task_id: TaskId, depends_on_id: TaskId) -> None:
         """Delete a dependency."""
         ...
@@ -1,8 +1,8 @@
 """TaskReport repository port."""
-from typing import Protocol, List
+from typing import Iterator, Protocol, List
 
 from app.domain.models.task_report import TaskReport
-from app.domain.models.value_objects import TaskId
+from app.domain.models.value_objects import ProjectId, TaskId
 
 
 class TaskReportRepository(Protocol):
@@ -15,3 +15,7 @@ class TaskReportRepository(Protocol):
     def list_by_task(self, task_id: TaskId) -> List[TaskReport]:
         """List reports for a task."""
         ...
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskReport]:
+        """Stream the reports of a project's tasks, one batch in memory at a time."""
+        ...
@@ -1,8 +1,8 @@
 """Task repository port."""
-from typing import Protocol, Optional, List
+from typing import Iterator, Protocol, Optional, List, Sequence
 
 from app.domain.models.task import Task
-from app.domain.models.value_objects import ProjectId, TaskId
+from app.domain.models.value_objects import ProjectId, TaskId, UserId
 
 
 class TaskRepository(Protocol):
@@ -12,10 +12,30 @@ class TaskRepository(Protocol):
         """Persist a task."""
         ...
 
+    def add_many(self, tasks: Sequence[Task]) -> None:
+        """Insert new tasks in bulk."""
+        ...
+
+    def unassign_user(self, project_id: ProjectId, user_id: UserId) -> List[TaskId]:
+        """Unassign all of a user's tasks in a project, DOING ones back to TODO; return their IDs."""
+        ...
+
     def find_by_id(self, task_id: TaskId) -> Optional[Task]:
         """Find task by ID."""
         ...
 
+    def find_by_ids(self, task_ids: Sequence[TaskId]) -> List[Task]:
+        """Find tasks by ID, in the given order; missing IDs are skipped."""
+        ...
+
+    def find_project_id(self, task_id: TaskId) -> Optional[ProjectId]:
+        """Find the project ID of a task without loading the task."""
+        ...
+
     def list_by_project(self, project_id: ProjectId) -> List[Task]:
         """List tasks in a project."""
         ...
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[Task]:
+        """Stream the tasks of a project, holding one batch in memory at a time."""
+        ...
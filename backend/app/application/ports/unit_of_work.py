@@ -1,14 +1,17 @@
 """Unit of Work port."""
-from typing import Protocol
+from typing import Any, Callable, Protocol, TypeVar
 
+from app.application.ports.change_log_repository import ChangeLogRepository
 from app.application.ports.email_service import EmailService
 from app.application.ports.event_bus import EventBus
 from app.application.ports.llm_service import LlmService
 from app.application.ports.magic_link_repository import MagicLinkRepository
+from app.application.ports.member_workload_repository import MemberWorkloadRepository
 from app.application.ports.notification_preference_repository import NotificationPreferenceRepository
 from app.application.ports.project_invite_repository import ProjectInviteRepository
 from app.application.ports.project_member_repository import ProjectMemberRepository
 from app.application.ports.project_repository import ProjectRepository
+from app.application.ports.project_summary_repository import ProjectSummaryRepository
 from app.application.ports.role_repository import RoleRepository
 from app.application.ports.schedule_history_repository import ScheduleHistoryRepository
 from app.application.ports.task_abandonment_repository import TaskAbandonmentRepository
@@ -17,6 +20,9 @@ from app.application.ports.task_dependency_repository import TaskDependencyRepos
 from app.application.ports.task_report_repository import TaskReportRepository
 from app.application.ports.task_repository import TaskRepository
 from app.application.ports.user_repository import UserRepository
+from app.domain.models.value_objects import ProjectId
+
+T = TypeVar("T")
 
 
 class UnitOfWork(Protocol):
@@ -35,6 +41,9 @@ class UnitOfWork(Protocol):
     schedule_history: ScheduleHistoryRepository
     notification_preferences: NotificationPreferenceRepository
     magic_links: MagicLinkRepository
+    change_log: ChangeLogRepository
+    project_summaries: ProjectSummaryRepository
+    member_workloads: MemberWorkloadRepository
 
     event_bus: EventBus
     email_service: EmailService
@@ -51,3 +60,56 @@ class UnitOfWork(Protocol):
     def commit(self) -> None:
         """Commit the unit of work."""
         ...
+
+    def lock_project(self, project_id: ProjectId) -> None:
+        """Serialize writes to a project until the transaction ends.
+
+        Writers of different projects never wait for each other; raises
+        ``ConcurrencyConflict`` when the lock is not granted in time.
+        """
+        ...
+
+
+class AsyncUnitOfWork(Protocol):
+    """Async Unit of Work interface.
+
+    Repository methods are awaited (``await uow.tasks.find_by_id(...)``), and
+    ``run`` executes synchronous use cases against the same transaction.
+    """
+
+    users: Any
+    projects: Any
+    project_members: Any
+    roles: Any
+    project_invites: Any
+    tasks: Any
+    task_dependencies: Any
+    task_reports: Any
+    task_abandonments: Any
+    task_assignment_history: Any
+    schedule_history: Any
+    notification_preferences: Any
+    magic_links: Any
+    change_log: Any
+    project_summaries: Any
+    member_workloads: Any
+
+    event_bus: EventBus
+    email_service: EmailService
+    llm_service: LlmService
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        """Begin a unit of work."""
+        ...
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Exit a unit of work."""
+        ...
+
+    async def commit(self) -> None:
+        """Commit the unit of work."""
+        ...
+
+    async def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        """Run synchronous work with a UnitOfWork bound to this transaction."""
+        ...
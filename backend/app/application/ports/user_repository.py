@@ -1,5 +1,5 @@
 """User repository port."""
-from typing import Protocol, Optional
+from typing import List, Protocol, Optional, Sequence
 
 from app.domain.models.user import User
 from app.domain.models.value_objects import UserId
@@ -16,6 +16,10 @@ class UserRepository(Protocol):
         """Find user by ID."""
         ...
 
+    def find_by_ids(self, user_ids: Sequence[UserId]) -> List[User]:
+        """Find users by ID, in the given order; missing IDs are skipped."""
+        ...
+
     def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email."""
         ...
@@ -0,0 +1,18 @@
+"""Batch Get Tasks use case."""
+from typing import List, Sequence
+
+from app.application.dtos.task_dtos import TaskOutput
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.models.value_objects import TaskId
+
+
+class BatchGetTasksUseCase:
+    """Use case for fetching many tasks at once."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, task_ids: Sequence[TaskId]) -> List[TaskOutput]:
+        """Get the tasks that exist among ``task_ids``, in request order."""
+        with self.uow:
+            return [TaskOutput.from_domain(task) for task in self.uow.tasks.find_by_ids(task_ids)]
@@ -0,0 +1,51 @@
+"""Export Project Data use case."""
+from typing import Any, Dict, Iterator
+
+from app.application.dtos.export_dtos import ExportDataset, ExportInput
+from app.application.dtos.schedule_dtos import TaskScheduleHistoryOutput
+from app.application.dtos.task_dtos import TaskAssignmentHistoryOutput, TaskOutput, TaskReportOutput
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.exceptions import BusinessRuleViolation
+
+# Row type of each dataset, so callers can lay out columns before any row.
+EXPORT_OUTPUTS: Dict[ExportDataset, type] = {
+    ExportDataset.TASKS: TaskOutput,
+    ExportDataset.TASK_SCHEDULE_HISTORY: TaskScheduleHistoryOutput,
+    ExportDataset.TASK_ASSIGNMENT_HISTORY: TaskAssignmentHistoryOutput,
+    ExportDataset.TASK_REPORTS: TaskReportOutput,
+}
+
+
+class ExportProjectDataUseCase:
+    """Use case for streaming one table of a project for export.
+
+    The project is checked eagerly; the rows are produced lazily, inside a
+    unit of work that stays open until the returned iterator is exhausted or
+    closed, with one batch of rows in memory at a time.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, input_dto: ExportInput) -> Iterator[Any]:
+        """Return an iterator over the output DTOs of the dataset."""
+        with self.uow:
+            if self.uow.projects.find_by_id(input_dto.project_id) is None:
+                raise BusinessRuleViolation("Project not found", code="project_not_found")
+        return self._stream(input_dto)
+
+    def _stream(self, input_dto: ExportInput) -> Iterator[Any]:
+        project_id, batch_size = input_dto.project_id, input_dto.batch_size
+        with self.uow:
+            if input_dto.dataset is ExportDataset.TASKS:
+                for task in self.uow.tasks.iter_by_project(project_id, batch_size):
+                    yield TaskOutput.from_domain(task)
+            elif input_dto.dataset is ExportDataset.TASK_SCHEDULE_HISTORY:
+                for history in self.uow.schedule_history.iter_task_history_by_project(project_id, batch_size):
+                    yield TaskScheduleHistoryOutput.from_domain(history)
+            elif input_dto.dataset is ExportDataset.TASK_ASSIGNMENT_HISTORY:
+                for assignment in self.uow.task_assignment_history.iter_by_project(project_id, batch_size):
+                    yield TaskAssignmentHistoryOutput.from_domain(assignment)
+            else:
+                for report in self.uow.task_reports.iter_by_project(project_id, batch_size):
+                    yield TaskReportOutput.from_domain(report)
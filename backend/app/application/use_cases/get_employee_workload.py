@@ -2,13 +2,8 @@
 from app.application.dtos.task_dtos import WorkloadOutput
 from app.application.ports.unit_of_work import UnitOfWork
 from app.domain.exceptions import BusinessRuleViolation
-from app.domain.models.enums import TaskStatus
 from app.domain.models.value_objects import ProjectId, UserId
-from app.domain.services.workload_calculator import (
-    calculate_capacity,
-    calculate_workload_score,
-    calculate_workload_status,
-)
+from app.domain.services.workload_calculator import calculate_capacity, calculate_workload_status
 
 
 class GetEmployeeWorkloadUseCase:
@@ -24,12 +19,7 @@ class GetEmployeeWorkloadUseCase:
             if member is None:
                 raise BusinessRuleViolation("Member not found", code="member_not_found")
 
-            tasks = self.uow.tasks.list_by_project(project_id)
-            doing_tasks = [
-                task for task in tasks
-                if task.assigned_to == user_id and task.status == TaskStatus.DOING
-            ]
-            workload_score = calculate_workload_score(doing_tasks)
+            workload_score = self.uow.member_workloads.get_doing_difficulty(project_id, user_id)
             capacity = calculate_capacity(member.base_capacity, member.level)
             status = calculate_workload_status(workload_score, capacity)
             return WorkloadOutput(
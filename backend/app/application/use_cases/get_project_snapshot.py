@@ -0,0 +1,67 @@
+"""Get Project Snapshot use case."""
+from collections import defaultdict
+from typing import Dict, List
+
+from app.application.dtos.project_dtos import (
+    ProjectMemberOutput,
+    ProjectOutput,
+    ProjectSnapshotOutput,
+    RoleOutput,
+)
+from app.application.dtos.task_dtos import MemberWorkloadOutput, TaskDependencyOutput, TaskOutput
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.enums import TaskStatus
+from app.domain.models.task import Task
+from app.domain.models.value_objects import ProjectId, UserId
+from app.domain.services.workload_calculator import (
+    calculate_capacity,
+    calculate_workload_score,
+    calculate_workload_status,
+)
+
+
+class GetProjectSnapshotUseCase:
+    """Use case for loading a whole project board.
+
+    Runs one query per table (project, members, roles, tasks, dependencies)
+    and derives every member's workload from the loaded tasks.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, project_id: ProjectId) -> ProjectSnapshotOutput:
+        """Load the project, its team, roles, tasks, dependencies and workloads."""
+        with self.uow:
+            project = self.uow.projects.find_by_id(project_id)
+            if project is None:
+                raise BusinessRuleViolation("Project not found", code="project_not_found")
+            members = self.uow.project_members.list_by_project(project_id)
+            roles = self.uow.roles.list_by_project(project_id)
+            tasks = self.uow.tasks.list_by_project(project_id)
+            dependencies = self.uow.task_dependencies.list_by_project(project_id)
+
+        doing: Dict[UserId, List[Task]] = defaultdict(list)
+        for task in tasks:
+            if task.status == TaskStatus.DOING and task.assigned_to is not None:
+                doing[task.assigned_to].append(task)
+        workloads = []
+        for member in members:
+            score = calculate_workload_score(doing.get(member.user_id, []))
+            capacity = calculate_capacity(member.base_capacity, member.level)
+            workloads.append(MemberWorkloadOutput(
+                user_id=member.user_id,
+                workload_score=score,
+                capacity=capacity,
+                status=calculate_workload_status(score, capacity),
+            ))
+
+        return ProjectSnapshotOutput(
+            project=ProjectOutput.from_domain(project),
+            members=[ProjectMemberOutput.from_domain(member) for member in members],
+            roles=[RoleOutput.from_domain(role) for role in roles],
+            tasks=[TaskOutput.from_domain(task) for task in tasks],
+            dependencies=[TaskDependencyOutput.from_domain(dependency) for dependency in dependencies],
+            workloads=workloads,
+        )
@@ -0,0 +1,23 @@
+"""Get Project Summary use case."""
+from app.application.dtos.project_dtos import ProjectSummaryOutput
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import ProjectId
+
+
+class GetProjectSummaryUseCase:
+    """Use case for reading a project's task aggregates.
+
+    The summary is a single row kept current on every task write, so the
+    read costs the same whatever the number of tasks.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, project_id: ProjectId) -> ProjectSummaryOutput:
+        """Get the summary of a project."""
+        with self.uow:
+            if self.uow.projects.find_by_id(project_id) is None:
+                raise BusinessRuleViolation("Project not found", code="project_not_found")
+            return ProjectSummaryOutput.from_domain(self.uow.project_summaries.get(project_id))
@@ -0,0 +1,38 @@
+"""Get Team Workload use case."""
+from typing import List
+
+from app.application.dtos.task_dtos import MemberWorkloadOutput
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import ProjectId
+from app.domain.services.workload_calculator import calculate_capacity, calculate_workload_status
+
+
+class GetTeamWorkloadUseCase:
+    """Use case for computing the workload of every member of a project.
+
+    The workload score of BR-WORK (``calculate_workload_score``: the summed
+    difficulty of a member's DOING tasks) is aggregated by the database in
+    one grouped query, so the cost does not multiply members by tasks.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, project_id: ProjectId) -> List[MemberWorkloadOutput]:
+        """Compute workload, capacity and status for each project member."""
+        with self.uow:
+            if self.uow.projects.find_by_id(project_id) is None:
+                raise BusinessRuleViolation("Project not found", code="project_not_found")
+            scored = self.uow.project_members.list_with_workload_scores(project_id)
+
+        workloads = []
+        for member, score in scored:
+            capacity = calculate_capacity(member.base_capacity, member.level)
+            workloads.append(MemberWorkloadOutput(
+                user_id=member.user_id,
+                workload_score=score,
+                capacity=capacity,
+                status=calculate_workload_status(score, capacity),
+            ))
+        return workloads
@@ -0,0 +1,83 @@
+"""Import Tasks use case."""
+from typing import Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+from app.application.dtos.task_dtos import ImportTasksInput, ImportTasksOutput
+from app.application.events.domain_events import TasksCreated
+from app.application.ports.event_bus import EventBus
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.task import Task
+from app.domain.models.task_dependency import TaskDependency
+from app.domain.models.value_objects import TaskId
+from app.domain.services.dependency_validator import has_cycle
+
+T = TypeVar("T")
+
+IMPORT_CHUNK_SIZE = 5000
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class ImportTasksUseCase:
+    """Use case for importing a plan of tasks and dependencies into a project.
+
+    The whole input is validated before anything is written: refs must be
+    unique and resolve, and the dependency graph is checked for cycles once.
+    Rows are then inserted in bulk, one transaction per ``chunk_size`` rows,
+    so a large import never holds the write lock for its whole duration.
+    """
+
+    def __init__(self, uow: UnitOfWork, event_bus: EventBus, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.uow = uow
+        self.event_bus = event_bus
+        self.chunk_size = chunk_size
+
+    def execute(self, input_dto: ImportTasksInput) -> ImportTasksOutput:
+        """Validate and import the tasks and dependencies."""
+        with self.uow:
+            if self.uow.projects.find_by_id(input_dto.project_id) is None:
+                raise BusinessRuleViolation("Project not found", code="project_not_found")
+
+        task_ids: Dict[str, TaskId] = {}
+        tasks: List[Task] = []
+        for row in input_dto.tasks:
+            if row.ref in task_ids:
+                raise BusinessRuleViolation(f"Duplicate task ref {row.ref!r}", code="duplicate_task_ref")
+            task = Task.create(project_id=input_dto.project_id, title=row.title, description=row.description)
+            task.role_id = row.role_id
+            task.difficulty = row.difficulty
+            task_ids[row.ref] = task.id
+            tasks.append(task)
+
+        edges: Dict[Tuple[TaskId, TaskId], None] = {}
+        for row in input_dto.dependencies:
+            task_id = task_ids.get(row.task_ref)
+            depends_on_id = task_ids.get(row.depends_on_ref)
+            if task_id is None or depends_on_id is None:
+                missing = row.task_ref if task_id is None else row.depends_on_ref
+                raise BusinessRuleViolation(f"Unknown task ref {missing!r}", code="unknown_task_ref")
+            if task_id == depends_on_id:
+                raise BusinessRuleViolation("Task cannot depend on itself", code="self_dependency")
+            edges[(task_id, depends_on_id)] = None
+
+        graph: Dict[TaskId, List[TaskId]] = {}
+        for task_id, depends_on_id in edges:
+            graph.setdefault(task_id, []).append(depends_on_id)
+        if has_cycle(graph):
+            raise BusinessRuleViolation("Dependencies form a cycle", code="dependency_cycle")
+
+        dependencies = [TaskDependency.create(task_id, depends_on_id) for task_id, depends_on_id in edges]
+        for chunk in _chunks(tasks, self.chunk_size):
+            with self.uow:
+                self.uow.tasks.add_many(chunk)
+                self.uow.commit()
+        for chunk in _chunks(dependencies, self.chunk_size):
+            with self.uow:
+                self.uow.task_dependencies.add_many(chunk)
+                self.uow.commit()
+
+        self.event_bus.emit(TasksCreated(project_id=input_dto.project_id, task_ids=tuple(task_ids.values())))
+        return ImportTasksOutput(task_ids=task_ids, dependencies=len(dependencies))
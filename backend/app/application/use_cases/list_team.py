@@ -1,6 +1,7 @@
 """UC-053: List Team use case."""
-from typing import List
+from typing import Optional
 
+from app.application.dtos.pagination import DEFAULT_PAGE_SIZE, Cursor, Page
 from app.application.dtos.project_dtos import ProjectMemberOutput
 from app.application.ports.unit_of_work import UnitOfWork
 from app.domain.models.value_objects import ProjectId
@@ -12,8 +13,13 @@ class ListTeamUseCase:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
-    def execute(self, project_id: ProjectId) -> List[ProjectMemberOutput]:
-        """List members of a project."""
+    def execute(
+        self,
+        project_id: ProjectId,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[Cursor] = None,
+    ) -> Page[ProjectMemberOutput]:
+        """List one page of members of a project."""
         with self.uow:
-            members = self.uow.project_members.list_by_project(project_id)
-            return [ProjectMemberOutput.from_domain(member) for member in members]
+            page = self.uow.project_members.page_by_project(project_id, limit, after)
+            return Page([ProjectMemberOutput.from_domain(member) for member in page.items], page.next_cursor)
@@ -18,6 +18,10 @@ class PropagateScheduleUseCase:
     def execute(self, input_dto: PropagateScheduleInput) -> None:
         """Propagate schedule changes for a task."""
         with self.uow:
+            project_id = self.uow.tasks.find_project_id(input_dto.task_id)
+            if project_id is None:
+                raise BusinessRuleViolation("Task not found", code="task_not_found")
+            self.uow.lock_project(project_id)
             task = self.uow.tasks.find_by_id(input_dto.task_id)
             if task is None:
                 raise BusinessRuleViolation("Task not found", code="task_not_found")
@@ -43,14 +43,9 @@ class SelectTaskUseCase:
                     code="difficulty_not_set",
                 )
 
-            project_tasks = self.uow.tasks.list_by_project(task.project_id)
-            current_tasks = [
-                item for item in project_tasks
-                if item.assigned_to == input_dto.user_id
-                and item.status == TaskStatus.DOING
-            ]
+            current_score = self.uow.member_workloads.get_doing_difficulty(task.project_id, input_dto.user_id)
             if would_be_impossible(
-                current_tasks,
+                current_score,
                 task,
                 base_capacity=member.base_capacity,
                 level=member.level,
@@ -14,6 +14,7 @@ class UpdateProjectDateUseCase:
     def execute(self, input_dto: UpdateProjectDateInput) -> None:
         """Update project expected end date."""
         with self.uow:
+            self.uow.lock_project(input_dto.project_id)
             project = self.uow.projects.find_by_id(input_dto.project_id)
             if project is None:
                 raise BusinessRuleViolation("Project not found", code="project_not_found")
@@ -1,6 +1,7 @@
 """UC-063: View Schedule History use case."""
-from typing import List, Tuple
+from typing import Optional, Tuple
 
+from app.application.dtos.pagination import DEFAULT_PAGE_SIZE, Cursor, Page
 from app.application.dtos.schedule_dtos import (
     ProjectScheduleHistoryOutput,
     TaskScheduleHistoryOutput,
@@ -19,19 +20,24 @@ class ViewScheduleHistoryUseCase:
         self,
         project_id: ProjectId | None = None,
         task_id: TaskId | None = None,
-    ) -> Tuple[List[ProjectScheduleHistoryOutput], List[TaskScheduleHistoryOutput]]:
-        """View schedule history for a project or task."""
+        limit: int = DEFAULT_PAGE_SIZE,
+        project_after: Optional[Cursor] = None,
+        task_after: Optional[Cursor] = None,
+    ) -> Tuple[Page[ProjectScheduleHistoryOutput], Page[TaskScheduleHistoryOutput]]:
+        """View one page of schedule history for a project and/or a task."""
         with self.uow:
-            project_history = []
-            task_history = []
+            project_history: Page[ProjectScheduleHistoryOutput] = Page([])
+            task_history: Page[TaskScheduleHistoryOutput] = Page([])
             if project_id is not None:
-                project_history = [
-                    ProjectScheduleHistoryOutput.from_domain(item)
-                    for item in self.uow.schedule_history.list_project_history(project_id)
-                ]
+                page = self.uow.schedule_history.page_project_history(project_id, limit, project_after)
+                project_history = Page(
+                    [ProjectScheduleHistoryOutput.from_domain(item) for item in page.items],
+                    page.next_cursor,
+                )
             if task_id is not None:
-                task_history = [
-                    TaskScheduleHistoryOutput.from_domain(item)
-                    for item in self.uow.schedule_history.list_task_history(task_id)
-                ]
+                page = self.uow.schedule_history.page_task_history(task_id, limit, task_after)
+                task_history = Page(
+                    [TaskScheduleHistoryOutput.from_domain(item) for item in page.items],
+                    page.next_cursor,
+                )
             return project_history, task_history
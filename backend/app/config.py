@@ -7,8 +7,27 @@ class Settings:
 
     def __init__(self) -> None:
         self.database_url = os.getenv("DATABASE_URL", "sqlite:///./planner.db")
+        self.database_replica_urls = [
+            url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+        ]
+        self.read_your_writes_seconds = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+        self.replica_retry_seconds = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.db_pool_pre_ping = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        self.debug_endpoints = os.getenv("DEBUG_ENDPOINTS", "false").lower() == "true"
+        self.sqlite_profile = os.getenv("SQLITE_PROFILE", "production")
+        self.sqlite_busy_timeout_ms = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+        self.db_storage_mode = os.getenv("DB_STORAGE_MODE", "text")
         self.jwt_secret = os.getenv("JWT_SECRET", "dev-secret")
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        self.jwt_cache_size = int(os.getenv("JWT_CACHE_SIZE", "1024"))
+        self.user_cache_ttl_seconds = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+        self.user_cache_size = int(os.getenv("USER_CACHE_SIZE", "10000"))
+        self.project_access_ttl_seconds = float(os.getenv("PROJECT_ACCESS_TTL_SECONDS", "300"))
+        self.project_lock_timeout_seconds = float(os.getenv("PROJECT_LOCK_TIMEOUT_SECONDS", "10"))
         self.llm_api_url = os.getenv("LLM_API_URL")
         self.llm_api_key = os.getenv("LLM_API_KEY")
 
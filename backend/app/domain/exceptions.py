@@ -7,3 +7,11 @@ class BusinessRuleViolation(ValueError):
     def __init__(self, message: str, code: str = "business_rule_violation"):
         super().__init__(message)
         self.code = code
+
+
+class ConcurrencyConflict(RuntimeError):
+    """Raised when an entity changed since it was read, so a write would overwrite it."""
+
+    def __init__(self, message: str, code: str = "concurrency_conflict"):
+        super().__init__(message)
+        self.code = code
@@ -70,3 +70,10 @@ class ScheduleChangeReason(str, Enum):
 class DependencyType(str, Enum):
     """Task dependency type - MVP only supports finish_to_start."""
     FINISH_TO_START = "finish_to_start"
+
+
+class ChangeEntity(str, Enum):
+    """Kind of row recorded in a project's change log."""
+    TASK = "task"
+    MEMBER = "member"
+    DEPENDENCY = "dependency"
@@ -7,7 +7,7 @@ from app.domain.exceptions import BusinessRuleViolation
 from app.domain.models.value_objects import InviteToken, MagicLinkId, UserId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class MagicLink:
     """Magic link for authentication."""
     id: MagicLinkId
@@ -9,7 +9,7 @@ from app.domain.models.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationPreference:
     """Notification preferences for a user within a project."""
     id: NotificationPreferenceId
@@ -6,7 +6,7 @@ from app.domain.models.value_objects import ProjectId, UserId, UtcDateTime
 from app.domain.models.enums import ProjectStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project entity - created by user who becomes Manager.
 
@@ -27,6 +27,7 @@ class Project:
     llm_api_key_encrypted: Optional[str] = None  # BR-LLM-002: encrypted
 
     created_at: UtcDateTime = field(default_factory=UtcDateTime.now)
+    version: int = 0  # Persisted row version this entity was read at
 
     @classmethod
     def create(
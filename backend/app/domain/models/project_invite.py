@@ -8,7 +8,7 @@ from app.domain.models.value_objects import InviteToken, ProjectId, ProjectInvit
 from app.domain.exceptions import BusinessRuleViolation
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectInvite:
     """Invitation to join a project."""
     id: ProjectInviteId
@@ -5,7 +5,7 @@ from app.domain.models.enums import MemberLevel
 from app.domain.models.value_objects import ProjectId, ProjectMemberId, UserId, RoleId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMember:
     """User membership within a project."""
     id: ProjectMemberId
@@ -9,7 +9,7 @@ from app.domain.models.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectScheduleHistory:
     """Audit record for project schedule changes."""
     id: ProjectScheduleHistoryId
@@ -0,0 +1,44 @@
+"""ProjectSummary domain model."""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from app.domain.models.enums import TaskStatus
+from app.domain.models.task import Task
+from app.domain.models.value_objects import ProjectId, UtcDateTime
+from app.domain.services.schedule_calculator import detect_delay
+
+
+def _zero_counts() -> Dict[TaskStatus, int]:
+    return {status: 0 for status in TaskStatus}
+
+
+@dataclass(slots=True)
+class ProjectSummary:
+    """Task aggregates of a project, maintained as its tasks change."""
+    project_id: ProjectId
+    status_counts: Dict[TaskStatus, int] = field(default_factory=_zero_counts)
+    total_difficulty: int = 0
+    doing_difficulty: int = 0
+    delayed_count: int = 0
+    latest_expected_end: Optional[UtcDateTime] = None
+
+    @property
+    def task_count(self) -> int:
+        return sum(self.status_counts.values())
+
+    def add(self, task: Task, sign: int = 1) -> None:
+        """Count ``task`` in (``sign=1``) or out of (``sign=-1``) the aggregates.
+
+        ``latest_expected_end`` only ever moves forward here: a maximum cannot
+        be decremented, so removing the latest task needs a recomputation.
+        """
+        difficulty = task.difficulty or 0
+        self.status_counts[task.status] += sign
+        self.total_difficulty += sign * difficulty
+        if task.status == TaskStatus.DOING:
+            self.doing_difficulty += sign * difficulty
+        if detect_delay(task):
+            self.delayed_count += sign
+        if sign > 0 and task.expected_end_date is not None:
+            if self.latest_expected_end is None or task.expected_end_date > self.latest_expected_end:
+                self.latest_expected_end = task.expected_end_date
@@ -5,7 +5,7 @@ from typing import Optional
 from app.domain.models.value_objects import ProjectId, RoleId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Role within a project."""
     id: RoleId
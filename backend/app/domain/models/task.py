@@ -16,7 +16,7 @@ VALID_TRANSITIONS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task entity."""
     id: TaskId
@@ -32,6 +32,7 @@ class Task:
     actual_start_date: Optional[UtcDateTime]
     actual_end_date: Optional[UtcDateTime]
     created_at: UtcDateTime = field(default_factory=UtcDateTime.now)
+    version: int = 0  # Persisted row version this entity was read at
 
     @classmethod
     def create(
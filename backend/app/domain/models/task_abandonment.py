@@ -6,7 +6,7 @@ from app.domain.models.enums import AbandonmentType
 from app.domain.models.value_objects import TaskAbandonmentId, TaskId, UserId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskAbandonment:
     """Record of a task abandonment."""
     id: TaskAbandonmentId
@@ -10,7 +10,7 @@ from app.domain.models.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskAssignmentHistory:
     """Audit record for task assignments."""
     id: TaskAssignmentHistoryId
@@ -5,7 +5,7 @@ from app.domain.models.enums import DependencyType
 from app.domain.models.value_objects import TaskId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDependency:
     """Dependency between tasks."""
     task_id: TaskId
@@ -6,7 +6,7 @@ from app.domain.models.enums import ProgressSource
 from app.domain.models.value_objects import TaskId, TaskReportId, UserId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskReport:
     """Progress report for a task."""
     id: TaskReportId
@@ -9,7 +9,7 @@ from app.domain.models.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskScheduleHistory:
     """Audit record for task schedule changes."""
     id: TaskScheduleHistoryId
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from app.domain.models.value_objects import UserId, UtcDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity - registered via magic link."""
     id: UserId
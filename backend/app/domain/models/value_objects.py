@@ -4,11 +4,32 @@ Per architecture_guide.md v2.1: Use Value Objects instead of raw primitives.
 """
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from uuid import UUID, uuid4
 
+V = TypeVar("V", bound=type)
 
-@dataclass(frozen=True)
+
+def trusted_constructor(cls: V) -> V:
+    """Add ``cls.trusted(value)``, which builds an instance without ``__init__``.
+
+    For repository hydration only: the value is stored as given, so it must
+    already be valid (a ``UUID``, or an aware UTC ``datetime``).
+    """
+    new = object.__new__
+    set_value: Callable[[Any, Any], None] = cls.__dict__["value"].__set__
+
+    def trusted(value: Any) -> Any:
+        instance = new(cls)
+        set_value(instance, value)
+        return instance
+
+    cls.trusted = staticmethod(trusted)  # type: ignore[attr-defined]
+    return cls
+
+
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class UserId:
     """User identifier value object."""
     value: UUID
@@ -23,7 +44,8 @@ class UserId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class ProjectId:
     """Project identifier value object."""
     value: UUID
@@ -38,7 +60,8 @@ class ProjectId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class RoleId:
     """Role identifier value object."""
     value: UUID
@@ -53,7 +76,8 @@ class RoleId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class TaskId:
     """Task identifier value object."""
     value: UUID
@@ -68,7 +92,8 @@ class TaskId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class ProjectMemberId:
     """ProjectMember identifier value object."""
     value: UUID
@@ -83,7 +108,8 @@ class ProjectMemberId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class ProjectInviteId:
     """Project invite identifier value object."""
     value: UUID
@@ -98,7 +124,8 @@ class ProjectInviteId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class TaskReportId:
     """Task report identifier value object."""
     value: UUID
@@ -113,7 +140,8 @@ class TaskReportId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class TaskAbandonmentId:
     """Task abandonment identifier value object."""
     value: UUID
@@ -128,7 +156,8 @@ class TaskAbandonmentId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class TaskAssignmentHistoryId:
     """Task assignment history identifier value object."""
     value: UUID
@@ -143,7 +172,8 @@ class TaskAssignmentHistoryId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class TaskScheduleHistoryId:
     """Task schedule history identifier value object."""
     value: UUID
@@ -158,7 +188,8 @@ class TaskScheduleHistoryId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class ProjectScheduleHistoryId:
     """Project schedule history identifier value object."""
     value: UUID
@@ -173,7 +204,8 @@ class ProjectScheduleHistoryId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class NotificationPreferenceId:
     """Notification preference identifier value object."""
     value: UUID
@@ -188,7 +220,8 @@ class NotificationPreferenceId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class MagicLinkId:
     """Magic link identifier value object."""
     value: UUID
@@ -203,7 +236,7 @@ class MagicLinkId:
         return hash(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InviteToken:
     """Invite token value object."""
     value: str
@@ -212,7 +245,8 @@ class InviteToken:
         return self.value
 
 
-@dataclass(frozen=True)
+@trusted_constructor
+@dataclass(frozen=True, slots=True)
 class UtcDateTime:
     """Always-UTC datetime value object.
 
@@ -229,7 +263,7 @@ class UtcDateTime:
 
     @staticmethod
     def now() -> "UtcDateTime":
-        return UtcDateTime(datetime.now(timezone.utc))
+        return UtcDateTime.trusted(datetime.now(timezone.utc))
 
     def __str__(self) -> str:
         return self.value.isoformat()
@@ -1,5 +1,6 @@
 """Dependency validation per BR-DEP."""
-from typing import Dict, List, Set
+from collections import deque
+from typing import Deque, Dict, List, Set
 
 from app.domain.models.value_objects import TaskId
 
@@ -34,3 +35,29 @@ def detect_cycle(
             stack.append(dep_id)
 
     return False
+
+
+def has_cycle(dependencies: Dict[TaskId, List[TaskId]]) -> bool:  # task_id -> [depends_on_ids]
+    """
+    Check a whole dependency graph for cycles at once (BR-DEP-002).
+
+    Uses Kahn's algorithm: tasks are peeled off as their dependents run out,
+    and any task left over is part of a cycle. Linear in tasks plus edges.
+    """
+    dependents: Dict[TaskId, int] = {}
+    for task_id, depends_on_ids in dependencies.items():
+        dependents.setdefault(task_id, 0)
+        for depends_on_id in depends_on_ids:
+            dependents[depends_on_id] = dependents.get(depends_on_id, 0) + 1
+
+    ready: Deque[TaskId] = deque(task_id for task_id, count in dependents.items() if count == 0)
+    removed = 0
+    while ready:
+        current = ready.popleft()
+        removed += 1
+        for depends_on_id in dependencies.get(current, []):
+            dependents[depends_on_id] -= 1
+            if dependents[depends_on_id] == 0:
+                ready.append(depends_on_id)
+
+    return removed < len(dependents)
@@ -50,13 +50,12 @@ def calculate_workload_status(
 
 
 def would_be_impossible(
-    current_tasks: List[Task],
+    current_score: int,
     new_task: Task,
     base_capacity: int,
     level: MemberLevel,
 ) -> bool:
-    """Check if adding new_task would result in IMPOSSIBLE status (BR-ASSIGN-003)."""
-    current_score = calculate_workload_score(current_tasks)
+    """Check if adding new_task to a workload of current_score would result in IMPOSSIBLE status (BR-ASSIGN-003)."""
     new_score = current_score + (new_task.difficulty or 0)
     capacity = calculate_capacity(base_capacity, level)
     status = calculate_workload_status(new_score, capacity)
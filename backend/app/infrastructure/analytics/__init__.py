@@ -0,0 +1 @@
+"""Analytics export infrastructure package."""
@@ -0,0 +1,251 @@
+"""Export the planning tables to Parquet for analytics.
+
+Usage::
+
+    python -m app.infrastructure.analytics.parquet_export \\
+        sqlite:///./planner.db ./analytics [--incremental]
+
+Each table is written to ``<output>/<table>/part-NNNNN.parquet`` in record
+batches read from a streaming cursor, so memory is bounded by the batch size.
+The directory layout is a Parquet dataset that pyarrow, DuckDB or Spark can
+read as one table.
+
+With ``--incremental`` only rows whose key column (``created_at``, or the
+join/assignment time where there is none) is at or past the previous run's
+high-water mark are exported, into a new part file. Rows committed after a
+run can share the mark's timestamp, so the primary keys already exported at
+the mark are kept alongside it in ``<output>/_watermarks.json`` and skipped
+by the next run. History tables are append-only, so their
+increments are exact. Rows of ``projects``, ``project_members`` and ``tasks``
+change after creation: increments only add new rows, and a full export
+refreshes them.
+
+Needs the ``analytics`` extra (``pip install 'planner-backend[analytics]'``).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean, Column, Integer, Table, select
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.types import GUID, STORAGE_MODES, EnumCode, Timestamp
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover - depends on the installed extras
+    raise ImportError(
+        "The analytics export needs pyarrow: pip install 'planner-backend[analytics]'"
+    ) from exc
+
+# Exported tables and the column incremental exports are keyed by.
+EXPORT_TABLES: Dict[str, str] = {
+    "projects": "created_at",
+    "project_members": "joined_at",
+    "tasks": "created_at",
+    "task_dependencies": "created_at",
+    "task_reports": "created_at",
+    "task_abandonments": "created_at",
+    "task_assignment_history": "assigned_at",
+    "task_schedule_history": "created_at",
+    "project_schedule_history": "created_at",
+}
+WATERMARKS_FILE = "_watermarks.json"
+
+# A row's primary key, as strings, in primary key column order.
+RowKey = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class TableExport:
+    """Outcome of exporting one table."""
+    table: str
+    rows: int
+    bytes: int
+    seconds: float
+    watermark: Optional[datetime]
+    watermark_keys: FrozenSet[RowKey] = frozenset()
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _arrow_type(column: Column[Any]) -> pa.DataType:
+    if isinstance(column.type, Timestamp):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, EnumCode):
+        return pa.dictionary(pa.int8(), pa.string())
+    return pa.string()
+
+
+def _converter(column: Column[Any]) -> Callable[[Sequence[Any]], List[Any]]:
+    if isinstance(column.type, GUID):
+        return lambda values: [None if value is None else str(value) for value in values]
+    if isinstance(column.type, EnumCode):
+        return lambda values: [value.value if isinstance(value, Enum) else value for value in values]
+    return list
+
+
+def export_table(
+    engine: Engine,
+    table: Table,
+    directory: Path,
+    key: str,
+    since: Optional[datetime] = None,
+    batch_size: int = 50_000,
+    compression: str = "zstd",
+    exported: FrozenSet[RowKey] = frozenset(),
+) -> TableExport:
+    """Write the rows of ``table`` from ``since`` on to a new part file.
+
+    Rows stamped exactly ``since`` whose primary key is in ``exported`` were
+    written by the previous run and are skipped.
+    """
+    start = time.perf_counter()
+    schema = pa.schema([pa.field(column.name, _arrow_type(column), column.nullable) for column in table.c])
+    converters = [(_converter(column), field.type) for column, field in zip(table.c, schema)]
+    names = list(table.c.keys())
+    key_index = names.index(key)
+    primary_key = [names.index(column.name) for column in table.primary_key]
+    stmt = select(table)
+    if since is not None:
+        stmt = stmt.where(table.c[key] >= since)
+
+    def row_key(row: Any) -> RowKey:
+        return tuple(str(row[index]) for index in primary_key)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"part-{len(list(directory.glob('part-*.parquet'))):05d}.parquet"
+    rows = 0
+    watermark = since
+    watermark_keys = set(exported)
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        with engine.connect() as connection:
+            result = connection.execution_options(yield_per=batch_size).execute(stmt)
+            for partition in result.partitions():
+                if exported:
+                    partition = [
+                        row for row in partition
+                        if row[key_index] != since or row_key(row) not in exported
+                    ]
+                    if not partition:
+                        continue
+                columns = [
+                    pa.array(convert(values), type=arrow_type)
+                    for (convert, arrow_type), values in zip(converters, zip(*partition))
+                ]
+                batch = pa.RecordBatch.from_arrays(columns, schema=schema)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, schema, compression=compression)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+                batch_max = pc.max(columns[key_index]).as_py()
+                if watermark is None or batch_max > watermark:
+                    watermark = batch_max
+                    watermark_keys = set()
+                if batch_max == watermark:
+                    watermark_keys.update(row_key(row) for row in partition if row[key_index] == watermark)
+    finally:
+        if writer is not None:
+            writer.close()
+    return TableExport(
+        table=table.name,
+        rows=rows,
+        bytes=path.stat().st_size if writer is not None else 0,
+        seconds=time.perf_counter() - start,
+        watermark=watermark,
+        watermark_keys=frozenset(watermark_keys),
+    )
+
+
+def export_analytics(
+    engine: Engine,
+    output: Path,
+    incremental: bool = False,
+    tables: Sequence[str] = tuple(EXPORT_TABLES),
+    batch_size: int = 50_000,
+    compression: str = "zstd",
+    progress: Optional[Callable[[TableExport], None]] = None,
+) -> List[TableExport]:
+    """Export ``tables`` under ``output``; return per-table statistics.
+
+    A full export replaces the table's part files; an incremental one adds a
+    part with the rows not exported up to the stored watermark.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    watermarks_path = output / WATERMARKS_FILE
+    watermarks: Dict[str, Dict[str, Any]] = (
+        json.loads(watermarks_path.read_text()) if watermarks_path.exists() else {}
+    )
+    exports = []
+    for name in tables:
+        directory = output / name
+        since = None
+        exported: FrozenSet[RowKey] = frozenset()
+        if incremental and name in watermarks:
+            since = datetime.fromisoformat(watermarks[name]["at"])
+            exported = frozenset(tuple(row_key) for row_key in watermarks[name]["keys"])
+        elif directory.exists():
+            for part in directory.glob("part-*.parquet"):
+                part.unlink()
+        table = Base.metadata.tables[name]
+        export = export_table(
+            engine, table, directory, EXPORT_TABLES[name], since, batch_size, compression, exported
+        )
+        if export.watermark is not None:
+            watermarks[name] = {
+                "at": export.watermark.isoformat(),
+                "keys": sorted(list(row_key) for row_key in export.watermark_keys),
+            }
+        exports.append(export)
+        if progress is not None:
+            progress(export)
+    watermarks_path.write_text(json.dumps(watermarks, indent=2, sort_keys=True))
+    return exports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("database_url")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--tables", nargs="+", choices=list(EXPORT_TABLES), default=list(EXPORT_TABLES))
+    parser.add_argument("--storage-mode", choices=STORAGE_MODES, default="text")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--compression", choices=["zstd", "snappy", "gzip", "none"], default="zstd")
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.database_url, storage_mode=args.storage_mode)
+    export_analytics(
+        engine,
+        args.output,
+        incremental=args.incremental,
+        tables=args.tables,
+        batch_size=args.batch_size,
+        compression=args.compression,
+        progress=lambda export: print(
+            f"{export.table}: {export.rows} rows, {export.bytes} bytes, "
+            f"{export.seconds:.2f}s ({export.rows_per_second:,.0f} rows/s)"
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,34 +5,59 @@ from typing import Any, Dict
 
 from app.domain.exceptions import BusinessRuleViolation
 from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.auth.token_cache import VerifiedTokenCache
+
+try:
+    from authlib.jose import JoseError, JsonWebKey, OctKey, jwt
+except ModuleNotFoundError:  # authlib is optional until a token is handled
+    jwt = None
 
 
 class JwtService:
     """JWT creation/validation service."""
 
-    def __init__(self, secret: str, algorithm: str = "HS256"):
+    def __init__(self, secret: str, algorithm: str = "HS256", cache_size: int = 1024):
         self.secret = secret
         self.algorithm = algorithm
+        self.cache = VerifiedTokenCache(max_size=cache_size)
+        self._key = self._load_key(secret, algorithm)
+
+    @staticmethod
+    def _load_key(secret: str, algorithm: str) -> Any:
+        """Import the signing key once instead of on every encode/decode."""
+        if jwt is None:
+            return None
+        if algorithm.startswith("HS"):
+            return OctKey.import_key(secret)
+        return JsonWebKey.import_key(secret)
+
+    def _require_authlib(self) -> None:
+        if jwt is None:
+            raise BusinessRuleViolation("authlib is not installed", code="authlib_missing")
 
     def create_token(self, subject: str, expires_at: UtcDateTime) -> str:
         """Create a JWT token."""
-        try:
-            from authlib.jose import jwt
-        except ModuleNotFoundError as exc:
-            raise BusinessRuleViolation("authlib is not installed", code="authlib_missing") from exc
+        self._require_authlib()
         header = {"alg": self.algorithm}
         payload = {"sub": subject, "exp": int(expires_at.value.timestamp())}
-        token = jwt.encode(header, payload, self.secret)
+        token = jwt.encode(header, payload, self._key)
         return token.decode("utf-8") if isinstance(token, bytes) else str(token)
 
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify a JWT token and return claims."""
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
+        claims = self._decode(token)
+        self.cache.put(token, claims)
+        return claims
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """Decode and validate a token without consulting the cache."""
+        self._require_authlib()
         try:
-            from authlib.jose import JoseError, jwt
-            claims = jwt.decode(token, self.secret)
+            claims = jwt.decode(token, self._key)
             claims.validate()
             return dict(claims)
         except JoseError as exc:
             raise BusinessRuleViolation("Invalid token", code="invalid_token") from exc
-        except ModuleNotFoundError as exc:
-            raise BusinessRuleViolation("authlib is not installed", code="authlib_missing") from exc
@@ -0,0 +1,72 @@
+"""Cached index of per-user project permissions."""
+from __future__ import annotations
+
+from threading import Lock
+from typing import Dict, FrozenSet, Optional
+
+from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.models.value_objects import ProjectId, TaskId, UserId
+from app.infrastructure.cache.ttl_cache import TtlCache
+
+
+class ProjectAccessIndex:
+    """Per-user index of managed projects (BR-PROJ-002).
+
+    Managed project sets are cached per user and stamped with a version
+    counter. ``revoke`` bumps the counter so a load that raced with the
+    revocation is discarded instead of caching stale grants. Task to project
+    lookups are cached too, since a task never moves between projects.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_users: int = 10000,
+        max_tasks: int = 100000,
+    ):
+        self._managed: TtlCache[UserId, FrozenSet[ProjectId]] = TtlCache(ttl_seconds, max_users)
+        self._task_projects: TtlCache[TaskId, ProjectId] = TtlCache(ttl_seconds * 12, max_tasks)
+        self._versions: Dict[UserId, int] = {}
+        self._lock = Lock()
+
+    def version(self, user_id: UserId) -> int:
+        """Return the current revocation counter for a user."""
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def managed_projects(self, uow: UnitOfWork, user_id: UserId) -> FrozenSet[ProjectId]:
+        """Return IDs of projects the user manages, loading them on a miss."""
+        cached = self._managed.get(user_id)
+        if cached is not None:
+            return cached
+        version = self.version(user_id)
+        with uow:
+            managed = frozenset(uow.projects.list_ids_by_created_by(user_id))
+        with self._lock:
+            if self._versions.get(user_id, 0) == version:
+                self._managed.put(user_id, managed)
+        return managed
+
+    def project_for_task(self, uow: UnitOfWork, task_id: TaskId) -> Optional[ProjectId]:
+        """Return the project a task belongs to, or None if it does not exist."""
+        cached = self._task_projects.get(task_id)
+        if cached is not None:
+            return cached
+        with uow:
+            project_id = uow.tasks.find_project_id(task_id)
+        if project_id is not None:
+            self._task_projects.put(task_id, project_id)
+        return project_id
+
+    def revoke(self, user_id: UserId) -> None:
+        """Invalidate a user's cached permissions."""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._managed.invalidate(user_id)
+
+    def clear(self) -> None:
+        """Drop all cached permissions."""
+        with self._lock:
+            self._versions.clear()
+            self._managed.clear()
+            self._task_projects.clear()
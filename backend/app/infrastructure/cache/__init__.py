@@ -0,0 +1 @@
+"""In-process cache infrastructure package."""
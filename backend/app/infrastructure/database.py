@@ -1,9 +1,29 @@
 """Database setup for SQLite."""
 import os
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.engine import URL, Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction, sessionmaker
+
+from app.infrastructure.persistence.types import set_storage_mode
+from app.infrastructure.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, PoolSettings
+from app.infrastructure.sqlite_profile import (
+    SqliteProfile,
+    apply_sqlite_profile,
+    is_sqlite_file,
+    use_immediate_transactions,
+)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
 
 def get_database_url() -> str:
@@ -11,13 +31,306 @@ def get_database_url() -> str:
     return os.getenv("DATABASE_URL", "sqlite:///./planner.db")
 
 
-def create_db_engine(database_url: str | None = None) -> Engine:
-    """Create SQLAlchemy engine."""
-    url = database_url or get_database_url()
-    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
-    return create_engine(url, future=True, connect_args=connect_args)
+def create_db_engine(
+    database_url: str | URL | None = None,
+    pool: PoolSettings | None = None,
+    sqlite_profile: SqliteProfile | None = None,
+    writer: bool = False,
+    storage_mode: str = "text",
+) -> Engine:
+    """Create SQLAlchemy engine.
+
+    Databases served through a queue pool get an ``InstrumentedQueuePool``
+    sized by ``pool``; in-memory SQLite keeps SQLAlchemy's default pool.
+    SQLite files get ``sqlite_profile`` pragmas, and a ``writer`` engine has a
+    single connection whose transactions begin with ``BEGIN IMMEDIATE``, so
+    concurrent writers queue for it instead of failing on the database lock.
+    ``storage_mode`` selects the column encoding (see ``persistence.types``).
+    """
+    url = make_url(database_url or get_database_url())
+    connect_args = {"check_same_thread": False} if url.get_backend_name() == "sqlite" else {}
+    options = _pool_options(url, pool or PoolSettings(), InstrumentedQueuePool, sqlite_profile, writer)
+    engine = create_engine(url, future=True, connect_args=connect_args, **options)
+    set_storage_mode(engine, storage_mode)
+    _configure_sqlite(engine, url, sqlite_profile, writer)
+    return engine
+
+
+def create_async_db_engine(
+    database_url: str | URL | None = None,
+    pool: PoolSettings | None = None,
+    sqlite_profile: SqliteProfile | None = None,
+    writer: bool = False,
+    storage_mode: str = "text",
+) -> AsyncEngine:
+    """Create an async engine for the same database as ``create_db_engine``.
+
+    The driver is swapped for its asyncio counterpart (aiosqlite, asyncpg).
+    """
+    url = make_url(database_url or get_database_url())
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    url = url.set(drivername=ASYNC_DRIVERS[backend])
+    options = _pool_options(url, pool or PoolSettings(), InstrumentedAsyncAdaptedQueuePool, sqlite_profile, writer)
+    engine = create_async_engine(url, **options)
+    set_storage_mode(engine.sync_engine, storage_mode)
+    _configure_sqlite(engine.sync_engine, url, sqlite_profile, writer)
+    return engine
+
+
+def _pool_options(
+    url: URL,
+    pool: PoolSettings,
+    poolclass: type,
+    sqlite_profile: SqliteProfile | None,
+    writer: bool,
+) -> Dict[str, Any]:
+    if url.get_backend_name() == "sqlite" and not is_sqlite_file(url):
+        return {}
+    if writer and sqlite_profile is not None and is_sqlite_file(url):
+        pool = replace(pool, size=1, max_overflow=0)
+    return {"poolclass": poolclass, **pool.engine_options()}
+
+
+def _configure_sqlite(engine: Engine, url: URL, sqlite_profile: SqliteProfile | None, writer: bool) -> None:
+    if sqlite_profile is None or not is_sqlite_file(url):
+        return
+    apply_sqlite_profile(engine, sqlite_profile)
+    if writer:
+        use_immediate_transactions(engine)
+
+
+def create_async_session_factory(engine: AsyncEngine, read_only: bool = False) -> async_sessionmaker[AsyncSession]:
+    """Create an async session factory; see ``create_session_factory``."""
+    session_class = type("AsyncSyncSession", (Session,), {})
+    if read_only:
+        event.listen(session_class, "after_begin", _begin_read_only)
+        if engine.dialect.name == "sqlite" and not event.contains(engine.sync_engine.pool, "checkin", _reset_query_only):
+            event.listen(engine.sync_engine.pool, "checkin", _reset_query_only)
+    else:
+        _mark_writes(session_class)
+    return async_sessionmaker(engine, expire_on_commit=False, sync_session_class=session_class)
+
+
+def create_db_router(
+    database_url: str | None = None,
+    replica_urls: Sequence[str] = (),
+    read_your_writes_seconds: float = 5.0,
+    retry_seconds: float = 30.0,
+    pool: PoolSettings | None = None,
+    sqlite_profile: SqliteProfile | None = None,
+    storage_mode: str = "text",
+) -> "DatabaseRouter":
+    """Create a router over a primary database and its read replicas.
+
+    With ``sqlite_profile`` a SQLite primary is split into a single-connection
+    writer engine and a pooled reader engine on the same file.
+    """
+    url = make_url(database_url or get_database_url())
+    primary_reader = None
+    if sqlite_profile is not None and is_sqlite_file(url):
+        primary = create_db_engine(url, pool, sqlite_profile, writer=True, storage_mode=storage_mode)
+        primary_reader = create_db_engine(url, pool, sqlite_profile, storage_mode=storage_mode)
+    else:
+        primary = create_db_engine(url, pool, storage_mode=storage_mode)
+    return DatabaseRouter(
+        primary,
+        [
+            create_db_engine(replica_url, pool, sqlite_profile, storage_mode=storage_mode)
+            for replica_url in replica_urls
+        ],
+        read_your_writes_seconds=read_your_writes_seconds,
+        retry_seconds=retry_seconds,
+        primary_reader=primary_reader,
+    )
+
+
+def create_session_factory(engine: Engine, read_only: bool = False) -> sessionmaker[Session]:
+    """Create a session factory.
+
+    With ``read_only`` every transaction is started as read-only, so writes
+    fail in the database instead of being silently discarded.
+    """
+    factory = sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+    _mark_writes(factory)
+    if read_only:
+        event.listen(factory, "after_begin", _begin_read_only)
+        if engine.dialect.name == "sqlite" and not event.contains(engine.pool, "checkin", _reset_query_only):
+            event.listen(engine.pool, "checkin", _reset_query_only)
+    return factory
+
+
+def _begin_read_only(_session: Session, _transaction: SessionTransaction, connection: Connection) -> None:
+    if connection.dialect.name == "sqlite":
+        # SQLite has no read-only transactions; query_only is per connection
+        # and is switched back off when the connection returns to the pool.
+        connection.exec_driver_sql("PRAGMA query_only = ON")
+        connection.info["query_only"] = True
+    else:
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def _reset_query_only(dbapi_connection, connection_record) -> None:
+    if connection_record is not None and connection_record.info.pop("query_only", False):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA query_only = OFF")
+        cursor.close()
+
+
+class DatabaseRouter:
+    """Routes read-only sessions to replicas and writes to the primary.
+
+    Replicas are picked round-robin. A replica whose connection fails is
+    skipped for ``retry_seconds`` and then probed with ``SELECT 1`` before it
+    is used again. Reads tagged with a key that committed a write in the last
+    ``read_your_writes_seconds`` stay on the primary, so a client sees its
+    own writes despite replication lag. Reads served by the primary use
+    ``primary_reader`` when given (a separate pool on the same database).
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine] = (),
+        read_your_writes_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+        max_sticky_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        primary_reader: Engine | None = None,
+    ):
+        self.primary = primary
+        self.primary_reader = primary_reader or primary
+        self.replicas: List[Engine] = list(replicas)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.retry_seconds = retry_seconds
+        self.max_sticky_keys = max_sticky_keys
+        self._clock = clock
+        self._lock = Lock()
+        self._cursor = 0
+        self._down_until: Dict[Engine, float] = {}
+        self._last_write: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.session_factory = create_session_factory(primary)
+        self._read_factories = {
+            engine: create_session_factory(engine, read_only=True)
+            for engine in (self.primary_reader, *self.replicas)
+        }
+        self.track_writes(self.session_factory)
+        for replica in self.replicas:
+            event.listen(replica, "handle_error", self._on_replica_error)
+
+    def track_writes(self, target: Any) -> None:
+        """Record commits made through ``target`` for read-your-writes.
+
+        ``target`` is a sessionmaker or a Session class; the sticky key is
+        read from ``session.info["sticky_key"]``.
+        """
+        _mark_writes(target)
+        event.listen(target, "after_commit", self._record_write)
+
+    def read_engine(self, sticky_key: Optional[Hashable] = None) -> Engine:
+        """Return the engine that should serve one read."""
+        if sticky_key is not None and self._wrote_recently(sticky_key):
+            return self.primary_reader
+        replica = self._next_replica()
+        return replica if replica is not None else self.primary_reader
+
+    def read_session_factory(self, sticky_key: Optional[Hashable] = None) -> sessionmaker[Session]:
+        """Return the read-only session factory to use for one read."""
+        return self._read_factories[self.read_engine(sticky_key)]
+
+    def check_health(self) -> Dict[Engine, bool]:
+        """Probe every replica now and return which ones are usable."""
+        return {replica: self._probe(replica) for replica in self.replicas}
+
+    def is_healthy(self, replica: Engine) -> bool:
+        """Return False while a replica is being skipped after a failure."""
+        return replica not in self._down_until
+
+    def _next_replica(self) -> Optional[Engine]:
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = self.replicas[self._cursor % len(self.replicas)]
+                self._cursor += 1
+                down_until = self._down_until.get(replica)
+            if down_until is None:
+                return replica
+            if down_until <= self._clock() and self._probe(replica):
+                return replica
+        return None
+
+    def _probe(self, replica: Engine) -> bool:
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception:
+            self._mark_down(replica)
+            return False
+        with self._lock:
+            self._down_until.pop(replica, None)
+        return True
+
+    def _mark_down(self, replica: Engine) -> None:
+        with self._lock:
+            self._down_until[replica] = self._clock() + self.retry_seconds
+
+    def _on_replica_error(self, context) -> None:
+        if context.is_disconnect or context.connection is None:
+            self._mark_down(context.engine)
+
+    def _wrote_recently(self, key: Hashable) -> bool:
+        with self._lock:
+            written_at = self._last_write.get(key)
+        return written_at is not None and self._clock() - written_at < self.read_your_writes_seconds
+
+    def _record_write(self, session: Session) -> None:
+        key = session.info.get("sticky_key")
+        if not session.info.pop("wrote", False) or key is None or self.read_your_writes_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._last_write[key] = now
+            self._last_write.move_to_end(key)
+            while self._last_write and (
+                len(self._last_write) > self.max_sticky_keys
+                or now - next(iter(self._last_write.values())) >= self.read_your_writes_seconds
+            ):
+                self._last_write.popitem(last=False)
+
+
+def mark_written(session: Session) -> None:
+    """Record that the session's current transaction wrote to the database.
+
+    Flushes and ORM ``insert``/``update``/``delete`` statements are recorded
+    by listeners; Core statements run on ``session.connection()`` bypass the
+    session, so the code issuing them calls this.
+    """
+    session.info["wrote"] = True
+
+
+def has_written(session: Session) -> bool:
+    """Return True if the session's current transaction wrote or has pending changes."""
+    return bool(session.info.get("wrote") or session.new or session.dirty or session.deleted)
+
+
+def _mark_writes(target: Any) -> None:
+    for name, listener in (
+        ("after_flush", _mark_written),
+        ("do_orm_execute", _mark_dml_written),
+        ("after_rollback", _clear_written),
+    ):
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
+
+
+def _mark_written(session: Session, _flush_context) -> None:
+    mark_written(session)
+
+
+def _mark_dml_written(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        mark_written(state.session)
 
 
-def create_session_factory(engine: Engine) -> sessionmaker[Session]:
-    """Create a session factory."""
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+def _clear_written(session: Session) -> None:
+    session.info.pop("wrote", None)
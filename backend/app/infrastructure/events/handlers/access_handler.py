@@ -0,0 +1,15 @@
+"""Project access index event handlers."""
+from __future__ import annotations
+
+from app.application.events.domain_events import ProjectCreated
+from app.infrastructure.auth.project_access import ProjectAccessIndex
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+
+
+def register_access_handlers(event_bus: InMemoryEventBus, index: ProjectAccessIndex) -> None:
+    """Keep the project access index in sync with membership changes."""
+
+    def on_project_created(event: ProjectCreated) -> None:
+        index.revoke(event.created_by)
+
+    event_bus.register(ProjectCreated, on_project_created)
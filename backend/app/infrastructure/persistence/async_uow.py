@@ -0,0 +1,177 @@
+"""Async Unit of Work implementation."""
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.application.ports.email_service import EmailService
+from app.application.ports.event_bus import EventBus
+from app.application.ports.llm_service import LlmService
+from app.application.ports.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from app.domain.models.user import User
+from app.domain.models.value_objects import UserId
+from app.infrastructure.cache.ttl_cache import TtlCache
+from app.infrastructure.database import has_written
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+T = TypeVar("T")
+
+
+class AsyncRepositoryAdapter:
+    """Awaitable view of one of the synchronous repositories.
+
+    Each method call runs the synchronous repository on the async session's
+    ``sync_session`` through ``AsyncSession.run_sync``, so queries use the
+    async driver without duplicating the repository code.
+    """
+
+    def __init__(self, uow: "AsyncSqlAlchemyUnitOfWork", name: str):
+        self._uow = uow
+        self._name = name
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._uow.run(
+                lambda uow: getattr(getattr(uow, self._name), method)(*args, **kwargs)
+            )
+
+        call.__name__ = method
+        return call
+
+
+class _AsyncRepository:
+    """Builds an ``AsyncRepositoryAdapter`` on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, uow: "AsyncSqlAlchemyUnitOfWork | None", owner: type | None = None) -> Any:
+        if uow is None:
+            return self
+        adapter = AsyncRepositoryAdapter(uow, self.name)
+        uow.__dict__[self.name] = adapter
+        return adapter
+
+
+class _BoundSessionUnitOfWork(SqlAlchemyUnitOfWork):
+    """Synchronous view of an async unit of work's current session."""
+
+    def __init__(self, owner: "AsyncSqlAlchemyUnitOfWork", session: Session):
+        super().__init__(
+            session_factory=lambda: session,
+            event_bus=owner.event_bus,
+            email_service=owner.email_service,
+            llm_service=owner.llm_service,
+            user_cache=owner.user_cache,
+            request_scoped=True,
+        )
+        self.session = session
+
+
+class AsyncSqlAlchemyUnitOfWork(AsyncUnitOfWork):
+    """SQLAlchemy-backed async Unit of Work.
+
+    Scoping mirrors ``SqlAlchemyUnitOfWork``: nested blocks join the outermost
+    one, and a ``request_scoped`` unit of work only commits on an explicit
+    ``commit()`` and ends with ``close()``. A block that wrote nothing ends
+    its transaction on exit, releasing the connection.
+    """
+
+    users = _AsyncRepository()
+    projects = _AsyncRepository()
+    project_members = _AsyncRepository()
+    roles = _AsyncRepository()
+    project_invites = _AsyncRepository()
+    tasks = _AsyncRepository()
+    task_dependencies = _AsyncRepository()
+    task_reports = _AsyncRepository()
+    task_abandonments = _AsyncRepository()
+    task_assignment_history = _AsyncRepository()
+    schedule_history = _AsyncRepository()
+    notification_preferences = _AsyncRepository()
+    magic_links = _AsyncRepository()
+    change_log = _AsyncRepository()
+    project_summaries = _AsyncRepository()
+    member_workloads = _AsyncRepository()
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        event_bus: EventBus,
+        email_service: EmailService,
+        llm_service: LlmService,
+        user_cache: TtlCache[UserId, User] | None = None,
+        request_scoped: bool = False,
+        session_info: dict[str, Any] | None = None,
+    ):
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+        self.email_service = email_service
+        self.llm_service = llm_service
+        self.user_cache = user_cache
+        self.request_scoped = request_scoped
+        self.session_info = session_info
+        self.session: AsyncSession | None = None
+        self._depth = 0
+
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        self._depth += 1
+        if self.session is None:
+            if self.session_info:
+                self.session = self.session_factory(info=dict(self.session_info))
+            else:
+                self.session = self.session_factory()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self.session is None or self._depth > 0:
+            return
+        if exc_type:
+            await self.session.rollback()
+        elif not self.request_scoped:
+            await self.session.commit()
+        elif not has_written(self.session.sync_session):
+            # As in SqlAlchemyUnitOfWork: a lookup such as the current user
+            # must not keep the single SQLite writer connection for the rest
+            # of the request.
+            await self.session.rollback()
+        if not self.request_scoped:
+            await self.close()
+
+    async def close(self) -> None:
+        """Close the session, discarding anything not committed."""
+        if self.session is None:
+            return
+        await self.session.close()
+        self.session = None
+
+    async def commit(self) -> None:
+        if self.session is None:
+            return
+        await self.session.commit()
+        self.session.info.pop("wrote", None)
+
+    async def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        """Run synchronous work (a use case) inside this unit of work."""
+        async with self:
+            return await self.session.run_sync(
+                lambda session: work(_BoundSessionUnitOfWork(self, session))
+            )
+
+
+class AsyncSqlAlchemyReadOnlyUnitOfWork(AsyncSqlAlchemyUnitOfWork):
+    """Async counterpart of ``SqlAlchemyReadOnlyUnitOfWork``."""
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self.session is None or self._depth > 0:
+            return
+        await self.session.rollback()
+        if not self.request_scoped:
+            await self.close()
+
+    async def commit(self) -> None:
+        """Read-only units of work never commit."""
@@ -0,0 +1,81 @@
+"""Copy a database into another storage mode.
+
+Usage::
+
+    python -m app.infrastructure.persistence.migrate_storage \\
+        sqlite:///./planner.db sqlite:///./planner-compact.db --to compact
+
+The target schema is created in the target mode and every table is copied in
+dependency order, in batches. Rows pass through the ORM column types, so the
+source is decoded and the target re-encoded without per-table code. Point
+``DATABASE_URL`` and ``DB_STORAGE_MODE`` at the target once it completes.
+
+The source may predate the current schema: tables it lacks are left empty,
+columns it lacks take their default, and the derived tables among the
+missing ones are then computed in the target, as ``upgrade_schema`` does.
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.types import STORAGE_MODES
+from app.infrastructure.persistence.upgrade_schema import backfill_derived_tables
+
+
+def migrate_storage(
+    source: Engine,
+    target: Engine,
+    batch_size: int = 1000,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """Copy every table from ``source`` to ``target``; return rows per table."""
+    Base.metadata.create_all(target)
+    inspector = inspect(source)
+    source_tables = set(inspector.get_table_names())
+    copied: Dict[str, int] = {}
+    with source.connect() as reader, target.begin() as writer:
+        for table in Base.metadata.sorted_tables:
+            count = 0
+            if table.name not in source_tables:
+                copied[table.name] = count
+                continue
+            names = {column["name"] for column in inspector.get_columns(table.name)}
+            stmt = select(*[column for column in table.c if column.name in names])
+            result = reader.execution_options(yield_per=batch_size).execute(stmt)
+            for rows in result.mappings().partitions():
+                writer.execute(insert(table), [dict(row) for row in rows])
+                count += len(rows)
+            copied[table.name] = count
+            if progress is not None:
+                progress(table.name, count)
+    backfill_derived_tables(target, [name for name in copied if name not in source_tables])
+    return copied
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source_url")
+    parser.add_argument("target_url")
+    parser.add_argument("--from", dest="source_mode", choices=STORAGE_MODES, default="text")
+    parser.add_argument("--to", dest="target_mode", choices=STORAGE_MODES, default="compact")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    source = create_db_engine(args.source_url, storage_mode=args.source_mode)
+    target = create_db_engine(args.target_url, storage_mode=args.target_mode)
+    migrate_storage(
+        source,
+        target,
+        batch_size=args.batch_size,
+        progress=lambda table, count: print(f"{table}: {count} rows"),
+    )
+
+
+if __name__ == "__main__":
+    main()
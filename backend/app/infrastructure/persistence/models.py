@@ -2,10 +2,24 @@
 from __future__ import annotations
 
 from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.domain.models.enums import (
+    AbandonmentType,
+    ChangeEntity,
+    DependencyType,
+    InviteStatus,
+    MemberLevel,
+    ProgressSource,
+    ProjectStatus,
+    ScheduleChangeReason,
+    TaskStatus,
+)
+from app.infrastructure.persistence.types import GUID, EnumCode, Timestamp
+
 
 class Base(DeclarativeBase):
     """Declarative base for ORM models."""
@@ -15,177 +29,248 @@ class UserModel(Base):
     """User ORM model."""
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class ProjectModel(Base):
     """Project ORM model."""
     __tablename__ = "projects"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_by: Mapped[str] = mapped_column(String(36), nullable=False)
-    expected_end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_by: Mapped[UUID] = mapped_column(GUID(), nullable=False)
+    expected_end_date: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+    status: Mapped[ProjectStatus] = mapped_column(EnumCode(ProjectStatus), nullable=False)
     llm_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     llm_provider: Mapped[str | None] = mapped_column(String(255), nullable=True)
     llm_api_key_encrypted: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Updates run ``WHERE version = <version read>``; repositories set the next version.
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": False}
 
 
 class RoleModel(Base):
     """Role ORM model."""
     __tablename__ = "roles"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class ProjectMemberModel(Base):
     """Project member ORM model."""
     __tablename__ = "project_members"
+    __table_args__ = (Index("ix_project_members_project_id_joined_at_id", "project_id", "joined_at", "id"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
-    role_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("roles.id"), nullable=True)
-    level: Mapped[str] = mapped_column(String(50), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
+    role_id: Mapped[UUID | None] = mapped_column(GUID(), ForeignKey("roles.id"), nullable=True)
+    level: Mapped[MemberLevel] = mapped_column(EnumCode(MemberLevel), nullable=False)
     base_capacity: Mapped[int] = mapped_column(Integer, nullable=False)
     is_manager: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    joined_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    joined_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class ProjectInviteModel(Base):
     """Project invite ORM model."""
     __tablename__ = "project_invites"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    role_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("roles.id"), nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    role_id: Mapped[UUID | None] = mapped_column(GUID(), ForeignKey("roles.id"), nullable=True)
+    status: Mapped[InviteStatus] = mapped_column(EnumCode(InviteStatus), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
 
 
 class TaskModel(Base):
     """Task ORM model."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_id_expected_end_date", "project_id", "expected_end_date"),
+        Index("ix_tasks_project_id_status_assigned_to", "project_id", "status", "assigned_to"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[TaskStatus] = mapped_column(EnumCode(TaskStatus), nullable=False)
     difficulty: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    role_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("roles.id"), nullable=True)
-    assigned_to: Mapped[str | None] = mapped_column(String(36), ForeignKey("users.id"), nullable=True)
-    expected_start_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    expected_end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    actual_start_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    actual_end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    role_id: Mapped[UUID | None] = mapped_column(GUID(), ForeignKey("roles.id"), nullable=True)
+    assigned_to: Mapped[UUID | None] = mapped_column(GUID(), ForeignKey("users.id"), nullable=True)
+    expected_start_date: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+    expected_end_date: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+    actual_start_date: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+    actual_end_date: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": False}
+
+
+class ProjectSummaryModel(Base):
+    """Project summary ORM model: task aggregates of one project.
+
+    Written by the task repository in the same transaction as the task rows,
+    with ``col = col + delta`` updates, and rebuilt from ``tasks`` by
+    ``app.infrastructure.persistence.rebuild_project_summaries``.
+    """
+    __tablename__ = "project_summaries"
+
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), primary_key=True)
+    todo_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    blocked_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    doing_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    done_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cancelled_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_difficulty: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    doing_difficulty: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    delayed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    latest_expected_end: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+
+
+class MemberWorkloadModel(Base):
+    """Member workload ORM model: summed difficulty of a user's DOING tasks in a project.
+
+    Maintained by the task repository like ``project_summaries``; checked and
+    repaired by ``app.infrastructure.persistence.reconcile_member_workloads``.
+    """
+    __tablename__ = "member_workloads"
+
+    project_id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    doing_difficulty: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
 
 class TaskDependencyModel(Base):
     """Task dependency ORM model."""
     __tablename__ = "task_dependencies"
 
-    task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), primary_key=True)
-    depends_on_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), primary_key=True)
-    dependency_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    task_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), primary_key=True)
+    depends_on_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), primary_key=True)
+    dependency_type: Mapped[DependencyType] = mapped_column(EnumCode(DependencyType), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class TaskReportModel(Base):
     """Task report ORM model."""
     __tablename__ = "task_reports"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
-    author_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    task_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), nullable=False)
+    author_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
     progress: Mapped[int] = mapped_column(Integer, nullable=False)
-    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    source: Mapped[ProgressSource] = mapped_column(EnumCode(ProgressSource), nullable=False)
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class TaskAbandonmentModel(Base):
     """Task abandonment ORM model."""
     __tablename__ = "task_abandonments"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
-    abandonment_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    task_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
+    abandonment_type: Mapped[AbandonmentType] = mapped_column(EnumCode(AbandonmentType), nullable=False)
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class TaskAssignmentHistoryModel(Base):
     """Task assignment history ORM model."""
     __tablename__ = "task_assignment_history"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
-    assigned_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    unassigned_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    task_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
+    assigned_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    unassigned_at: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
     assignment_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
 class TaskScheduleHistoryModel(Base):
     """Task schedule history ORM model."""
     __tablename__ = "task_schedule_history"
+    __table_args__ = (Index("ix_task_schedule_history_task_id_created_at_id", "task_id", "created_at", "id"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    task_id: Mapped[str] = mapped_column(String(36), ForeignKey("tasks.id"), nullable=False)
-    previous_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    previous_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    new_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    new_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    reason: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    task_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("tasks.id"), nullable=False)
+    previous_start: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    previous_end: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    new_start: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    new_end: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    reason: Mapped[ScheduleChangeReason] = mapped_column(EnumCode(ScheduleChangeReason), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class ProjectScheduleHistoryModel(Base):
     """Project schedule history ORM model."""
     __tablename__ = "project_schedule_history"
+    __table_args__ = (Index("ix_project_schedule_history_project_id_created_at_id", "project_id", "created_at", "id"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
-    previous_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    new_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    reason: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
+    previous_end: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    new_end: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    reason: Mapped[ScheduleChangeReason] = mapped_column(EnumCode(ScheduleChangeReason), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class NotificationPreferenceModel(Base):
     """Notification preference ORM model."""
     __tablename__ = "notification_preferences"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    project_id: Mapped[str] = mapped_column(String(36), ForeignKey("projects.id"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("projects.id"), nullable=False)
+    user_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
     email_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     toast_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
 
 
 class MagicLinkModel(Base):
     """Magic link ORM model."""
     __tablename__ = "magic_links"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    consumed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    user_id: Mapped[UUID] = mapped_column(GUID(), ForeignKey("users.id"), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
+    consumed_at: Mapped[datetime | None] = mapped_column(Timestamp(), nullable=True)
+
+
+class ChangeLogModel(Base):
+    """Change log ORM model: one row per write to a task, member or dependency.
+
+    ``seq`` only ever grows (AUTOINCREMENT on SQLite never reuses values), so
+    it serves as the delta-sync cursor. SQLite runs one writer at a time, so
+    rows become visible in ``seq`` order; on PostgreSQL concurrent writers
+    can commit out of order and a poll may step past a row still in flight.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_project_id_seq", "project_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project_id: Mapped[UUID] = mapped_column(GUID(), nullable=False)
+    entity: Mapped[ChangeEntity] = mapped_column(EnumCode(ChangeEntity), nullable=False)
+    entity_id: Mapped[UUID] = mapped_column(GUID(), nullable=False)
+    related_id: Mapped[UUID | None] = mapped_column(GUID(), nullable=True)
+    deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(Timestamp(), nullable=False)
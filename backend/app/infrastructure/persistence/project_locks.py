@@ -0,0 +1,152 @@
+"""Per-project write locks.
+
+Schedule mutations of one project must not interleave, but writes to
+different projects should never wait for each other, so the lock is keyed by
+project. On PostgreSQL it is a transaction-scoped advisory lock, which spans
+processes and is released by the database on commit or rollback. Other
+databases get a keyed in-process lock, released when the session's
+transaction ends.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Deque, Dict
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.value_objects import ProjectId
+
+_HELD = "project_locks"
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+class LockMetrics:
+    """Wait times and timeouts of project lock acquisitions."""
+
+    def __init__(self, window: int = 1024):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._lock = Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._recent.append(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters as a JSON-friendly dict (times in ms)."""
+        with self._lock:
+            recent = sorted(self._recent)
+            acquisitions = self.acquisitions
+            return {
+                "acquisitions": acquisitions,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": self.total_wait / acquisitions * 1000 if acquisitions else 0.0,
+                "wait_p99_ms": recent[min(len(recent) - 1, int(len(recent) * 0.99))] * 1000 if recent else 0.0,
+                "wait_max_ms": self.max_wait * 1000,
+            }
+
+
+@dataclass
+class _LocalLock:
+    lock: Lock = field(default_factory=Lock)
+    users: int = 0
+
+
+class ProjectLocks:
+    """Acquires per-project locks for the duration of a session's transaction.
+
+    Locking a project twice in one transaction is a no-op. The lock is taken
+    after the session's connection is checked out, so it always nests inside
+    the connection: taking them in the other order could deadlock against
+    the single-connection SQLite writer pool.
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self.metrics = LockMetrics()
+        self._local: Dict[UUID, _LocalLock] = {}
+        self._mutex = Lock()
+
+    def acquire(self, session: Session, project_id: ProjectId) -> None:
+        """Block until ``project_id`` is locked or raise after ``timeout``."""
+        held: Dict[UUID, Callable[[], None] | None] = session.info.setdefault(_HELD, {})
+        if project_id.value in held:
+            return
+        connection = session.connection()
+        start = time.perf_counter()
+        if connection.dialect.name == "postgresql":
+            self._acquire_advisory(session, project_id.value)
+            release = None
+        else:
+            release = self._acquire_local(project_id.value)
+        self.metrics.record_wait(time.perf_counter() - start)
+        held[project_id.value] = release
+        if not event.contains(session, "after_transaction_end", _release_held):
+            event.listen(session, "after_transaction_end", _release_held)
+
+    def _acquire_advisory(self, session: Session, key: UUID) -> None:
+        session.execute(text(f"SET LOCAL lock_timeout = '{int(self.timeout * 1000)}ms'"))
+        try:
+            session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {"key": int.from_bytes(key.bytes[:8], "big", signed=True)},
+            )
+        except OperationalError as exc:
+            code = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+            if code != _LOCK_NOT_AVAILABLE:
+                raise
+            self._timed_out(exc)
+        session.execute(text("SET LOCAL lock_timeout = DEFAULT"))
+
+    def _acquire_local(self, key: UUID) -> Callable[[], None]:
+        with self._mutex:
+            entry = self._local.setdefault(key, _LocalLock())
+            entry.users += 1
+        if not entry.lock.acquire(timeout=self.timeout):
+            self._leave(key, entry)
+            self._timed_out(None)
+
+        def release() -> None:
+            entry.lock.release()
+            self._leave(key, entry)
+
+        return release
+
+    def _leave(self, key: UUID, entry: _LocalLock) -> None:
+        with self._mutex:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._local[key]
+
+    def _timed_out(self, cause: BaseException | None) -> None:
+        self.metrics.record_timeout()
+        raise ConcurrencyConflict(
+            "Project is busy with another schedule change, retry later",
+            code="project_locked",
+        ) from cause
+
+
+def _release_held(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None:
+        return
+    held = session.info.pop(_HELD, None) or {}
+    for release in held.values():
+        if release is not None:
+            release()
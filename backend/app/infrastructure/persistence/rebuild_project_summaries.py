@@ -0,0 +1,50 @@
+"""Rebuild the project summary table from the tasks.
+
+Usage::
+
+    python -m app.infrastructure.persistence.rebuild_project_summaries \\
+        sqlite:///./planner.db [--project PROJECT_ID]
+
+Summaries are maintained on every task write, so this is only needed to
+backfill a database created before the table existed, or to repair one
+written by code that bypassed the task repository. Each project's row is
+recomputed with one grouped aggregate over ``tasks``, in one transaction.
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.domain.models.value_objects import ProjectId
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import SqlAlchemyProjectSummaryRepository
+from app.infrastructure.persistence.types import STORAGE_MODES
+
+
+def rebuild_project_summaries(engine: Engine, project_id: Optional[ProjectId] = None) -> int:
+    """Recompute the summaries of one project or all; return how many were written."""
+    Base.metadata.create_all(engine)
+    with Session(engine) as session, session.begin():
+        return SqlAlchemyProjectSummaryRepository(session).rebuild(project_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("database_url")
+    parser.add_argument("--project", type=UUID, default=None)
+    parser.add_argument("--storage-mode", choices=STORAGE_MODES, default="text")
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.database_url, storage_mode=args.storage_mode)
+    project_id = ProjectId(args.project) if args.project else None
+    count = rebuild_project_summaries(engine, project_id)
+    print(f"project_summaries: {count} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Check the member workload counters against the tasks.
+
+Usage::
+
+    python -m app.infrastructure.persistence.reconcile_member_workloads \\
+        sqlite:///./planner.db [--project PROJECT_ID] [--repair]
+
+Counters are maintained on every task write, so any difference means a
+write bypassed the task repository, or the table predates the data. Each
+drifted counter is printed; ``--repair`` resets it to the value recomputed
+from the DOING tasks. The exit status is 1 when drift was found and left
+unrepaired, so the job can alert from cron. Without ``--repair`` it only
+reads, and is safe to run against a live database; the schema must already
+exist, as the application creates it.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.application.dtos.task_dtos import WorkloadDrift
+from app.domain.models.value_objects import ProjectId
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.repositories import SqlAlchemyMemberWorkloadRepository
+from app.infrastructure.persistence.types import STORAGE_MODES
+
+
+def reconcile_member_workloads(
+    engine: Engine,
+    project_id: Optional[ProjectId] = None,
+    repair: bool = False,
+) -> List[WorkloadDrift]:
+    """Return the drifted counters of one project or all, repairing them if asked."""
+    with Session(engine) as session, session.begin():
+        return SqlAlchemyMemberWorkloadRepository(session).reconcile(project_id, repair=repair)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("database_url")
+    parser.add_argument("--project", type=UUID, default=None)
+    parser.add_argument("--repair", action="store_true")
+    parser.add_argument("--storage-mode", choices=STORAGE_MODES, default="text")
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.database_url, storage_mode=args.storage_mode)
+    project_id = ProjectId(args.project) if args.project else None
+    drifts = reconcile_member_workloads(engine, project_id, repair=args.repair)
+    for drift in drifts:
+        print(f"project={drift.project_id} user={drift.user_id} stored={drift.stored} actual={drift.actual}")
+    print(f"member_workloads: {len(drifts)} drifted{' (repaired)' if args.repair and drifts else ''}")
+    if drifts and not args.repair:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,45 @@
 """Repository implementations using SQLAlchemy."""
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    CursorResult,
+    Row,
+    Select,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.domain.models.enums import (
-    AbandonmentType,
-    DependencyType,
-    InviteStatus,
-    MemberLevel,
-    ProgressSource,
-    ProjectStatus,
-    ScheduleChangeReason,
-    TaskStatus,
-)
+from app.application.dtos.change_dtos import ChangeEntry
+from app.application.dtos.pagination import Cursor, Page
+from app.application.dtos.task_dtos import WorkloadDrift
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.enums import ChangeEntity, TaskStatus
 from app.domain.models.magic_link import MagicLink
 from app.domain.models.notification_preference import NotificationPreference
 from app.domain.models.project import Project
 from app.domain.models.project_invite import ProjectInvite
 from app.domain.models.project_member import ProjectMember
 from app.domain.models.project_schedule_history import ProjectScheduleHistory
+from app.domain.models.project_summary import ProjectSummary
 from app.domain.models.role import Role
 from app.domain.models.task import Task
 from app.domain.models.task_abandonment import TaskAbandonment
@@ -48,13 +65,18 @@ from app.domain.models.value_objects import (
     UserId,
     UtcDateTime,
 )
+from app.infrastructure.cache.ttl_cache import TtlCache
+from app.infrastructure.database import mark_written
 from app.infrastructure.persistence.models import (
+    ChangeLogModel,
     MagicLinkModel,
+    MemberWorkloadModel,
     NotificationPreferenceModel,
     ProjectInviteModel,
     ProjectMemberModel,
     ProjectModel,
     ProjectScheduleHistoryModel,
+    ProjectSummaryModel,
     RoleModel,
     TaskAbandonmentModel,
     TaskAssignmentHistoryModel,
@@ -64,47 +86,313 @@ from app.infrastructure.persistence.models import (
     TaskScheduleHistoryModel,
     UserModel,
 )
+from app.infrastructure.persistence.types import GUID, Timestamp
+
+# Read paths that only hydrate domain objects select these column tuples
+# instead of ORM instances, skipping identity-map and instrumentation work.
+_TASK_COLUMNS = tuple(TaskModel.__table__.c)
+_PROJECT_MEMBER_COLUMNS = tuple(ProjectMemberModel.__table__.c)
+_TASK_DEPENDENCY_COLUMNS = tuple(TaskDependencyModel.__table__.c)
+
+_CHANGE_LOG = ChangeLogModel.__table__
+
+# Dependencies carry no project ID; the change row takes it from the task.
+_DEPENDENCY_CHANGE = insert(_CHANGE_LOG).from_select(
+    ["project_id", "entity", "entity_id", "related_id", "deleted", "changed_at"],
+    select(
+        TaskModel.project_id,
+        literal(ChangeEntity.DEPENDENCY, _CHANGE_LOG.c.entity.type),
+        TaskModel.id,
+        bindparam("depends_on_id", type_=GUID()),
+        bindparam("deleted", type_=Boolean()),
+        bindparam("changed_at", type_=Timestamp()),
+    ).where(TaskModel.id == bindparam("task_id", type_=GUID())),
+)
+
+_PROJECT_SUMMARIES = ProjectSummaryModel.__table__
+_MEMBER_WORKLOADS = MemberWorkloadModel.__table__
+_STATUS_COUNT_COLUMNS = {status: f"{status.value}_count" for status in TaskStatus}
+_SUMMARY_COUNTERS = (*_STATUS_COUNT_COLUMNS.values(), "total_difficulty", "doing_difficulty", "delayed_count")
+
+# Large ID lists are split so no statement exceeds the driver's bound
+# parameter limit (999 on older SQLite builds).
+_IN_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+
+def _execute_rows(session: Session, stmt: Any) -> CursorResult[Any]:
+    """Run a Core statement on the session's connection, without ORM result handling.
+
+    Pending changes are flushed first, as ``Session.execute`` would autoflush,
+    and DML marks the session as written, as ``_execute_write`` does.
+    """
+    session.flush()
+    if getattr(stmt, "is_dml", False):
+        mark_written(session)
+    return session.connection().execute(stmt)
+
+
+def _execute_write(session: Session, stmt: Any, parameters: Any = None) -> CursorResult[Any]:
+    """Run a Core write on the session's connection and mark the session as written.
+
+    Core statements bypass the flush, so without the mark a commit made only
+    of them would not pin its caller to the primary for read-your-writes.
+    """
+    mark_written(session)
+    connection = session.connection()
+    return connection.execute(stmt) if parameters is None else connection.execute(stmt, parameters)
+
+
+def _stream_rows(session: Session, stmt: Any, batch_size: int, to_entity: Callable[[Row], T]) -> Iterator[T]:
+    """Yield entities from a server-side cursor, ``batch_size`` rows at a time.
+
+    Only one batch of rows is held in memory, however large the result.
+    """
+    session.flush()
+    result = session.connection().execution_options(yield_per=batch_size).execute(stmt)
+    for rows in result.partitions():
+        for row in rows:
+            yield to_entity(row)
+
+
+def _log_changes(session: Session, entity: ChangeEntity, changes: Sequence[Tuple[UUID, UUID]]) -> None:
+    """Append one change log row per ``(project_id, entity_id)`` pair."""
+    if not changes:
+        return
+    changed_at = UtcDateTime.now().value
+    _execute_write(session, insert(_CHANGE_LOG), [
+        {
+            "project_id": project_id,
+            "entity": entity,
+            "entity_id": entity_id,
+            "related_id": None,
+            "deleted": False,
+            "changed_at": changed_at,
+        }
+        for project_id, entity_id in changes
+    ])
+
+
+def _log_dependency_changes(session: Session, edges: Sequence[Tuple[UUID, UUID]], deleted: bool) -> None:
+    """Append one change log row per ``(task_id, depends_on_id)`` edge."""
+    if not edges:
+        return
+    session.flush()
+    changed_at = UtcDateTime.now().value
+    _execute_write(session, _DEPENDENCY_CHANGE, [
+        {"task_id": task_id, "depends_on_id": depends_on_id, "deleted": deleted, "changed_at": changed_at}
+        for task_id, depends_on_id in edges
+    ])
+
+
+def _summary_counters(summary: ProjectSummary) -> Dict[str, int]:
+    counters = {_STATUS_COUNT_COLUMNS[status]: count for status, count in summary.status_counts.items()}
+    counters["total_difficulty"] = summary.total_difficulty
+    counters["doing_difficulty"] = summary.doing_difficulty
+    counters["delayed_count"] = summary.delayed_count
+    return counters
+
+
+def _dialect_insert(session: Session) -> Callable[[Any], Any]:
+    """Return the ``insert`` construct with ``on_conflict_do_update`` for the session's database."""
+    return postgresql_insert if session.connection().dialect.name == "postgresql" else sqlite_insert
+
+
+def _upsert_summary(session: Session, project_id: UUID, counters: Dict[str, int], latest_end: Any) -> None:
+    """Add ``counters`` to a project's summary row, creating it if missing.
+
+    The increments run in the database (``col = col + delta``), so concurrent
+    writers never overwrite each other's counts. ``latest_end`` only replaces
+    a lower or missing value.
+    """
+    stmt = _dialect_insert(session)(_PROJECT_SUMMARIES).values(project_id=project_id, latest_expected_end=latest_end, **counters)
+    current_end = _PROJECT_SUMMARIES.c.latest_expected_end
+    set_: Dict[str, Any] = {name: _PROJECT_SUMMARIES.c[name] + stmt.excluded[name] for name in counters}
+    set_["latest_expected_end"] = case(
+        (or_(current_end.is_(None), stmt.excluded.latest_expected_end > current_end), stmt.excluded.latest_expected_end),
+        else_=current_end,
+    )
+    _execute_write(session, stmt.on_conflict_do_update(index_elements=["project_id"], set_=set_))
+
+
+def _update_project_summaries(session: Session, changes: Sequence[Tuple[Optional[Task], Task]]) -> None:
+    """Apply task writes, as ``(previous, current)`` states, to their project summaries."""
+    deltas: Dict[UUID, ProjectSummary] = {}
+    raised_ends: Dict[UUID, Any] = {}
+    lowered_ends: List[Tuple[UUID, Any]] = []
+    for previous, task in changes:
+        project_id = task.project_id.value
+        delta = deltas.setdefault(project_id, ProjectSummary(task.project_id))
+        delta.add(task)
+        previous_end = None
+        if previous is not None:
+            delta.add(previous, -1)
+            previous_end = previous.expected_end_date
+        end = task.expected_end_date
+        if end is not None and (previous_end is None or end > previous_end):
+            if project_id not in raised_ends or end.value > raised_ends[project_id]:
+                raised_ends[project_id] = end.value
+        if previous_end is not None and (end is None or end < previous_end):
+            lowered_ends.append((project_id, previous_end.value))
+
+    for project_id, delta in deltas.items():
+        counters = _summary_counters(delta)
+        if any(counters.values()) or project_id in raised_ends:
+            _upsert_summary(session, project_id, counters, raised_ends.get(project_id))
+    # A maximum cannot be decremented: when the task holding a project's
+    # latest end moves earlier, the latest end is recomputed from the index.
+    for project_id, previous_end in lowered_ends:
+        _execute_rows(session, (
+            update(_PROJECT_SUMMARIES)
+            .where(
+                _PROJECT_SUMMARIES.c.project_id == project_id,
+                _PROJECT_SUMMARIES.c.latest_expected_end == previous_end,
+            )
+            .values(latest_expected_end=(
+                select(func.max(TaskModel.expected_end_date))
+                .where(TaskModel.project_id == project_id)
+                .scalar_subquery()
+            ))
+        ))
 
 
-def _uuid(value: str) -> UUID:
-    return UUID(value)
+def _update_member_workloads(session: Session, changes: Sequence[Tuple[Optional[Task], Task]]) -> None:
+    """Apply task writes, as ``(previous, current)`` states, to the assignees' DOING difficulty."""
+    deltas: Dict[Tuple[UUID, UUID], int] = {}
+    for previous, task in changes:
+        for state, sign in ((previous, -1), (task, 1)):
+            if state is not None and state.status == TaskStatus.DOING and state.assigned_to is not None:
+                key = (state.project_id.value, state.assigned_to.value)
+                deltas[key] = deltas.get(key, 0) + sign * (state.difficulty or 0)
+    _add_member_workloads(session, deltas)
+
+
+def _add_member_workloads(session: Session, deltas: Dict[Tuple[UUID, UUID], int]) -> None:
+    """Add ``deltas``, keyed by ``(project_id, user_id)``, to the DOING difficulty counters.
+
+    The increment is applied by the database, so it commutes with concurrent
+    writers adjusting the same counters.
+    """
+    rows = [
+        {"project_id": project_id, "user_id": user_id, "doing_difficulty": delta}
+        for (project_id, user_id), delta in deltas.items()
+        if delta
+    ]
+    if rows:
+        stmt = _dialect_insert(session)(_MEMBER_WORKLOADS)
+        _execute_write(session, stmt.on_conflict_do_update(
+            index_elements=["project_id", "user_id"],
+            set_={"doing_difficulty": _MEMBER_WORKLOADS.c.doing_difficulty + stmt.excluded.doing_difficulty},
+        ), rows)
+
+
+def _merge_versioned(session: Session, model: Any, entity: Any, name: str) -> None:
+    """Update an existing row only if it is still at the version ``entity`` was read at.
+
+    ``merge`` rejects an entity older than the row loaded in this session, and
+    the flushed ``UPDATE ... WHERE version = :read`` matches no row if another
+    transaction committed a newer version in between; both surface as
+    ``ConcurrencyConflict``. The entity then carries the new version, so it
+    can be saved again in the same unit of work.
+    """
+    try:
+        merged = session.merge(model)
+        merged.version = entity.version + 1
+        session.flush()
+    except StaleDataError as exc:
+        raise ConcurrencyConflict(f"{name} was modified concurrently; reload and retry") from exc
+    entity.version += 1
+
+
+def _find_by_ids(
+    session: Session,
+    model: Any,
+    ids: Sequence[Any],
+    to_entity: Callable[[Any], T],
+) -> List[T]:
+    """Load ``model`` rows by ID value with one ``IN`` query per chunk.
+
+    Results follow the order of ``ids`` without duplicates; missing IDs are
+    skipped. Rows go through the session, like ``find_by_id``, so loaded
+    entities can be saved without another lookup.
+    """
+    values = list(dict.fromkeys(item.value for item in ids))
+    found: Dict[Any, Any] = {}
+    for start in range(0, len(values), _IN_CHUNK_SIZE):
+        chunk = values[start:start + _IN_CHUNK_SIZE]
+        for instance in session.execute(select(model).where(model.id.in_(chunk))).scalars():
+            found[instance.id] = instance
+    return [to_entity(found[value]) for value in values if value in found]
+
+
+def _keyset_page(
+    session: Session,
+    stmt: Select[Any],
+    timestamp: ColumnElement[Any],
+    item_id: ColumnElement[Any],
+    limit: int,
+    after: Optional[Cursor],
+    to_entity: Callable[[Row[Any]], T],
+) -> Page[T]:
+    """Fetch one page of ``stmt`` ordered by ``(timestamp, item_id)``.
+
+    The page starts strictly after ``after``, so an index on the filter
+    columns followed by ``(timestamp, id)`` serves every page with a range
+    scan, however deep. One extra row is read to tell whether more follow.
+    """
+    if after is not None:
+        position = tuple_(literal(after.timestamp.value, timestamp.type), literal(after.id, item_id.type))
+        stmt = stmt.where(tuple_(timestamp, item_id) > position)
+    stmt = stmt.order_by(timestamp, item_id).limit(limit + 1)
+    rows = _execute_rows(session, stmt).all()
+    if len(rows) <= limit:
+        return Page([to_entity(row) for row in rows])
+    last = rows[limit - 1]._mapping
+    next_cursor = Cursor(UtcDateTime.trusted(last[timestamp]), last[item_id])
+    return Page([to_entity(row) for row in rows[:limit]], next_cursor)
 
 
 class SqlAlchemyUserRepository:
     """User repository implementation."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, user_cache: TtlCache[UserId, User] | None = None):
         self.session = session
+        self.user_cache = user_cache
 
     def save(self, user: User) -> None:
         self.session.merge(UserModel(
-            id=str(user.id.value),
+            id=user.id.value,
             email=user.email,
             name=user.name,
             created_at=user.created_at.value,
         ))
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user.id)
 
     def find_by_id(self, user_id: UserId) -> Optional[User]:
-        model = self.session.get(UserModel, str(user_id.value))
+        model = self.session.get(UserModel, user_id.value)
         if model is None:
             return None
-        return User(
-            id=UserId(_uuid(model.id)),
-            email=model.email,
-            name=model.name,
-            created_at=UtcDateTime(model.created_at),
-        )
+        return self._to_entity(model)
+
+    def find_by_ids(self, user_ids: Sequence[UserId]) -> List[User]:
+        return _find_by_ids(self.session, UserModel, user_ids, self._to_entity)
 
     def find_by_email(self, email: str) -> Optional[User]:
         stmt = select(UserModel).where(UserModel.email == email)
         model = self.session.execute(stmt).scalars().first()
         if model is None:
             return None
+        return self._to_entity(model)
+
+    @staticmethod
+    def _to_entity(model: UserModel) -> User:
         return User(
-            id=UserId(_uuid(model.id)),
+            id=UserId.trusted(model.id),
             email=model.email,
             name=model.name,
-            created_at=UtcDateTime(model.created_at),
+            created_at=UtcDateTime.trusted(model.created_at),
         )
 
 
@@ -115,43 +403,56 @@ class SqlAlchemyProjectRepository:
         self.session = session
 
     def save(self, project: Project) -> None:
-        self.session.merge(ProjectModel(
-            id=str(project.id.value),
+        model = ProjectModel(
+            id=project.id.value,
             name=project.name,
             description=project.description,
-            created_by=str(project.created_by.value),
+            created_by=project.created_by.value,
             expected_end_date=project.expected_end_date.value if project.expected_end_date else None,
-            status=project.status.value,
+            status=project.status,
             llm_enabled=project.llm_enabled,
             llm_provider=project.llm_provider,
             llm_api_key_encrypted=project.llm_api_key_encrypted,
             created_at=project.created_at.value,
-        ))
+            version=project.version,
+        )
+        if self.session.get(ProjectModel, project.id.value) is None:
+            self.session.add(model)
+        else:
+            _merge_versioned(self.session, model, project, "Project")
 
     def find_by_id(self, project_id: ProjectId) -> Optional[Project]:
-        model = self.session.get(ProjectModel, str(project_id.value))
+        model = self.session.get(ProjectModel, project_id.value)
         if model is None:
             return None
         return Project(
-            id=ProjectId(_uuid(model.id)),
+            id=ProjectId.trusted(model.id),
             name=model.name,
             description=model.description,
-            created_by=UserId(_uuid(model.created_by)),
-            expected_end_date=UtcDateTime(model.expected_end_date) if model.expected_end_date else None,
-            status=ProjectStatus(model.status),
+            created_by=UserId.trusted(model.created_by),
+            expected_end_date=UtcDateTime.trusted(model.expected_end_date) if model.expected_end_date else None,
+            status=model.status,
             llm_enabled=model.llm_enabled,
             llm_provider=model.llm_provider,
             llm_api_key_encrypted=model.llm_api_key_encrypted,
-            created_at=UtcDateTime(model.created_at),
+            created_at=UtcDateTime.trusted(model.created_at),
+            version=model.version,
         )
 
     def find_by_created_by(self, user_id: UserId) -> List[Project]:
-        stmt = select(ProjectModel).where(ProjectModel.created_by == str(user_id.value))
+        stmt = select(ProjectModel).where(ProjectModel.created_by == user_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [self.find_by_id(ProjectId(_uuid(model.id))) for model in models]  # type: ignore[arg-type]
+        return [self.find_by_id(ProjectId.trusted(model.id)) for model in models]  # type: ignore[arg-type]
+
+    def list_ids_by_created_by(self, user_id: UserId) -> List[ProjectId]:
+        stmt = select(ProjectModel.id).where(ProjectModel.created_by == user_id.value)
+        return [ProjectId.trusted(value) for value in self.session.execute(stmt).scalars()]
 
     def delete(self, project_id: ProjectId) -> None:
-        self.session.execute(delete(ProjectModel).where(ProjectModel.id == str(project_id.value)))
+        # Rows derived from the project's tasks go with it, leaving no orphans.
+        for table in (_PROJECT_SUMMARIES, _MEMBER_WORKLOADS, _CHANGE_LOG):
+            self.session.execute(delete(table).where(table.c.project_id == project_id.value))
+        self.session.execute(delete(ProjectModel).where(ProjectModel.id == project_id.value))
 
 
 class SqlAlchemyProjectMemberRepository:
@@ -162,45 +463,87 @@ class SqlAlchemyProjectMemberRepository:
 
     def save(self, member: ProjectMember) -> None:
         self.session.merge(ProjectMemberModel(
-            id=str(member.id.value),
-            project_id=str(member.project_id.value),
-            user_id=str(member.user_id.value),
-            role_id=str(member.role_id.value) if member.role_id else None,
-            level=member.level.value,
+            id=member.id.value,
+            project_id=member.project_id.value,
+            user_id=member.user_id.value,
+            role_id=member.role_id.value if member.role_id else None,
+            level=member.level,
             base_capacity=member.base_capacity,
             is_manager=member.is_manager,
             joined_at=member.joined_at.value,
         ))
+        _log_changes(self.session, ChangeEntity.MEMBER, [(member.project_id.value, member.id.value)])
 
     def find_by_id(self, member_id: ProjectMemberId) -> Optional[ProjectMember]:
-        model = self.session.get(ProjectMemberModel, str(member_id.value))
+        model = self.session.get(ProjectMemberModel, member_id.value)
         if model is None:
             return None
+        return self._to_entity(model)
+
+    def find_by_ids(self, member_ids: Sequence[ProjectMemberId]) -> List[ProjectMember]:
+        return _find_by_ids(self.session, ProjectMemberModel, member_ids, self._to_entity)
+
+    @staticmethod
+    def _to_entity(model: ProjectMemberModel | Row) -> ProjectMember:
         return ProjectMember(
-            id=ProjectMemberId(_uuid(model.id)),
-            project_id=ProjectId(_uuid(model.project_id)),
-            user_id=UserId(_uuid(model.user_id)),
-            role_id=RoleId(_uuid(model.role_id)) if model.role_id else None,
-            level=MemberLevel(model.level),
+            id=ProjectMemberId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
+            user_id=UserId.trusted(model.user_id),
+            role_id=RoleId.trusted(model.role_id) if model.role_id else None,
+            level=model.level,
             base_capacity=model.base_capacity,
             is_manager=model.is_manager,
-            joined_at=UtcDateTime(model.joined_at),
+            joined_at=UtcDateTime.trusted(model.joined_at),
         )
 
     def list_by_project(self, project_id: ProjectId) -> List[ProjectMember]:
-        stmt = select(ProjectMemberModel).where(ProjectMemberModel.project_id == str(project_id.value))
-        models = self.session.execute(stmt).scalars().all()
-        return [self.find_by_id(ProjectMemberId(_uuid(model.id))) for model in models]  # type: ignore[arg-type]
+        value = project_id.value
+        stmt = lambda_stmt(
+            lambda: select(*_PROJECT_MEMBER_COLUMNS).where(ProjectMemberModel.project_id == value)
+        )
+        return [self._to_entity(row) for row in _execute_rows(self.session, stmt)]
+
+    def page_by_project(
+        self,
+        project_id: ProjectId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[ProjectMember]:
+        table = ProjectMemberModel.__table__
+        stmt = select(*table.c).where(table.c.project_id == project_id.value)
+        return _keyset_page(self.session, stmt, table.c.joined_at, table.c.id, limit, after, self._to_entity)
 
     def find_by_project_and_user(self, project_id: ProjectId, user_id: UserId) -> Optional[ProjectMember]:
         stmt = select(ProjectMemberModel).where(
-            ProjectMemberModel.project_id == str(project_id.value),
-            ProjectMemberModel.user_id == str(user_id.value),
+            ProjectMemberModel.project_id == project_id.value,
+            ProjectMemberModel.user_id == user_id.value,
         )
         model = self.session.execute(stmt).scalars().first()
         if model is None:
             return None
-        return self.find_by_id(ProjectMemberId(_uuid(model.id)))
+        return self.find_by_id(ProjectMemberId.trusted(model.id))
+
+    def list_project_ids_by_user(self, user_id: UserId) -> List[ProjectId]:
+        stmt = select(ProjectMemberModel.project_id).where(ProjectMemberModel.user_id == user_id.value)
+        return [ProjectId.trusted(value) for value in self.session.execute(stmt).scalars()]
+
+    def list_with_workload_scores(self, project_id: ProjectId) -> List[Tuple[ProjectMember, int]]:
+        doing = (
+            select(
+                TaskModel.assigned_to,
+                func.sum(func.coalesce(TaskModel.difficulty, 0)).label("workload_score"),
+            )
+            .where(TaskModel.project_id == project_id.value, TaskModel.status == TaskStatus.DOING)
+            .group_by(TaskModel.assigned_to)
+            .subquery()
+        )
+        stmt = (
+            select(*_PROJECT_MEMBER_COLUMNS, func.coalesce(doing.c.workload_score, 0).label("workload_score"))
+            .outerjoin(doing, doing.c.assigned_to == ProjectMemberModel.user_id)
+            .where(ProjectMemberModel.project_id == project_id.value)
+            .order_by(ProjectMemberModel.joined_at, ProjectMemberModel.id)
+        )
+        return [(self._to_entity(row), row.workload_score) for row in _execute_rows(self.session, stmt)]
 
 
 class SqlAlchemyRoleRepository:
@@ -211,30 +554,37 @@ class SqlAlchemyRoleRepository:
 
     def save(self, role: Role) -> None:
         self.session.merge(RoleModel(
-            id=str(role.id.value),
-            project_id=str(role.project_id.value),
+            id=role.id.value,
+            project_id=role.project_id.value,
             name=role.name,
             description=role.description,
             created_at=role.created_at.value,
         ))
 
     def find_by_id(self, role_id: RoleId) -> Optional[Role]:
-        model = self.session.get(RoleModel, str(role_id.value))
+        model = self.session.get(RoleModel, role_id.value)
         if model is None:
             return None
+        return self._to_entity(model)
+
+    def find_by_ids(self, role_ids: Sequence[RoleId]) -> List[Role]:
+        return _find_by_ids(self.session, RoleModel, role_ids, self._to_entity)
+
+    def list_by_project(self, project_id: ProjectId) -> List[Role]:
+        stmt = select(RoleModel).where(RoleModel.project_id == project_id.value)
+        models = self.session.execute(stmt).scalars().all()
+        return [self._to_entity(model) for model in models]
+
+    @staticmethod
+    def _to_entity(model: RoleModel) -> Role:
         return Role(
-            id=RoleId(_uuid(model.id)),
-            project_id=ProjectId(_uuid(model.project_id)),
+            id=RoleId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
             name=model.name,
             description=model.description,
-            created_at=UtcDateTime(model.created_at),
+            created_at=UtcDateTime.trusted(model.created_at),
         )
 
-    def list_by_project(self, project_id: ProjectId) -> List[Role]:
-        stmt = select(RoleModel).where(RoleModel.project_id == str(project_id.value))
-        models = self.session.execute(stmt).scalars().all()
-        return [self.find_by_id(RoleId(_uuid(model.id))) for model in models]  # type: ignore[arg-type]
-
 
 class SqlAlchemyProjectInviteRepository:
     """Project invite repository implementation."""
@@ -244,29 +594,29 @@ class SqlAlchemyProjectInviteRepository:
 
     def save(self, invite: ProjectInvite) -> None:
         self.session.merge(ProjectInviteModel(
-            id=str(invite.id.value),
-            project_id=str(invite.project_id.value),
+            id=invite.id.value,
+            project_id=invite.project_id.value,
             email=invite.email,
             token=str(invite.token),
-            role_id=str(invite.role_id.value) if invite.role_id else None,
-            status=invite.status.value,
+            role_id=invite.role_id.value if invite.role_id else None,
+            status=invite.status,
             created_at=invite.created_at.value,
             expires_at=invite.expires_at.value if invite.expires_at else None,
         ))
 
     def find_by_id(self, invite_id: ProjectInviteId) -> Optional[ProjectInvite]:
-        model = self.session.get(ProjectInviteModel, str(invite_id.value))
+        model = self.session.get(ProjectInviteModel, invite_id.value)
         if model is None:
             return None
         return ProjectInvite(
-            id=ProjectInviteId(_uuid(model.id)),
-            project_id=ProjectId(_uuid(model.project_id)),
+            id=ProjectInviteId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
             email=model.email,
             token=InviteToken(model.token),
-            role_id=RoleId(_uuid(model.role_id)) if model.role_id else None,
-            status=InviteStatus(model.status),
-            created_at=UtcDateTime(model.created_at),
-            expires_at=UtcDateTime(model.expires_at) if model.expires_at else None,
+            role_id=RoleId.trusted(model.role_id) if model.role_id else None,
+            status=model.status,
+            created_at=UtcDateTime.trusted(model.created_at),
+            expires_at=UtcDateTime.trusted(model.expires_at) if model.expires_at else None,
         )
 
     def find_by_token(self, token: InviteToken) -> Optional[ProjectInvite]:
@@ -274,12 +624,12 @@ class SqlAlchemyProjectInviteRepository:
         model = self.session.execute(stmt).scalars().first()
         if model is None:
             return None
-        return self.find_by_id(ProjectInviteId(_uuid(model.id)))
+        return self.find_by_id(ProjectInviteId.trusted(model.id))
 
     def list_by_project(self, project_id: ProjectId) -> List[ProjectInvite]:
-        stmt = select(ProjectInviteModel).where(ProjectInviteModel.project_id == str(project_id.value))
+        stmt = select(ProjectInviteModel).where(ProjectInviteModel.project_id == project_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [self.find_by_id(ProjectInviteId(_uuid(model.id))) for model in models]  # type: ignore[arg-type]
+        return [self.find_by_id(ProjectInviteId.trusted(model.id)) for model in models]  # type: ignore[arg-type]
 
 
 class SqlAlchemyTaskRepository:
@@ -289,46 +639,135 @@ class SqlAlchemyTaskRepository:
         self.session = session
 
     def save(self, task: Task) -> None:
-        self.session.merge(TaskModel(
-            id=str(task.id.value),
-            project_id=str(task.project_id.value),
-            title=task.title,
-            description=task.description,
-            status=task.status.value,
-            difficulty=task.difficulty,
-            role_id=str(task.role_id.value) if task.role_id else None,
-            assigned_to=str(task.assigned_to.value) if task.assigned_to else None,
-            expected_start_date=task.expected_start_date.value if task.expected_start_date else None,
-            expected_end_date=task.expected_end_date.value if task.expected_end_date else None,
-            actual_start_date=task.actual_start_date.value if task.actual_start_date else None,
-            actual_end_date=task.actual_end_date.value if task.actual_end_date else None,
-            created_at=task.created_at.value,
-        ))
+        model = self.session.get(TaskModel, task.id.value)
+        previous = self._to_entity(model) if model is not None else None
+        if model is None:
+            self.session.add(TaskModel(**self._to_row(task)))
+        else:
+            _merge_versioned(self.session, TaskModel(**self._to_row(task)), task, "Task")
+        _log_changes(self.session, ChangeEntity.TASK, [(task.project_id.value, task.id.value)])
+        _update_project_summaries(self.session, [(previous, task)])
+        _update_member_workloads(self.session, [(previous, task)])
+
+    def add_many(self, tasks: Sequence[Task]) -> None:
+        if tasks:
+            self.session.execute(insert(TaskModel), [self._to_row(task) for task in tasks])
+            _log_changes(self.session, ChangeEntity.TASK, [(task.project_id.value, task.id.value) for task in tasks])
+            changes = [(None, task) for task in tasks]
+            _update_project_summaries(self.session, changes)
+            _update_member_workloads(self.session, changes)
+
+    def unassign_user(self, project_id: ProjectId, user_id: UserId) -> List[TaskId]:
+        """Unassign every task of ``user_id`` in a project; return their IDs.
+
+        DOING tasks go back to TODO, the others keep their status. Each
+        ``UPDATE`` returns the rows it changed, so the change log, project
+        summary and workload counter are adjusted by exactly what was written,
+        whatever committed before the statements ran.
+        """
+        tasks = TaskModel.__table__
+        assigned = (tasks.c.project_id == project_id.value, tasks.c.assigned_to == user_id.value)
+        doing = _execute_rows(self.session, (
+            update(tasks)
+            .where(*assigned, tasks.c.status == TaskStatus.DOING)
+            .values(assigned_to=None, status=TaskStatus.TODO, version=tasks.c.version + 1)
+            .returning(tasks.c.id, tasks.c.difficulty)
+        )).all()
+        others = _execute_rows(self.session, (
+            update(tasks)
+            .where(*assigned)
+            .values(assigned_to=None, version=tasks.c.version + 1)
+            .returning(tasks.c.id)
+        )).scalars().all()
+        released = [task_id for task_id, _difficulty in doing] + list(others)
+        if not released:
+            return []
+
+        _log_changes(self.session, ChangeEntity.TASK, [(project_id.value, task_id) for task_id in released])
+        doing_difficulty = sum(difficulty or 0 for _task_id, difficulty in doing)
+        if doing:
+            _upsert_summary(self.session, project_id.value, {
+                _STATUS_COUNT_COLUMNS[TaskStatus.DOING]: -len(doing),
+                _STATUS_COUNT_COLUMNS[TaskStatus.TODO]: len(doing),
+                "doing_difficulty": -doing_difficulty,
+            }, None)
+        if doing_difficulty:
+            _execute_write(
+                self.session,
+                update(_MEMBER_WORKLOADS)
+                .where(
+                    _MEMBER_WORKLOADS.c.project_id == project_id.value,
+                    _MEMBER_WORKLOADS.c.user_id == user_id.value,
+                )
+                .values(doing_difficulty=_MEMBER_WORKLOADS.c.doing_difficulty - doing_difficulty)
+            )
+        # Rows loaded earlier in this session no longer match the database.
+        released_ids = set(released)
+        for model in list(self.session.identity_map.values()):
+            if isinstance(model, TaskModel) and model.id in released_ids:
+                self.session.expire(model)
+        return [TaskId.trusted(task_id) for task_id in released]
+
+    @staticmethod
+    def _to_row(task: Task) -> Dict[str, Any]:
+        return {
+            "id": task.id.value,
+            "project_id": task.project_id.value,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "difficulty": task.difficulty,
+            "role_id": task.role_id.value if task.role_id else None,
+            "assigned_to": task.assigned_to.value if task.assigned_to else None,
+            "expected_start_date": task.expected_start_date.value if task.expected_start_date else None,
+            "expected_end_date": task.expected_end_date.value if task.expected_end_date else None,
+            "actual_start_date": task.actual_start_date.value if task.actual_start_date else None,
+            "actual_end_date": task.actual_end_date.value if task.actual_end_date else None,
+            "created_at": task.created_at.value,
+            "version": task.version,
+        }
 
     def find_by_id(self, task_id: TaskId) -> Optional[Task]:
-        model = self.session.get(TaskModel, str(task_id.value))
+        model = self.session.get(TaskModel, task_id.value)
         if model is None:
             return None
+        return self._to_entity(model)
+
+    def find_by_ids(self, task_ids: Sequence[TaskId]) -> List[Task]:
+        return _find_by_ids(self.session, TaskModel, task_ids, self._to_entity)
+
+    @staticmethod
+    def _to_entity(model: TaskModel | Row) -> Task:
         return Task(
-            id=TaskId(_uuid(model.id)),
-            project_id=ProjectId(_uuid(model.project_id)),
+            id=TaskId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
             title=model.title,
             description=model.description,
-            status=TaskStatus(model.status),
+            status=model.status,
             difficulty=model.difficulty,
-            role_id=RoleId(_uuid(model.role_id)) if model.role_id else None,
-            assigned_to=UserId(_uuid(model.assigned_to)) if model.assigned_to else None,
-            expected_start_date=UtcDateTime(model.expected_start_date) if model.expected_start_date else None,
-            expected_end_date=UtcDateTime(model.expected_end_date) if model.expected_end_date else None,
-            actual_start_date=UtcDateTime(model.actual_start_date) if model.actual_start_date else None,
-            actual_end_date=UtcDateTime(model.actual_end_date) if model.actual_end_date else None,
-            created_at=UtcDateTime(model.created_at),
+            role_id=RoleId.trusted(model.role_id) if model.role_id else None,
+            assigned_to=UserId.trusted(model.assigned_to) if model.assigned_to else None,
+            expected_start_date=UtcDateTime.trusted(model.expected_start_date) if model.expected_start_date else None,
+            expected_end_date=UtcDateTime.trusted(model.expected_end_date) if model.expected_end_date else None,
+            actual_start_date=UtcDateTime.trusted(model.actual_start_date) if model.actual_start_date else None,
+            actual_end_date=UtcDateTime.trusted(model.actual_end_date) if model.actual_end_date else None,
+            created_at=UtcDateTime.trusted(model.created_at),
+            version=model.version,
         )
 
+    def find_project_id(self, task_id: TaskId) -> Optional[ProjectId]:
+        stmt = select(TaskModel.project_id).where(TaskModel.id == task_id.value)
+        value = self.session.execute(stmt).scalar()
+        return ProjectId.trusted(value) if value is not None else None
+
     def list_by_project(self, project_id: ProjectId) -> List[Task]:
-        stmt = select(TaskModel).where(TaskModel.project_id == str(project_id.value))
-        models = self.session.execute(stmt).scalars().all()
-        return [self.find_by_id(TaskId(_uuid(model.id))) for model in models]  # type: ignore[arg-type]
+        value = project_id.value
+        stmt = lambda_stmt(lambda: select(*_TASK_COLUMNS).where(TaskModel.project_id == value))
+        return [self._to_entity(row) for row in _execute_rows(self.session, stmt)]
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[Task]:
+        stmt = select(*_TASK_COLUMNS).where(TaskModel.project_id == project_id.value)
+        return _stream_rows(self.session, stmt, batch_size, self._to_entity)
 
 
 class SqlAlchemyTaskDependencyRepository:
@@ -338,31 +777,62 @@ class SqlAlchemyTaskDependencyRepository:
         self.session = session
 
     def save(self, dependency: TaskDependency) -> None:
-        self.session.merge(TaskDependencyModel(
-            task_id=str(dependency.task_id.value),
-            depends_on_id=str(dependency.depends_on_id.value),
-            dependency_type=dependency.dependency_type.value,
-            created_at=dependency.created_at.value,
-        ))
+        self.session.merge(TaskDependencyModel(**self._to_row(dependency)))
+        _log_dependency_changes(
+            self.session, [(dependency.task_id.value, dependency.depends_on_id.value)], deleted=False
+        )
+
+    def add_many(self, dependencies: Sequence[TaskDependency]) -> None:
+        if dependencies:
+            self.session.execute(
+                insert(TaskDependencyModel),
+                [self._to_row(dependency) for dependency in dependencies],
+            )
+            _log_dependency_changes(
+                self.session,
+                [(dependency.task_id.value, dependency.depends_on_id.value) for dependency in dependencies],
+                deleted=False,
+            )
+
+    @staticmethod
+    def _to_row(dependency: TaskDependency) -> Dict[str, Any]:
+        return {
+            "task_id": dependency.task_id.value,
+            "depends_on_id": dependency.depends_on_id.value,
+            "dependency_type": dependency.dependency_type,
+            "created_at": dependency.created_at.value,
+        }
 
     def list_by_task(self, task_id: TaskId) -> List[TaskDependency]:
-        stmt = select(TaskDependencyModel).where(TaskDependencyModel.task_id == str(task_id.value))
+        stmt = select(TaskDependencyModel).where(TaskDependencyModel.task_id == task_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [
-            TaskDependency(
-                task_id=TaskId(_uuid(model.task_id)),
-                depends_on_id=TaskId(_uuid(model.depends_on_id)),
-                dependency_type=DependencyType(model.dependency_type),
-                created_at=UtcDateTime(model.created_at),
-            )
-            for model in models
-        ]
+        return [self._to_entity(model) for model in models]
+
+    def list_by_project(self, project_id: ProjectId) -> List[TaskDependency]:
+        value = project_id.value
+        stmt = lambda_stmt(
+            lambda: select(*_TASK_DEPENDENCY_COLUMNS)
+            .join(TaskModel, TaskModel.id == TaskDependencyModel.task_id)
+            .where(TaskModel.project_id == value)
+        )
+        return [self._to_entity(row) for row in _execute_rows(self.session, stmt)]
+
+    @staticmethod
+    def _to_entity(model: TaskDependencyModel | Row) -> TaskDependency:
+        return TaskDependency(
+            task_id=TaskId.trusted(model.task_id),
+            depends_on_id=TaskId.trusted(model.depends_on_id),
+            dependency_type=model.dependency_type,
+            created_at=UtcDateTime.trusted(model.created_at),
+        )
 
     def delete(self, task_id: TaskId, depends_on_id: TaskId) -> None:
-        self.session.execute(delete(TaskDependencyModel).where(
-            TaskDependencyModel.task_id == str(task_id.value),
-            TaskDependencyModel.depends_on_id == str(depends_on_id.value),
+        result = self.session.execute(delete(TaskDependencyModel).where(
+            TaskDependencyModel.task_id == task_id.value,
+            TaskDependencyModel.depends_on_id == depends_on_id.value,
         ))
+        if result.rowcount:
+            _log_dependency_changes(self.session, [(task_id.value, depends_on_id.value)], deleted=True)
 
 
 class SqlAlchemyTaskReportRepository:
@@ -373,30 +843,39 @@ class SqlAlchemyTaskReportRepository:
 
     def save(self, report: TaskReport) -> None:
         self.session.merge(TaskReportModel(
-            id=str(report.id.value),
-            task_id=str(report.task_id.value),
-            author_id=str(report.author_id.value),
+            id=report.id.value,
+            task_id=report.task_id.value,
+            author_id=report.author_id.value,
             progress=report.progress,
-            source=report.source.value,
+            source=report.source,
             note=report.note,
             created_at=report.created_at.value,
         ))
 
     def list_by_task(self, task_id: TaskId) -> List[TaskReport]:
-        stmt = select(TaskReportModel).where(TaskReportModel.task_id == str(task_id.value))
+        stmt = select(TaskReportModel).where(TaskReportModel.task_id == task_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [
-            TaskReport(
-                id=TaskReportId(_uuid(model.id)),
-                task_id=TaskId(_uuid(model.task_id)),
-                author_id=UserId(_uuid(model.author_id)),
-                progress=model.progress,
-                source=ProgressSource(model.source),
-                note=model.note,
-                created_at=UtcDateTime(model.created_at),
-            )
-            for model in models
-        ]
+        return [self._to_entity(model) for model in models]
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskReport]:
+        stmt = (
+            select(*TaskReportModel.__table__.c)
+            .join(TaskModel, TaskModel.id == TaskReportModel.task_id)
+            .where(TaskModel.project_id == project_id.value)
+        )
+        return _stream_rows(self.session, stmt, batch_size, self._to_entity)
+
+    @staticmethod
+    def _to_entity(model: TaskReportModel | Row) -> TaskReport:
+        return TaskReport(
+            id=TaskReportId.trusted(model.id),
+            task_id=TaskId.trusted(model.task_id),
+            author_id=UserId.trusted(model.author_id),
+            progress=model.progress,
+            source=model.source,
+            note=model.note,
+            created_at=UtcDateTime.trusted(model.created_at),
+        )
 
 
 class SqlAlchemyTaskAbandonmentRepository:
@@ -407,25 +886,39 @@ class SqlAlchemyTaskAbandonmentRepository:
 
     def save(self, abandonment: TaskAbandonment) -> None:
         self.session.merge(TaskAbandonmentModel(
-            id=str(abandonment.id.value),
-            task_id=str(abandonment.task_id.value),
-            user_id=str(abandonment.user_id.value),
-            abandonment_type=abandonment.abandonment_type.value,
+            id=abandonment.id.value,
+            task_id=abandonment.task_id.value,
+            user_id=abandonment.user_id.value,
+            abandonment_type=abandonment.abandonment_type,
             note=abandonment.note,
             created_at=abandonment.created_at.value,
         ))
 
+    def add_many(self, abandonments: Sequence[TaskAbandonment]) -> None:
+        if abandonments:
+            self.session.execute(insert(TaskAbandonmentModel), [
+                {
+                    "id": abandonment.id.value,
+                    "task_id": abandonment.task_id.value,
+                    "user_id": abandonment.user_id.value,
+                    "abandonment_type": abandonment.abandonment_type,
+                    "note": abandonment.note,
+                    "created_at": abandonment.created_at.value,
+                }
+                for abandonment in abandonments
+            ])
+
     def list_by_task(self, task_id: TaskId) -> List[TaskAbandonment]:
-        stmt = select(TaskAbandonmentModel).where(TaskAbandonmentModel.task_id == str(task_id.value))
+        stmt = select(TaskAbandonmentModel).where(TaskAbandonmentModel.task_id == task_id.value)
         models = self.session.execute(stmt).scalars().all()
         return [
             TaskAbandonment(
-                id=TaskAbandonmentId(_uuid(model.id)),
-                task_id=TaskId(_uuid(model.task_id)),
-                user_id=UserId(_uuid(model.user_id)),
-                abandonment_type=AbandonmentType(model.abandonment_type),
+                id=TaskAbandonmentId.trusted(model.id),
+                task_id=TaskId.trusted(model.task_id),
+                user_id=UserId.trusted(model.user_id),
+                abandonment_type=model.abandonment_type,
                 note=model.note,
-                created_at=UtcDateTime(model.created_at),
+                created_at=UtcDateTime.trusted(model.created_at),
             )
             for model in models
         ]
@@ -439,28 +932,37 @@ class SqlAlchemyTaskAssignmentHistoryRepository:
 
     def save(self, history: TaskAssignmentHistory) -> None:
         self.session.merge(TaskAssignmentHistoryModel(
-            id=str(history.id.value),
-            task_id=str(history.task_id.value),
-            user_id=str(history.user_id.value),
+            id=history.id.value,
+            task_id=history.task_id.value,
+            user_id=history.user_id.value,
             assigned_at=history.assigned_at.value,
             unassigned_at=history.unassigned_at.value if history.unassigned_at else None,
             assignment_reason=history.assignment_reason,
         ))
 
     def list_by_task(self, task_id: TaskId) -> List[TaskAssignmentHistory]:
-        stmt = select(TaskAssignmentHistoryModel).where(TaskAssignmentHistoryModel.task_id == str(task_id.value))
+        stmt = select(TaskAssignmentHistoryModel).where(TaskAssignmentHistoryModel.task_id == task_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [
-            TaskAssignmentHistory(
-                id=TaskAssignmentHistoryId(_uuid(model.id)),
-                task_id=TaskId(_uuid(model.task_id)),
-                user_id=UserId(_uuid(model.user_id)),
-                assigned_at=UtcDateTime(model.assigned_at),
-                unassigned_at=UtcDateTime(model.unassigned_at) if model.unassigned_at else None,
-                assignment_reason=model.assignment_reason,
-            )
-            for model in models
-        ]
+        return [self._to_entity(model) for model in models]
+
+    def iter_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskAssignmentHistory]:
+        stmt = (
+            select(*TaskAssignmentHistoryModel.__table__.c)
+            .join(TaskModel, TaskModel.id == TaskAssignmentHistoryModel.task_id)
+            .where(TaskModel.project_id == project_id.value)
+        )
+        return _stream_rows(self.session, stmt, batch_size, self._to_entity)
+
+    @staticmethod
+    def _to_entity(model: TaskAssignmentHistoryModel | Row) -> TaskAssignmentHistory:
+        return TaskAssignmentHistory(
+            id=TaskAssignmentHistoryId.trusted(model.id),
+            task_id=TaskId.trusted(model.task_id),
+            user_id=UserId.trusted(model.user_id),
+            assigned_at=UtcDateTime.trusted(model.assigned_at),
+            unassigned_at=UtcDateTime.trusted(model.unassigned_at) if model.unassigned_at else None,
+            assignment_reason=model.assignment_reason,
+        )
 
 
 class SqlAlchemyScheduleHistoryRepository:
@@ -471,59 +973,227 @@ class SqlAlchemyScheduleHistoryRepository:
 
     def save_task_history(self, history: TaskScheduleHistory) -> None:
         self.session.merge(TaskScheduleHistoryModel(
-            id=str(history.id.value),
-            task_id=str(history.task_id.value),
+            id=history.id.value,
+            task_id=history.task_id.value,
             previous_start=history.previous_start.value,
             previous_end=history.previous_end.value,
             new_start=history.new_start.value,
             new_end=history.new_end.value,
-            reason=history.reason.value,
+            reason=history.reason,
             created_at=history.created_at.value,
         ))
 
     def save_project_history(self, history: ProjectScheduleHistory) -> None:
         self.session.merge(ProjectScheduleHistoryModel(
-            id=str(history.id.value),
-            project_id=str(history.project_id.value),
+            id=history.id.value,
+            project_id=history.project_id.value,
             previous_end=history.previous_end.value,
             new_end=history.new_end.value,
-            reason=history.reason.value,
+            reason=history.reason,
             created_at=history.created_at.value,
         ))
 
     def list_task_history(self, task_id: TaskId) -> List[TaskScheduleHistory]:
-        stmt = select(TaskScheduleHistoryModel).where(TaskScheduleHistoryModel.task_id == str(task_id.value))
+        stmt = select(TaskScheduleHistoryModel).where(TaskScheduleHistoryModel.task_id == task_id.value)
         models = self.session.execute(stmt).scalars().all()
-        return [
-            TaskScheduleHistory(
-                id=TaskScheduleHistoryId(_uuid(model.id)),
-                task_id=TaskId(_uuid(model.task_id)),
-                previous_start=UtcDateTime(model.previous_start),
-                previous_end=UtcDateTime(model.previous_end),
-                new_start=UtcDateTime(model.new_start),
-                new_end=UtcDateTime(model.new_end),
-                reason=ScheduleChangeReason(model.reason),
-                created_at=UtcDateTime(model.created_at),
-            )
-            for model in models
-        ]
+        return [self._task_history_to_entity(model) for model in models]
 
     def list_project_history(self, project_id: ProjectId) -> List[ProjectScheduleHistory]:
         stmt = select(ProjectScheduleHistoryModel).where(
-            ProjectScheduleHistoryModel.project_id == str(project_id.value)
+            ProjectScheduleHistoryModel.project_id == project_id.value
         )
         models = self.session.execute(stmt).scalars().all()
+        return [self._project_history_to_entity(model) for model in models]
+
+    def page_task_history(
+        self,
+        task_id: TaskId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[TaskScheduleHistory]:
+        table = TaskScheduleHistoryModel.__table__
+        stmt = select(*table.c).where(table.c.task_id == task_id.value)
+        return _keyset_page(
+            self.session, stmt, table.c.created_at, table.c.id, limit, after, self._task_history_to_entity
+        )
+
+    def page_project_history(
+        self,
+        project_id: ProjectId,
+        limit: int,
+        after: Optional[Cursor] = None,
+    ) -> Page[ProjectScheduleHistory]:
+        table = ProjectScheduleHistoryModel.__table__
+        stmt = select(*table.c).where(table.c.project_id == project_id.value)
+        return _keyset_page(
+            self.session, stmt, table.c.created_at, table.c.id, limit, after, self._project_history_to_entity
+        )
+
+    def iter_task_history_by_project(self, project_id: ProjectId, batch_size: int) -> Iterator[TaskScheduleHistory]:
+        stmt = (
+            select(*TaskScheduleHistoryModel.__table__.c)
+            .join(TaskModel, TaskModel.id == TaskScheduleHistoryModel.task_id)
+            .where(TaskModel.project_id == project_id.value)
+        )
+        return _stream_rows(self.session, stmt, batch_size, self._task_history_to_entity)
+
+    @staticmethod
+    def _task_history_to_entity(model: TaskScheduleHistoryModel | Row) -> TaskScheduleHistory:
+        return TaskScheduleHistory(
+            id=TaskScheduleHistoryId.trusted(model.id),
+            task_id=TaskId.trusted(model.task_id),
+            previous_start=UtcDateTime.trusted(model.previous_start),
+            previous_end=UtcDateTime.trusted(model.previous_end),
+            new_start=UtcDateTime.trusted(model.new_start),
+            new_end=UtcDateTime.trusted(model.new_end),
+            reason=model.reason,
+            created_at=UtcDateTime.trusted(model.created_at),
+        )
+
+    @staticmethod
+    def _project_history_to_entity(model: ProjectScheduleHistoryModel | Row) -> ProjectScheduleHistory:
+        return ProjectScheduleHistory(
+            id=ProjectScheduleHistoryId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
+            previous_end=UtcDateTime.trusted(model.previous_end),
+            new_end=UtcDateTime.trusted(model.new_end),
+            reason=model.reason,
+            created_at=UtcDateTime.trusted(model.created_at),
+        )
+
+
+class SqlAlchemyChangeLogRepository:
+    """Change log repository implementation; rows are written by the entity repositories."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def list_since(self, project_id: ProjectId, since: int, limit: int) -> List[ChangeEntry]:
+        stmt = (
+            select(_CHANGE_LOG)
+            .where(_CHANGE_LOG.c.project_id == project_id.value, _CHANGE_LOG.c.seq > since)
+            .order_by(_CHANGE_LOG.c.seq)
+            .limit(limit)
+        )
         return [
-            ProjectScheduleHistory(
-                id=ProjectScheduleHistoryId(_uuid(model.id)),
-                project_id=ProjectId(_uuid(model.project_id)),
-                previous_end=UtcDateTime(model.previous_end),
-                new_end=UtcDateTime(model.new_end),
-                reason=ScheduleChangeReason(model.reason),
-                created_at=UtcDateTime(model.created_at),
+            ChangeEntry(
+                seq=row.seq,
+                entity=row.entity,
+                entity_id=row.entity_id,
+                related_id=row.related_id,
+                deleted=row.deleted,
             )
-            for model in models
+            for row in _execute_rows(self.session, stmt)
+        ]
+
+
+class SqlAlchemyProjectSummaryRepository:
+    """Project summary repository implementation; rows are maintained by the task repository."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, project_id: ProjectId) -> ProjectSummary:
+        stmt = select(_PROJECT_SUMMARIES).where(_PROJECT_SUMMARIES.c.project_id == project_id.value)
+        row = _execute_rows(self.session, stmt).first()
+        if row is None:
+            return ProjectSummary(project_id)
+        return ProjectSummary(
+            project_id=project_id,
+            status_counts={status: row._mapping[column] for status, column in _STATUS_COUNT_COLUMNS.items()},
+            total_difficulty=row.total_difficulty,
+            doing_difficulty=row.doing_difficulty,
+            delayed_count=row.delayed_count,
+            latest_expected_end=UtcDateTime.trusted(row.latest_expected_end) if row.latest_expected_end else None,
+        )
+
+    def rebuild(self, project_id: Optional[ProjectId] = None) -> int:
+        difficulty = func.coalesce(TaskModel.difficulty, 0)
+        aggregates = [
+            func.sum(case((TaskModel.status == status, 1), else_=0)).label(column)
+            for status, column in _STATUS_COUNT_COLUMNS.items()
+        ]
+        stmt = select(
+            TaskModel.project_id,
+            *aggregates,
+            func.sum(difficulty).label("total_difficulty"),
+            func.sum(case((TaskModel.status == TaskStatus.DOING, difficulty), else_=0)).label("doing_difficulty"),
+            func.sum(case((TaskModel.actual_end_date > TaskModel.expected_end_date, 1), else_=0)).label("delayed_count"),
+            func.max(TaskModel.expected_end_date).label("latest_expected_end"),
+        ).group_by(TaskModel.project_id)
+        clear = delete(_PROJECT_SUMMARIES)
+        if project_id is not None:
+            stmt = stmt.where(TaskModel.project_id == project_id.value)
+            clear = clear.where(_PROJECT_SUMMARIES.c.project_id == project_id.value)
+        rows = [dict(row._mapping) for row in _execute_rows(self.session, stmt)]
+        _execute_write(self.session, clear)
+        if rows:
+            _execute_write(self.session, insert(_PROJECT_SUMMARIES), rows)
+        return len(rows)
+
+
+class SqlAlchemyMemberWorkloadRepository:
+    """Member workload repository implementation; rows are maintained by the task repository."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_doing_difficulty(self, project_id: ProjectId, user_id: UserId) -> int:
+        stmt = select(_MEMBER_WORKLOADS.c.doing_difficulty).where(
+            _MEMBER_WORKLOADS.c.project_id == project_id.value,
+            _MEMBER_WORKLOADS.c.user_id == user_id.value,
+        )
+        return _execute_rows(self.session, stmt).scalar() or 0
+
+    def reconcile(self, project_id: Optional[ProjectId] = None, repair: bool = False) -> List[WorkloadDrift]:
+        """Compare every counter with its DOING tasks; optionally correct the drifted ones.
+
+        Stored and actual values are read by one statement, so both come from
+        the same snapshot, and a repair adds ``actual - stored`` rather than
+        writing ``actual``: a task write committed meanwhile has its own delta
+        applied on top, instead of being overwritten.
+        """
+        actual_stmt = (
+            select(
+                TaskModel.project_id.label("project_id"),
+                TaskModel.assigned_to.label("user_id"),
+                func.sum(func.coalesce(TaskModel.difficulty, 0)).label("actual"),
+                literal(0).label("stored"),
+            )
+            .where(TaskModel.status == TaskStatus.DOING, TaskModel.assigned_to.is_not(None))
+            .group_by(TaskModel.project_id, TaskModel.assigned_to)
+        )
+        stored_stmt = select(
+            _MEMBER_WORKLOADS.c.project_id,
+            _MEMBER_WORKLOADS.c.user_id,
+            literal(0).label("actual"),
+            _MEMBER_WORKLOADS.c.doing_difficulty.label("stored"),
+        )
+        if project_id is not None:
+            actual_stmt = actual_stmt.where(TaskModel.project_id == project_id.value)
+            stored_stmt = stored_stmt.where(_MEMBER_WORKLOADS.c.project_id == project_id.value)
+        both = union_all(actual_stmt, stored_stmt).subquery()
+        actual, stored = func.sum(both.c.actual), func.sum(both.c.stored)
+        drift_stmt = (
+            select(both.c.project_id, both.c.user_id, actual.label("actual"), stored.label("stored"))
+            .group_by(both.c.project_id, both.c.user_id)
+            .having(actual != stored)
+        )
+        drifts = [
+            WorkloadDrift(
+                project_id=ProjectId.trusted(row.project_id),
+                user_id=UserId.trusted(row.user_id),
+                stored=row.stored,
+                actual=row.actual,
+            )
+            for row in _execute_rows(self.session, drift_stmt)
         ]
+        if repair:
+            _add_member_workloads(self.session, {
+                (drift.project_id.value, drift.user_id.value): drift.actual - drift.stored
+                for drift in drifts
+            })
+        return drifts
 
 
 class SqlAlchemyNotificationPreferenceRepository:
@@ -534,9 +1204,9 @@ class SqlAlchemyNotificationPreferenceRepository:
 
     def save(self, preference: NotificationPreference) -> None:
         self.session.merge(NotificationPreferenceModel(
-            id=str(preference.id.value),
-            project_id=str(preference.project_id.value),
-            user_id=str(preference.user_id.value),
+            id=preference.id.value,
+            project_id=preference.project_id.value,
+            user_id=preference.user_id.value,
             email_enabled=preference.email_enabled,
             toast_enabled=preference.toast_enabled,
             created_at=preference.created_at.value,
@@ -548,19 +1218,19 @@ class SqlAlchemyNotificationPreferenceRepository:
         project_id: ProjectId,
     ) -> Optional[NotificationPreference]:
         stmt = select(NotificationPreferenceModel).where(
-            NotificationPreferenceModel.user_id == str(user_id.value),
-            NotificationPreferenceModel.project_id == str(project_id.value),
+            NotificationPreferenceModel.user_id == user_id.value,
+            NotificationPreferenceModel.project_id == project_id.value,
         )
         model = self.session.execute(stmt).scalars().first()
         if model is None:
             return None
         return NotificationPreference(
-            id=NotificationPreferenceId(_uuid(model.id)),
-            project_id=ProjectId(_uuid(model.project_id)),
-            user_id=UserId(_uuid(model.user_id)),
+            id=NotificationPreferenceId.trusted(model.id),
+            project_id=ProjectId.trusted(model.project_id),
+            user_id=UserId.trusted(model.user_id),
             email_enabled=model.email_enabled,
             toast_enabled=model.toast_enabled,
-            created_at=UtcDateTime(model.created_at),
+            created_at=UtcDateTime.trusted(model.created_at),
         )
 
 
@@ -572,23 +1242,23 @@ class SqlAlchemyMagicLinkRepository:
 
     def save(self, magic_link: MagicLink) -> None:
         self.session.merge(MagicLinkModel(
-            id=str(magic_link.id.value),
+            id=magic_link.id.value,
             token=str(magic_link.token),
-            user_id=str(magic_link.user_id.value),
+            user_id=magic_link.user_id.value,
             expires_at=magic_link.expires_at.value,
             consumed_at=magic_link.consumed_at.value if magic_link.consumed_at else None,
         ))
 
     def find_by_id(self, link_id: MagicLinkId) -> Optional[MagicLink]:
-        model = self.session.get(MagicLinkModel, str(link_id.value))
+        model = self.session.get(MagicLinkModel, link_id.value)
         if model is None:
             return None
         return MagicLink(
-            id=MagicLinkId(_uuid(model.id)),
+            id=MagicLinkId.trusted(model.id),
             token=InviteToken(model.token),
-            user_id=UserId(_uuid(model.user_id)),
-            expires_at=UtcDateTime(model.expires_at),
-            consumed_at=UtcDateTime(model.consumed_at) if model.consumed_at else None,
+            user_id=UserId.trusted(model.user_id),
+            expires_at=UtcDateTime.trusted(model.expires_at),
+            consumed_at=UtcDateTime.trusted(model.consumed_at) if model.consumed_at else None,
         )
 
     def find_by_token(self, token: InviteToken) -> Optional[MagicLink]:
@@ -596,4 +1266,4 @@ class SqlAlchemyMagicLinkRepository:
         model = self.session.execute(stmt).scalars().first()
         if model is None:
             return None
-        return self.find_by_id(MagicLinkId(_uuid(model.id)))
+        return self.find_by_id(MagicLinkId.trusted(model.id))
@@ -0,0 +1,141 @@
+"""Column types whose storage encoding depends on the engine's storage mode.
+
+Repositories always see Python values (``UUID``, enum members, aware UTC
+``datetime``). How they are stored is decided per engine:
+
+* ``text`` (default): ``CHAR(36)`` ids, enum strings and ``DateTime`` columns,
+  the encoding existing databases were created with.
+* ``compact``: native ``UUID`` on PostgreSQL and 16-byte ``BLOB`` elsewhere,
+  ``SMALLINT`` enum codes, and integer epoch microseconds on SQLite.
+
+Enum codes are the member's position in its enum, so new members must only
+ever be appended.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, LargeBinary, SmallInteger, String, Uuid
+from sqlalchemy.engine import Dialect, Engine
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+STORAGE_MODES = ("text", "compact")
+_MODE_ATTRIBUTE = "planner_storage_mode"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def set_storage_mode(engine: Engine, mode: str) -> None:
+    """Select the column encoding used by ``engine``.
+
+    Set it right after the engine is created, before any statement runs:
+    SQLAlchemy caches type processors per dialect.
+    """
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"Unknown storage mode {mode!r}; expected one of {STORAGE_MODES}")
+    setattr(engine.dialect, _MODE_ATTRIBUTE, mode)
+
+
+def storage_mode(dialect: Dialect) -> str:
+    """Return the storage mode of a dialect (``text`` unless set)."""
+    return getattr(dialect, _MODE_ATTRIBUTE, "text")
+
+
+def _compact(dialect: Dialect) -> bool:
+    return storage_mode(dialect) == "compact"
+
+
+class GUID(TypeDecorator):
+    """UUID identifier column."""
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if not _compact(dialect):
+            return dialect.type_descriptor(String(36))
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(Uuid(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        if not _compact(dialect):
+            return str(value)
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[UUID]:
+        if value is None or isinstance(value, UUID):
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return UUID(bytes=bytes(value))
+        return UUID(value)
+
+
+class EnumCode(TypeDecorator):
+    """Enum column stored as its string value or as a small integer code."""
+
+    impl = String(50)
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members: List[Enum] = list(enum_class)
+        self._codes: Dict[Enum, int] = {member: code for code, member in enumerate(self._members)}
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if _compact(dialect):
+            return dialect.type_descriptor(SmallInteger())
+        return dialect.type_descriptor(String(50))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        member = self.enum_class(value)
+        return self._codes[member] if _compact(dialect) else member.value
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return self._members[value]
+        return self.enum_class(value)
+
+
+class Timestamp(TypeDecorator):
+    """Timezone-aware UTC timestamp; epoch microseconds on compact SQLite."""
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if _compact(dialect) and dialect.name == "sqlite":
+            return dialect.type_descriptor(BigInteger())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        if _compact(dialect) and dialect.name == "sqlite":
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return (value - _EPOCH) // _MICROSECOND
+        return value
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return _EPOCH + timedelta(microseconds=value)
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
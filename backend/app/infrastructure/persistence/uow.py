@@ -1,18 +1,28 @@
 """Unit of Work implementation."""
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.application.ports.email_service import EmailService
 from app.application.ports.event_bus import EventBus
 from app.application.ports.llm_service import LlmService
 from app.application.ports.unit_of_work import UnitOfWork
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId, UserId
+from app.infrastructure.cache.ttl_cache import TtlCache
+from app.infrastructure.database import has_written
+from app.infrastructure.persistence.project_locks import ProjectLocks
 from app.infrastructure.persistence.repositories import (
+    SqlAlchemyChangeLogRepository,
     SqlAlchemyMagicLinkRepository,
+    SqlAlchemyMemberWorkloadRepository,
     SqlAlchemyNotificationPreferenceRepository,
     SqlAlchemyProjectInviteRepository,
     SqlAlchemyProjectMemberRepository,
     SqlAlchemyProjectRepository,
+    SqlAlchemyProjectSummaryRepository,
     SqlAlchemyRoleRepository,
     SqlAlchemyScheduleHistoryRepository,
     SqlAlchemyTaskAbandonmentRepository,
@@ -23,9 +33,58 @@ from app.infrastructure.persistence.repositories import (
     SqlAlchemyUserRepository,
 )
 
+_default_project_locks = ProjectLocks()
+
+
+class _LazyRepository:
+    """Builds a repository for the current session on first access."""
+
+    def __init__(self, factory: Callable[["SqlAlchemyUnitOfWork"], Any]):
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, uow: "SqlAlchemyUnitOfWork | None", owner: type | None = None) -> Any:
+        if uow is None:
+            return self
+        repository = self.factory(uow)
+        uow.__dict__[self.name] = repository
+        return repository
+
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
-    """SQLAlchemy-backed Unit of Work."""
+    """SQLAlchemy-backed Unit of Work.
+
+    Nested ``with`` blocks join the outermost one. A ``request_scoped`` unit
+    of work keeps its session open across blocks so the authorization checks
+    and the use case of one request share a single session; only an explicit
+    ``commit()`` commits, and ``close()`` ends the request. A block that
+    wrote nothing ends its transaction on exit, releasing the connection.
+    Repositories are built lazily, the first time a block touches them.
+    """
+
+    users = _LazyRepository(lambda uow: SqlAlchemyUserRepository(uow.session, uow.user_cache))
+    projects = _LazyRepository(lambda uow: SqlAlchemyProjectRepository(uow.session))
+    project_members = _LazyRepository(lambda uow: SqlAlchemyProjectMemberRepository(uow.session))
+    roles = _LazyRepository(lambda uow: SqlAlchemyRoleRepository(uow.session))
+    project_invites = _LazyRepository(lambda uow: SqlAlchemyProjectInviteRepository(uow.session))
+    tasks = _LazyRepository(lambda uow: SqlAlchemyTaskRepository(uow.session))
+    task_dependencies = _LazyRepository(lambda uow: SqlAlchemyTaskDependencyRepository(uow.session))
+    task_reports = _LazyRepository(lambda uow: SqlAlchemyTaskReportRepository(uow.session))
+    task_abandonments = _LazyRepository(lambda uow: SqlAlchemyTaskAbandonmentRepository(uow.session))
+    task_assignment_history = _LazyRepository(
+        lambda uow: SqlAlchemyTaskAssignmentHistoryRepository(uow.session)
+    )
+    schedule_history = _LazyRepository(lambda uow: SqlAlchemyScheduleHistoryRepository(uow.session))
+    notification_preferences = _LazyRepository(
+        lambda uow: SqlAlchemyNotificationPreferenceRepository(uow.session)
+    )
+    magic_links = _LazyRepository(lambda uow: SqlAlchemyMagicLinkRepository(uow.session))
+    change_log = _LazyRepository(lambda uow: SqlAlchemyChangeLogRepository(uow.session))
+    project_summaries = _LazyRepository(lambda uow: SqlAlchemyProjectSummaryRepository(uow.session))
+    member_workloads = _LazyRepository(lambda uow: SqlAlchemyMemberWorkloadRepository(uow.session))
 
     def __init__(
         self,
@@ -33,40 +92,90 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         event_bus: EventBus,
         email_service: EmailService,
         llm_service: LlmService,
+        user_cache: TtlCache[UserId, User] | None = None,
+        request_scoped: bool = False,
+        session_info: dict[str, Any] | None = None,
+        project_locks: ProjectLocks | None = None,
     ):
         self.session_factory = session_factory
         self.event_bus = event_bus
         self.email_service = email_service
         self.llm_service = llm_service
+        self.user_cache = user_cache
+        self.request_scoped = request_scoped
+        self.session_info = session_info
+        self.project_locks = project_locks or _default_project_locks
         self.session: Session | None = None
+        self._depth = 0
 
     def __enter__(self) -> "SqlAlchemyUnitOfWork":
-        self.session = self.session_factory()
-        self.users = SqlAlchemyUserRepository(self.session)
-        self.projects = SqlAlchemyProjectRepository(self.session)
-        self.project_members = SqlAlchemyProjectMemberRepository(self.session)
-        self.roles = SqlAlchemyRoleRepository(self.session)
-        self.project_invites = SqlAlchemyProjectInviteRepository(self.session)
-        self.tasks = SqlAlchemyTaskRepository(self.session)
-        self.task_dependencies = SqlAlchemyTaskDependencyRepository(self.session)
-        self.task_reports = SqlAlchemyTaskReportRepository(self.session)
-        self.task_abandonments = SqlAlchemyTaskAbandonmentRepository(self.session)
-        self.task_assignment_history = SqlAlchemyTaskAssignmentHistoryRepository(self.session)
-        self.schedule_history = SqlAlchemyScheduleHistoryRepository(self.session)
-        self.notification_preferences = SqlAlchemyNotificationPreferenceRepository(self.session)
-        self.magic_links = SqlAlchemyMagicLinkRepository(self.session)
+        self._depth += 1
+        if self.session is None:
+            self._open()
         return self
 
+    def _open(self) -> None:
+        self._drop_repositories()
+        if self.session_info:
+            self.session = self.session_factory(info=dict(self.session_info))
+        else:
+            self.session = self.session_factory()
+
+    def _drop_repositories(self) -> None:
+        for name, value in vars(type(self)).items():
+            if isinstance(value, _LazyRepository):
+                self.__dict__.pop(name, None)
+
     def __exit__(self, exc_type, exc, tb) -> None:
-        if self.session is None:
+        self._depth -= 1
+        if self.session is None or self._depth > 0:
             return
         if exc_type:
             self.session.rollback()
-        else:
+        elif not self.request_scoped:
             self.session.commit()
+        elif not has_written(self.session):
+            # A block that only read ends its transaction, so the connection
+            # (the single writer connection on SQLite) is not held for the
+            # rest of the request.
+            self.session.rollback()
+        if not self.request_scoped:
+            self.close()
+
+    def close(self) -> None:
+        """Close the session, discarding anything not committed."""
+        if self.session is None:
+            return
         self.session.close()
+        self.session = None
+        self._drop_repositories()
 
     def commit(self) -> None:
         if self.session is None:
             return
         self.session.commit()
+        self.session.info.pop("wrote", None)
+
+    def lock_project(self, project_id: ProjectId) -> None:
+        """Serialize writes to ``project_id`` until the transaction ends."""
+        self.project_locks.acquire(self.session, project_id)
+
+
+class SqlAlchemyReadOnlyUnitOfWork(SqlAlchemyUnitOfWork):
+    """Unit of Work for pure reads.
+
+    It never commits: every block ends with a rollback. Pair it with a
+    session factory from ``create_session_factory(..., read_only=True)`` to
+    run the transaction as ``READ ONLY`` (or on a replica).
+    """
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self.session is None or self._depth > 0:
+            return
+        self.session.rollback()
+        if not self.request_scoped:
+            self.close()
+
+    def commit(self) -> None:
+        """Read-only units of work never commit."""
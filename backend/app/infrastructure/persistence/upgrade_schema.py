@@ -0,0 +1,110 @@
+"""Bring an existing database up to the current schema.
+
+Usage::
+
+    python -m app.infrastructure.persistence.upgrade_schema \\
+        sqlite:///./planner.db [--storage-mode text]
+
+Run it once before starting a new release against an existing database. The
+application does not create or alter tables itself, and there is no migration
+tool, so this is the upgrade step. It compares the live schema with the
+models, then:
+
+* creates the missing tables, with their indexes;
+* adds missing columns to existing tables, using the column's default as the
+  SQL ``DEFAULT`` (``version`` on ``tasks`` and ``projects`` starts at 0);
+* creates missing indexes on existing tables;
+* fills the derived tables it created from the rows already there, and
+  repairs the member workload counters, which the task capacity check reads
+  and which would otherwise start at 0 for work assigned before the upgrade.
+
+Every step checks the live schema first, so running it again does nothing.
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Iterable, List
+
+from sqlalchemy import Column, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyMemberWorkloadRepository,
+    SqlAlchemyProjectSummaryRepository,
+)
+from app.infrastructure.persistence.types import STORAGE_MODES
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """Apply the missing schema changes to ``engine``; return what was done."""
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    steps: List[str] = []
+    created: List[str] = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing:
+                table.create(connection)
+                steps.append(f"create table {table.name}")
+                created.append(table.name)
+                continue
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.c:
+                if column.name not in columns:
+                    _add_column(connection, column)
+                    steps.append(f"add column {table.name}.{column.name}")
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(connection)
+                    steps.append(f"create index {index.name}")
+    # Repairing only writes drifted counters, so it is safe on every run.
+    steps.extend(backfill_derived_tables(engine, [*created, "member_workloads"]))
+    return steps
+
+
+def backfill_derived_tables(engine: Engine, tables: Iterable[str]) -> List[str]:
+    """Compute the derived ``tables`` (summaries, counters) from the source rows."""
+    tables = set(tables)
+    steps: List[str] = []
+    with Session(engine) as session, session.begin():
+        if "project_summaries" in tables:
+            count = SqlAlchemyProjectSummaryRepository(session).rebuild()
+            steps.append(f"backfill project_summaries ({count} rows)")
+        if "member_workloads" in tables:
+            drifts = SqlAlchemyMemberWorkloadRepository(session).reconcile(repair=True)
+            if drifts:
+                steps.append(f"repair member_workloads ({len(drifts)} counters)")
+    return steps
+
+
+def _add_column(connection: Connection, column: Column) -> None:
+    preparer = connection.dialect.identifier_preparer
+    ddl = f"ALTER TABLE {preparer.format_table(column.table)} ADD COLUMN {preparer.format_column(column)} "
+    ddl += column.type.compile(dialect=connection.dialect)
+    if not column.nullable:
+        default = column.default.arg if column.default is not None and column.default.is_scalar else None
+        if not isinstance(default, (bool, int)):
+            raise ValueError(f"Cannot add NOT NULL column {column.table.name}.{column.name} without a scalar default")
+        ddl += f" NOT NULL DEFAULT {int(default)}"
+    connection.execute(text(ddl))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("database_url")
+    parser.add_argument("--storage-mode", choices=STORAGE_MODES, default="text")
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.database_url, storage_mode=args.storage_mode)
+    steps = upgrade_schema(engine)
+    for step in steps:
+        print(step)
+    print(f"schema: {len(steps)} change(s) applied")
+
+
+if __name__ == "__main__":
+    main()
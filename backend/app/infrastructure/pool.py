@@ -0,0 +1,123 @@
+"""Connection pool configuration and instrumentation."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Deque, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Pool sizing options passed to ``create_engine``."""
+
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30.0
+    recycle: int = 1800
+    pre_ping: bool = True
+
+    def engine_options(self) -> Dict[str, Any]:
+        """Return the ``create_engine`` keyword arguments for a queue pool."""
+        return {
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout,
+            "pool_recycle": self.recycle,
+            "pool_pre_ping": self.pre_ping,
+        }
+
+
+class PoolMetrics:
+    """Checkout wait times and timeouts of one pool.
+
+    Keeps running totals and the most recent ``window`` waits for
+    percentiles; gauges such as checked-out and overflow connections are read
+    from the pool when a snapshot is taken.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._lock = Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._recent.append(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Return counters and gauges as a JSON-friendly dict (times in ms)."""
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts = self.checkouts
+            data: Dict[str, Any] = {
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": self.total_wait / checkouts * 1000 if checkouts else 0.0,
+                "wait_p99_ms": recent[min(len(recent) - 1, int(len(recent) * 0.99))] * 1000 if recent else 0.0,
+                "wait_max_ms": self.max_wait * 1000,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return data
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout, including the wait for a free connection."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return record
+
+    def recreate(self) -> Any:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that records ``PoolMetrics``."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records ``PoolMetrics``."""
+
+
+def pool_metrics(pool: Pool) -> Dict[str, Any]:
+    """Return a metrics snapshot for an instrumented pool, else just its status."""
+    metrics = getattr(pool, "metrics", None)
+    if metrics is None:
+        return {"status": pool.status()}
+    return metrics.snapshot(pool)
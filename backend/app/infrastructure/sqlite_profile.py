@@ -0,0 +1,68 @@
+"""SQLite connection profile for production use."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Connection, Engine
+
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """Pragmas applied to every new SQLite connection.
+
+    WAL lets readers run while a write is in progress, ``synchronous=NORMAL``
+    is safe with WAL, and ``busy_timeout`` makes a connection wait for a lock
+    instead of failing with ``database is locked``.
+    """
+
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64000
+    busy_timeout: int = 5000
+
+    def pragmas(self) -> List[str]:
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA cache_size = {self.cache_size}",
+            f"PRAGMA busy_timeout = {self.busy_timeout}",
+        ]
+
+
+def is_sqlite_file(url: URL) -> bool:
+    """Return True for SQLite URLs backed by a file."""
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def apply_sqlite_profile(engine: Engine, profile: SqliteProfile) -> None:
+    """Run the profile's pragmas on every connection the engine opens."""
+
+    def on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in profile.pragmas():
+            cursor.execute(pragma)
+        cursor.close()
+
+    event.listen(engine, "connect", on_connect)
+
+
+def use_immediate_transactions(engine: Engine) -> None:
+    """Start every transaction with ``BEGIN IMMEDIATE``.
+
+    The write lock is taken up front, so a transaction that reads first never
+    fails when it later upgrades to a write; it waits on ``busy_timeout``
+    instead. The driver's own implicit BEGIN is turned off for this.
+    """
+
+    def on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    def on_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "begin", on_begin)
@@ -2,10 +2,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.dependencies import event_bus
+from app.api.dependencies import event_bus, project_access
 from app.api.exceptions import register_exception_handlers
 from app.api.middleware.auth import JwtAuthMiddleware
-from app.api.routes import auth, employees, invites, me, projects, schedule, tasks
+from app.api.routes import auth, debug, employees, invites, me, projects, schedule, tasks
+from app.config import settings
+from app.infrastructure.events.handlers.access_handler import register_access_handlers
 from app.infrastructure.events.handlers.notification_handler import register_notification_handlers
 from app.infrastructure.notifications.daily_report_job import start_daily_report_job
 from app.infrastructure.notifications.notification_service import NotificationService
@@ -33,9 +35,12 @@ def create_app() -> FastAPI:
     app.include_router(employees.router, prefix="/api/employees", tags=["employees"])
     app.include_router(schedule.router, prefix="/api/schedule", tags=["schedule"])
     app.include_router(me.router, prefix="/api/me", tags=["me"])
+    if settings.debug_endpoints:
+        app.include_router(debug.router, prefix="/api/debug", tags=["debug"])
 
     notification_service = NotificationService()
     register_notification_handlers(event_bus, notification_service)
+    register_access_handlers(event_bus, project_access)
     start_daily_report_job(event_bus)
 
     return app
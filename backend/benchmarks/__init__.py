@@ -0,0 +1,5 @@
+"""Performance benchmarks.
+
+Run from ``backend/`` with ``python -m benchmarks.<name>``. These scripts are
+not collected by pytest.
+"""
@@ -0,0 +1,96 @@
+"""Shared helpers for the benchmark scripts."""
+from __future__ import annotations
+
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Type
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.database import create_session_factory
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_engine(url: str = "sqlite+pysqlite:///:memory:") -> Engine:
+    """Create an engine with the schema in place."""
+    if url.endswith(":memory:"):
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            future=True,
+        )
+    else:
+        engine = create_engine(url, connect_args={"check_same_thread": False}, future=True)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def make_uow_factory(
+    engine: Engine,
+    uow_class: Type[SqlAlchemyUnitOfWork] = SqlAlchemyUnitOfWork,
+    read_only: bool = False,
+    **kwargs,
+) -> Callable[[], SqlAlchemyUnitOfWork]:
+    """Return a factory of units of work bound to ``engine``."""
+    session_factory = create_session_factory(engine, read_only=read_only)
+    event_bus = InMemoryEventBus()
+    email_service = MockEmailService()
+    llm_service = SimpleLlmService(api_url=None, api_key=None)
+
+    def factory() -> SqlAlchemyUnitOfWork:
+        return uow_class(
+            session_factory=session_factory,
+            event_bus=event_bus,
+            email_service=email_service,
+            llm_service=llm_service,
+            **kwargs,
+        )
+
+    return factory
+
+
+def bearer_headers(jwt_service, user: User) -> Dict[str, str]:
+    """Build an Authorization header for ``user``."""
+    expires_at = UtcDateTime(datetime.now(timezone.utc) + timedelta(hours=1))
+    return {"Authorization": f"Bearer {jwt_service.create_token(str(user.id), expires_at)}"}
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_args) -> None:
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+@contextmanager
+def timer() -> Iterator[List[float]]:
+    """Yield a list that receives the elapsed seconds on exit."""
+    elapsed: List[float] = []
+    start = time.perf_counter()
+    yield elapsed
+    elapsed.append(time.perf_counter() - start)
+
+
+def summarize(samples: List[float]) -> str:
+    """Format latency samples (seconds) as p50/p99 in milliseconds."""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50={statistics.median(ordered) * 1000:.2f}ms p99={p99 * 1000:.2f}ms"
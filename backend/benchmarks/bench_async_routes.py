@@ -0,0 +1,125 @@
+"""Sync vs async routes under many concurrent clients.
+
+Serves the team listing twice from one app: the ``async def`` route backed by
+the async unit of work, and the previous ``def`` route that FastAPI runs on
+its threadpool. Each run fires ``--clients`` concurrent requests through an
+in-process ASGI transport against a SQLite file database.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+from uuid import UUID
+
+import httpx
+from fastapi import Depends
+
+from app.api import dependencies
+from app.application.use_cases.list_team import ListTeamUseCase
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId
+from app.infrastructure.database import create_async_db_engine, create_async_session_factory
+from app.infrastructure.persistence.async_uow import AsyncSqlAlchemyReadOnlyUnitOfWork
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+from app.main import create_app
+from benchmarks._support import bearer_headers, make_engine, make_uow_factory, summarize
+
+
+def build_app(url: str):
+    engine = make_engine(url)
+    async_engine = create_async_db_engine(url)
+    async_read_factory = create_async_session_factory(async_engine, read_only=True)
+    read_factory = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+
+    manager = User.create(email="manager@example.com", name="Manager")
+    project = Project.create(name="Bench", created_by=manager.id)
+    with make_uow_factory(engine)() as uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+        for i in range(20):
+            member = User.create(email=f"member{i}@example.com", name=f"Member {i}")
+            uow.users.save(member)
+            uow.project_members.save(ProjectMember.create_manager(project.id, member.id))
+
+    def get_read_uow() -> Iterator[SqlAlchemyUnitOfWork]:
+        uow = read_factory()
+        try:
+            yield uow
+        finally:
+            uow.close()
+
+    async def get_async_read_uow() -> AsyncIterator[AsyncSqlAlchemyReadOnlyUnitOfWork]:
+        uow = AsyncSqlAlchemyReadOnlyUnitOfWork(
+            session_factory=async_read_factory,
+            event_bus=dependencies.event_bus,
+            email_service=dependencies.email_service,
+            llm_service=dependencies.llm_service,
+            request_scoped=True,
+        )
+        try:
+            yield uow
+        finally:
+            await uow.close()
+
+    app = create_app()
+
+    @app.get("/bench/sync-team/{project_id}")
+    def sync_list_team(
+        project_id: UUID,
+        current_user: User = Depends(dependencies.get_current_user),
+        uow: SqlAlchemyReadOnlyUnitOfWork = Depends(dependencies.get_read_unit_of_work),
+    ):
+        members = ListTeamUseCase(uow=uow).execute(ProjectId(project_id))
+        return [{"id": str(member.id), "user_id": str(member.user_id)} for member in members]
+
+    app.dependency_overrides[dependencies.get_read_unit_of_work] = get_read_uow
+    app.dependency_overrides[dependencies.get_async_read_unit_of_work] = get_async_read_uow
+    dependencies.user_cache.put(manager.id, manager)
+    return app, manager, project, async_engine
+
+
+async def run(app, headers, label: str, path: str, clients: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        samples = []
+
+        async def one() -> None:
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            samples.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+
+        await one()
+        samples.clear()
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    print(f"{label:<6} clients={clients} {summarize(samples)} throughput={clients / elapsed:.0f} req/s")
+
+
+async def main_async(clients: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{Path(directory) / 'bench.db'}"
+        app, manager, project, async_engine = build_app(url)
+        headers = bearer_headers(dependencies.jwt_service, manager)
+        await run(app, headers, "sync", f"/bench/sync-team/{project.id}", clients)
+        await run(app, headers, "async", f"/api/employees/{project.id}/team", clients)
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.clients))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Microbenchmark of JWT auth overhead per request.
+
+Compares the previous flow (token verified by the middleware and again by
+``get_current_user``, authlib re-imported each time) against the cached,
+single-verification flow.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.auth.jwt_service import JwtService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    cached = JwtService("bench-secret")
+    uncached = JwtService("bench-secret", cache_size=0)
+    expires_at = UtcDateTime(datetime.now(timezone.utc) + timedelta(hours=1))
+    token = cached.create_token("bench-user", expires_at)
+
+    def legacy_request() -> None:
+        # Middleware verification plus a second verification in the dependency.
+        uncached.verify_token(token)
+        uncached.verify_token(token)
+
+    def cached_request() -> None:
+        cached.verify_token(token)
+
+    for label, func in (("legacy (2x decode)", legacy_request), ("cached (1x lookup)", cached_request)):
+        seconds = timeit.timeit(func, number=args.requests)
+        print(f"{label:<20} {seconds / args.requests * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Fetching N tasks: one ``find_by_id`` per task versus ``find_by_ids``.
+
+Prints SQL statements and latency for growing N. With ``find_by_ids`` the
+statement count only grows by one per chunk of IDs.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    queries = QueryCounter(engine)
+    write = make_uow_factory(engine)
+    read = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Batch", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(max(args.sizes))]
+    with write() as uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        for task in tasks:
+            uow.tasks.save(task)
+
+    for size in args.sizes:
+        ids = [task.id for task in tasks[:size]]
+        for name, load in (
+            ("find_by_id", lambda uow: [uow.tasks.find_by_id(task_id) for task_id in ids]),
+            ("find_by_ids", lambda uow: uow.tasks.find_by_ids(ids)),
+        ):
+            samples = []
+            for _ in range(args.repeats):
+                queries.reset()
+                with timer() as elapsed, read() as uow:
+                    assert len(load(uow)) == size
+                samples.extend(elapsed)
+            print(f"N={size:<5} {name:<12} queries={queries.count:<5} {summarize(samples)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Polling cost: re-reading a project's tasks versus delta sync.
+
+For growing project sizes, changes ``--changed`` tasks and then compares a
+full ``list_by_project`` poll against ``ListProjectChangesUseCase`` from the
+cursor taken before the change. The delta poll should stay flat as the
+project grows.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.application.use_cases.list_project_changes import ListProjectChangesUseCase
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork
+from benchmarks._support import make_engine, make_uow_factory, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        engine = make_engine()
+        write = make_uow_factory(engine)
+        read = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Delta", created_by=owner.id)
+        tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(size)]
+        with write() as uow:
+            uow.users.save(owner)
+            uow.projects.save(project)
+            uow.tasks.add_many(tasks)
+        cursor = ListProjectChangesUseCase(read()).execute(project.id, limit=size).next_since
+        with write() as uow:
+            for task in tasks[:args.changed]:
+                task.title += " (edited)"
+                uow.tasks.save(task)
+
+        for name, poll in (
+            ("full list", lambda uow: uow.tasks.list_by_project(project.id)),
+            ("changes", lambda uow: ListProjectChangesUseCase(uow).execute(project.id, since=cursor).tasks),
+        ):
+            samples = []
+            for _ in range(args.repeats):
+                with timer() as elapsed, read() as uow:
+                    rows = poll(uow)
+                samples.extend(elapsed)
+            print(f"tasks={size:<6} {name:<10} rows={len(rows):<6} {summarize(samples)}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
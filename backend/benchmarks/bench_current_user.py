@@ -0,0 +1,70 @@
+"""Load test of authenticated requests with and without the user cache.
+
+Reports latency and SQL statements per request for ``GET /api/me`` and a
+``/api/tasks/*`` route.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from fastapi.testclient import TestClient
+
+from app.api import dependencies
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.main import create_app
+from benchmarks._support import QueryCounter, bearer_headers, make_engine, make_uow_factory, summarize
+
+
+def run(requests: int, cache_ttl: float) -> None:
+    engine = make_engine()
+    counter = QueryCounter(engine)
+    dependencies.user_cache.clear()
+    dependencies.user_cache.ttl_seconds = cache_ttl
+    uow_factory = make_uow_factory(engine, user_cache=dependencies.user_cache)
+
+    user = User.create(email="bench@example.com", name="Bench")
+    project = Project.create(name="Bench", created_by=user.id)
+    task = Task.create(project_id=project.id, title="Bench")
+    with uow_factory() as uow:
+        uow.users.save(user)
+        uow.projects.save(project)
+        uow.tasks.save(task)
+
+    app = create_app()
+    app.dependency_overrides[dependencies.get_unit_of_work] = uow_factory
+    client = TestClient(app)
+    headers = bearer_headers(dependencies.jwt_service, user)
+
+    routes = {
+        "GET /api/me": lambda: client.get("/api/me", headers=headers),
+        "POST /api/tasks/reports": lambda: client.post(
+            "/api/tasks/reports",
+            headers=headers,
+            json={"task_id": str(task.id), "progress": 10},
+        ),
+    }
+    label = f"cache ttl={cache_ttl:g}s"
+    for name, call in routes.items():
+        call()
+        counter.reset()
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - start)
+        print(f"{label:<16} {name:<24} {summarize(samples)} queries/request={counter.count / requests:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.requests, cache_ttl=0)
+    run(args.requests, cache_ttl=30)
+
+
+if __name__ == "__main__":
+    main()
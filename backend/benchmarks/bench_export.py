@@ -0,0 +1,88 @@
+"""Memory and throughput of the streaming task export.
+
+Seeds one project with ``--rows`` tasks in a file SQLite database, then
+encodes them with the NDJSON export encoder twice: once from the streaming
+``iter_by_project`` and once from a fully loaded ``list_by_project``. Each
+is timed, then run again under ``tracemalloc`` for its peak memory, which
+should stay flat for the stream as ``--rows`` grows while the list grows
+with the table. Pass ``--rows 5000000`` for the full-size check; seeding
+takes several minutes.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from app.api.routes.projects import _encode_ndjson
+from app.application.dtos.task_dtos import TaskOutput
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+from benchmarks._support import make_engine
+
+_NAMES = list(TaskOutput.__dataclass_fields__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{Path(directory) / 'export.db'}")
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Export", created_by=owner.id)
+        with factory() as session:
+            SqlAlchemyUserRepository(session).save(owner)
+            SqlAlchemyProjectRepository(session).save(project)
+            session.commit()
+        for start in range(0, args.rows, 50_000):
+            with factory() as session:
+                SqlAlchemyTaskRepository(session).add_many([
+                    Task.create(project_id=project.id, title=f"Task {i}")
+                    for i in range(start, min(start + 50_000, args.rows))
+                ])
+                session.commit()
+
+        def export(load) -> int:
+            size = 0
+            with factory() as session:
+                tasks = load(SqlAlchemyTaskRepository(session))
+                for chunk in _encode_ndjson((TaskOutput.from_domain(task) for task in tasks), _NAMES):
+                    size += len(chunk)
+            return size
+
+        for name, load in (
+            ("stream", lambda repository: repository.iter_by_project(project.id, args.batch_size)),
+            ("list", lambda repository: repository.list_by_project(project.id)),
+        ):
+            start = time.perf_counter()
+            size = export(load)
+            elapsed = time.perf_counter() - start
+            gc.collect()
+            tracemalloc.start()
+            export(load)
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name:<6} rows={args.rows} bytes={size / 1e6:.0f}MB "
+                f"rows/s={args.rows / elapsed:,.0f} peak={peak / 1024 / 1024:.1f}MiB"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
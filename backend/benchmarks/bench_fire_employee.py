@@ -0,0 +1,106 @@
+"""Firing a member who holds many tasks of a large project.
+
+The leaving member is assigned every ``--stride``-th task of a project of
+``--sizes`` tasks, half of them DOING. Two implementations are measured on a
+fresh database each:
+
+* ``per-row``: load every task of the project, then save each of the
+  member's tasks and its abandonment one at a time, as fire and resign did.
+* ``set-based``: ``FireEmployeeUseCase``, which releases the tasks with two
+  ``UPDATE ... RETURNING`` statements and inserts the abandonments in bulk.
+
+Both must leave the member with no tasks and one abandonment per released task.
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import func, select
+
+from app.application.use_cases.fire_employee import FireEmployeeUseCase
+from app.domain.models.enums import AbandonmentType, MemberLevel, TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.task_abandonment import TaskAbandonment
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId, UserId
+from app.infrastructure.persistence.models import TaskAbandonmentModel, TaskModel
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, timer
+
+
+def fire_per_row(uow, project_id: ProjectId, user_id: UserId) -> None:
+    with uow:
+        for task in uow.tasks.list_by_project(project_id):
+            if task.assigned_to != user_id:
+                continue
+            task.assigned_to = None
+            if task.status == TaskStatus.DOING:
+                task.transition_to(TaskStatus.TODO)
+            uow.tasks.save(task)
+            uow.task_abandonments.save(TaskAbandonment.create(
+                task_id=task.id,
+                user_id=user_id,
+                abandonment_type=AbandonmentType.FIRED_FROM_PROJECT,
+                note="employee_fired",
+            ))
+        uow.commit()
+
+
+def run(mode: str, size: int, stride: int) -> None:
+    engine = make_engine()
+    write = make_uow_factory(engine)
+    owner = User.create(email="owner@example.com", name="Owner")
+    leaver = User.create(email="leaver@example.com", name="Leaver")
+    project = Project.create(name="Fire", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(size)]
+    assigned = 0
+    for index, task in enumerate(tasks):
+        task.difficulty = 1
+        if index % stride == 0:
+            task.assigned_to = leaver.id
+            task.status = TaskStatus.DOING if assigned % 2 == 0 else TaskStatus.TODO
+            assigned += 1
+    with write() as uow:
+        uow.users.save(owner)
+        uow.users.save(leaver)
+        uow.projects.save(project)
+        uow.project_members.save(
+            ProjectMember.create_member(project.id, leaver.id, level=MemberLevel.MID, base_capacity=10)
+        )
+        uow.tasks.add_many(tasks)
+
+    counter = QueryCounter(engine)
+    uow = write()
+    with timer() as elapsed:
+        if mode == "set-based":
+            FireEmployeeUseCase(uow).execute(project.id, leaver.id)
+        else:
+            fire_per_row(uow, project.id, leaver.id)
+    queries = counter.count
+
+    with engine.connect() as connection:
+        remaining = connection.execute(
+            select(func.count()).where(TaskModel.assigned_to == leaver.id.value)
+        ).scalar()
+        abandonments = connection.execute(select(func.count()).select_from(TaskAbandonmentModel)).scalar()
+    assert remaining == 0 and abandonments == assigned
+    print(
+        f"{mode:<9} tasks={size:<6} released={assigned:<5} queries={queries:<6} "
+        f"time={elapsed[0] * 1000:8.1f}ms"
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 20000])
+    parser.add_argument("--stride", type=int, default=4)
+    args = parser.parse_args()
+    for size in args.sizes:
+        for mode in ("per-row", "set-based"):
+            run(mode, size, args.stride)
+
+
+if __name__ == "__main__":
+    main()
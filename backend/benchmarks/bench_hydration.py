@@ -0,0 +1,78 @@
+"""Time and memory to hydrate a large project's tasks.
+
+Seeds one project with ``--tasks`` tasks, then loads them through
+``SqlAlchemyTaskRepository.list_by_project`` and reports latency, rows per
+second, and the memory retained by the hydrated entities (``tracemalloc``,
+measured after the session is closed so ORM state is not counted).
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+from benchmarks._support import make_engine, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{Path(directory) / 'hydration.db'}")
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Hydration", created_by=owner.id)
+        with factory() as session:
+            SqlAlchemyUserRepository(session).save(owner)
+            SqlAlchemyProjectRepository(session).save(project)
+            repository = SqlAlchemyTaskRepository(session)
+            for i in range(args.tasks):
+                task = Task.create(project_id=project.id, title=f"Task {i}")
+                task.assigned_to = owner.id
+                task.expected_start_date = UtcDateTime.now()
+                task.expected_end_date = UtcDateTime.now()
+                repository.save(task)
+            session.commit()
+
+        samples = []
+        for _ in range(args.repeats):
+            with factory() as session, timer() as elapsed:
+                loaded = SqlAlchemyTaskRepository(session).list_by_project(project.id)
+            samples.extend(elapsed)
+            assert len(loaded) == args.tasks
+            del loaded
+
+        gc.collect()
+        tracemalloc.start()
+        with factory() as session:
+            loaded = SqlAlchemyTaskRepository(session).list_by_project(project.id)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        engine.dispose()
+
+    print(
+        f"hydrate {args.tasks} tasks: {summarize(samples)} rows/s={args.tasks / min(samples):.0f}\n"
+        f"retained={retained / 1024 / 1024:.1f}MiB ({retained / len(loaded):.0f} B/task) "
+        f"peak={peak / 1024 / 1024:.1f}MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Bulk task import: parse an NDJSON plan and import it in chunks.
+
+Builds a plan of N tasks where each task depends on the one before it,
+streams it through the import parser in 64 KiB chunks and runs the import
+use case against a file SQLite database. Prints parse and write times and
+rows per second; the target is 100k tasks in well under a minute.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import AsyncIterator
+
+from app.api.task_import import parse_task_import
+from app.application.dtos.task_dtos import ImportTasksInput
+from app.application.use_cases.import_tasks import IMPORT_CHUNK_SIZE, ImportTasksUseCase
+from app.domain.models.project import Project
+from app.domain.models.user import User
+from benchmarks._support import make_engine, make_uow_factory
+
+
+def _plan(size: int) -> bytes:
+    lines = [json.dumps({"type": "task", "ref": f"t{i}", "title": f"Task {i}"}) for i in range(size)]
+    lines += [json.dumps({"type": "dependency", "ref": f"t{i}", "depends_on": f"t{i - 1}"}) for i in range(1, size)]
+    return "\n".join(lines).encode()
+
+
+async def _chunks(body: bytes, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite+pysqlite:///{os.path.join(directory, 'import.db')}")
+        write = make_uow_factory(engine)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Import", created_by=owner.id)
+        with write() as uow:
+            uow.users.save(owner)
+            uow.projects.save(project)
+            uow.commit()
+        body = _plan(args.tasks)
+
+        start = time.perf_counter()
+        tasks, dependencies = asyncio.run(parse_task_import(_chunks(body), "application/x-ndjson"))
+        parsed = time.perf_counter()
+        uow = write()
+        output = ImportTasksUseCase(uow=uow, event_bus=uow.event_bus, chunk_size=args.chunk_size).execute(
+            ImportTasksInput(project_id=project.id, tasks=tasks, dependencies=dependencies)
+        )
+        done = time.perf_counter()
+        engine.dispose()
+
+    rows = len(output.task_ids) + output.dependencies
+    print(f"body={len(body) / 1e6:.1f} MB tasks={len(output.task_ids)} dependencies={output.dependencies}")
+    print(f"parse={parsed - start:.2f}s import={done - parsed:.2f}s total={done - start:.2f}s")
+    print(f"rows/s={rows / (done - parsed):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Keyset page latency at increasing depth.
+
+Seeds one project with ``--rows`` schedule history records and times a
+``--page-size`` page of ``page_project_history`` starting at several depths,
+next to the same page fetched with ``OFFSET``. Keyset pages should take the
+same time at any depth; offset pages grow with it.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.application.dtos.pagination import Cursor
+from app.domain.models.enums import ScheduleChangeReason
+from app.domain.models.project import Project
+from app.domain.models.project_schedule_history import ProjectScheduleHistory
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.persistence.models import ProjectScheduleHistoryModel
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyScheduleHistoryRepository,
+    SqlAlchemyUserRepository,
+)
+from benchmarks._support import make_engine, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{Path(directory) / 'pages.db'}")
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Pages", created_by=owner.id)
+        start = UtcDateTime()
+        with factory() as session:
+            SqlAlchemyUserRepository(session).save(owner)
+            SqlAlchemyProjectRepository(session).save(project)
+            history = SqlAlchemyScheduleHistoryRepository(session)
+            for i in range(args.rows):
+                item = ProjectScheduleHistory.create(
+                    project_id=project.id,
+                    previous_end=start,
+                    new_end=start,
+                    reason=ScheduleChangeReason.MANUAL_OVERRIDE,
+                )
+                item.created_at = UtcDateTime(start.value + timedelta(seconds=i))
+                history.save_project_history(item)
+            session.commit()
+
+        table = ProjectScheduleHistoryModel.__table__
+        for depth in (0, args.rows // 10, args.rows // 2, args.rows - args.page_size):
+            with factory() as session:
+                row = session.execute(
+                    select(table.c.created_at, table.c.id)
+                    .where(table.c.project_id == project.id.value)
+                    .order_by(table.c.created_at, table.c.id)
+                    .offset(depth - 1)
+                    .limit(1)
+                ).first() if depth else None
+                after = Cursor(UtcDateTime(row.created_at), row.id) if row else None
+                repository = SqlAlchemyScheduleHistoryRepository(session)
+                keyset, offset = [], []
+                for _ in range(args.repeats):
+                    with timer() as elapsed:
+                        page = repository.page_project_history(project.id, args.page_size, after)
+                    keyset.extend(elapsed)
+                    with timer() as elapsed:
+                        session.execute(
+                            select(*table.c)
+                            .where(table.c.project_id == project.id.value)
+                            .order_by(table.c.created_at, table.c.id)
+                            .offset(depth)
+                            .limit(args.page_size)
+                        ).all()
+                    offset.extend(elapsed)
+                assert len(page.items) == args.page_size
+            print(f"depth {depth:>6}: keyset {summarize(keyset)}  offset {summarize(offset)}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Throughput and file size of the Parquet analytics export.
+
+Seeds ``--tasks`` tasks with one report each into a file SQLite database,
+then exports ``tasks`` and ``task_reports`` with each compression codec and
+prints rows per second and bytes per row.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from app.domain.models.enums import ProgressSource
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.task_report import TaskReport
+from app.domain.models.user import User
+from app.infrastructure.analytics.parquet_export import export_analytics
+from app.infrastructure.persistence.models import TaskReportModel
+from benchmarks._support import make_engine, make_uow_factory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--compression", nargs="+", default=["none", "snappy", "zstd"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{Path(directory) / 'analytics.db'}")
+        write = make_uow_factory(engine)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Analytics", created_by=owner.id)
+        tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(args.tasks)]
+        with write() as uow:
+            uow.users.save(owner)
+            uow.projects.save(project)
+            uow.tasks.add_many(tasks)
+            uow.session.execute(insert(TaskReportModel), [
+                {
+                    "id": report.id.value,
+                    "task_id": report.task_id.value,
+                    "author_id": report.author_id.value,
+                    "progress": report.progress,
+                    "source": report.source,
+                    "note": report.note,
+                    "created_at": report.created_at.value,
+                }
+                for report in (
+                    TaskReport.create(task.id, owner.id, i % 100, ProgressSource.MANUAL, note="On track")
+                    for i, task in enumerate(tasks)
+                )
+            ])
+            uow.commit()
+
+        for compression in args.compression:
+            exports = export_analytics(
+                engine,
+                Path(directory) / compression,
+                tables=["tasks", "task_reports"],
+                batch_size=args.batch_size,
+                compression=compression,
+            )
+            for export in exports:
+                print(
+                    f"{compression:<7} {export.table:<13} rows={export.rows} "
+                    f"rows/s={export.rows_per_second:,.0f} bytes={export.bytes:,} "
+                    f"({export.bytes / export.rows:.1f} B/row)"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
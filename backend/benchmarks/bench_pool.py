@@ -0,0 +1,66 @@
+"""Pool sizing vs p99 latency under concurrent load.
+
+``--workers`` threads each run read transactions that hold their connection
+for ``--hold-ms`` (standing in for network round trips to a remote
+database). The run is repeated for several pool sizes and reports request
+latency together with the pool's own checkout-wait metrics.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.domain.models.user import User
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.pool import PoolSettings, pool_metrics
+from benchmarks._support import make_uow_factory, summarize, timer
+
+
+def run(url: str, pool: PoolSettings, workers: int, requests: int, hold_ms: float) -> None:
+    engine = create_db_engine(url, pool)
+    Base.metadata.create_all(engine)
+    factory = make_uow_factory(engine)
+    user = User.create(email="pool@example.com", name="Pool")
+    with factory() as uow:
+        uow.users.save(user)
+
+    def one_request() -> float:
+        with timer() as elapsed:
+            with factory() as uow:
+                uow.users.find_by_id(user.id)
+                uow.session.execute(text("SELECT 1"))
+                time.sleep(hold_ms / 1000)
+        return elapsed[0]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        samples = list(executor.map(lambda _i: one_request(), range(requests)))
+    metrics = pool_metrics(engine.pool)
+    print(
+        f"pool_size={pool.size:<3} overflow={pool.max_overflow:<3} {summarize(samples)} "
+        f"wait_p99={metrics['wait_p99_ms']:.2f}ms wait_max={metrics['wait_max_ms']:.2f}ms "
+        f"timeouts={metrics['timeouts']}"
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--hold-ms", type=float, default=2.0)
+    parser.add_argument("--sizes", default="2,5,10,20,40")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(value) for value in args.sizes.split(",")):
+            url = f"sqlite:///{Path(directory) / f'pool{size}.db'}"
+            run(url, PoolSettings(size=size, max_overflow=0), args.workers, args.requests, args.hold_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Project dashboard aggregates: scanning the tasks versus the summary row.
+
+For growing project sizes, compares computing the summary from
+``list_by_project`` against reading the maintained ``project_summaries`` row,
+and reports what maintaining the row adds to a single task save. The summary
+read should stay flat as the project grows.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.domain.models.enums import TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.project_summary import ProjectSummary
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, summarize, timer
+
+
+def _scan(uow, project_id) -> ProjectSummary:
+    summary = ProjectSummary(project_id)
+    for task in uow.tasks.list_by_project(project_id):
+        summary.add(task)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        engine = make_engine()
+        write = make_uow_factory(engine)
+        read = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Summary", created_by=owner.id)
+        tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(size)]
+        for i, task in enumerate(tasks):
+            task.difficulty = i % 8 + 1
+        with write() as uow:
+            uow.users.save(owner)
+            uow.projects.save(project)
+            uow.tasks.add_many(tasks)
+
+        for name, read_summary in (
+            ("scan", lambda uow: _scan(uow, project.id)),
+            ("summary", lambda uow: uow.project_summaries.get(project.id)),
+        ):
+            samples = []
+            for _ in range(args.repeats):
+                with timer() as elapsed, read() as uow:
+                    summary = read_summary(uow)
+                samples.extend(elapsed)
+            print(f"tasks={size:<6} {name:<8} todo={summary.status_counts[TaskStatus.TODO]:<6} {summarize(samples)}")
+
+        counter = QueryCounter(engine)
+        samples = []
+        for task in tasks[:args.repeats]:
+            task.transition_to(TaskStatus.DOING)
+            counter.reset()
+            with timer() as elapsed, write() as uow:
+                uow.tasks.save(task)
+            samples.extend(elapsed)
+        print(f"tasks={size:<6} save     queries={counter.count:<4} {summarize(samples)}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
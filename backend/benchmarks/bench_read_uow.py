@@ -0,0 +1,87 @@
+"""Per-request overhead of read endpoints.
+
+Runs the read routes with the read/write unit of work (commits every block)
+and with the read-only one (lazy repositories, rollback, ``READ ONLY``).
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Iterator
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api import dependencies
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+from app.main import create_app
+from benchmarks._support import QueryCounter, bearer_headers, make_engine, make_uow_factory, summarize, timer
+
+
+def run(requests: int, read_only: bool) -> None:
+    engine = make_engine()
+    queries = QueryCounter(engine)
+    commits = []
+    event.listen(engine, "commit", lambda *_args: commits.append(1))
+    write_factory = make_uow_factory(engine, request_scoped=True)
+    if read_only:
+        read_factory = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+    else:
+        read_factory = make_uow_factory(engine)
+
+    def override(factory):
+        def get_uow() -> Iterator[SqlAlchemyUnitOfWork]:
+            uow = factory()
+            try:
+                yield uow
+            finally:
+                uow.close()
+
+        return get_uow
+
+    manager = User.create(email="manager@example.com", name="Manager")
+    project = Project.create(name="Bench", created_by=manager.id)
+    with make_uow_factory(engine)() as uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+
+    app = create_app()
+    app.dependency_overrides[dependencies.get_unit_of_work] = override(write_factory)
+    app.dependency_overrides[dependencies.get_read_unit_of_work] = override(read_factory)
+    client = TestClient(app)
+    headers = bearer_headers(dependencies.jwt_service, manager)
+
+    label = "read-only" if read_only else "read/write"
+    routes = {
+        "get_project": f"/api/projects/{project.id}",
+        "list_team": f"/api/employees/{project.id}/team",
+    }
+    for name, path in routes.items():
+        client.get(path, headers=headers)
+        queries.reset()
+        commits.clear()
+        samples = []
+        for _ in range(requests):
+            with timer() as elapsed:
+                assert client.get(path, headers=headers).status_code == 200
+            samples.extend(elapsed)
+        print(
+            f"{label:<11} {name:<12} "
+            f"{summarize(samples)} queries={queries.count / requests:.2f} "
+            f"commits={len(commits) / requests:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    for read_only in (False, True):
+        run(args.requests, read_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Queries, connection checkouts and commits per request.
+
+Compares the per-block unit of work (a new session for every ``with`` block)
+with the request-scoped one, with cold and warm auth caches.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.api import dependencies
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.main import create_app
+from benchmarks._support import QueryCounter, bearer_headers, make_engine, make_uow_factory
+
+
+def run(requests: int, request_scoped: bool, warm: bool) -> None:
+    engine = make_engine()
+    queries = QueryCounter(engine)
+    checkouts = []
+    commits = []
+    event.listen(engine.pool, "checkout", lambda *_args: checkouts.append(1))
+    event.listen(engine, "commit", lambda *_args: commits.append(1))
+    factory = make_uow_factory(engine, request_scoped=request_scoped)
+
+    def get_uow_override() -> Iterator[SqlAlchemyUnitOfWork]:
+        uow = factory()
+        try:
+            yield uow
+        finally:
+            uow.close()
+
+    manager = User.create(email="manager@example.com", name="Manager")
+    project = Project.create(name="Bench", created_by=manager.id)
+    start = datetime.now(timezone.utc)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(requests + 1)]
+    with make_uow_factory(engine)() as uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        for task in tasks:
+            uow.tasks.save(task)
+
+    app = create_app()
+    app.dependency_overrides[dependencies.get_unit_of_work] = get_uow_override
+    client = TestClient(app)
+    headers = bearer_headers(dependencies.jwt_service, manager)
+    dependencies.user_cache.ttl_seconds = 30 if warm else 0
+
+    routes = {
+        "set_task_difficulty": lambda i: client.post(
+            "/api/tasks/difficulty/manual",
+            json={"task_id": str(tasks[i].id), "difficulty": 3},
+            headers=headers,
+        ),
+        "add_dependency": lambda i: client.post(
+            "/api/tasks/dependencies",
+            json={"task_id": str(tasks[i].id), "depends_on_id": str(tasks[i + 1].id)},
+            headers=headers,
+        ),
+        "manual_override": lambda i: client.post(
+            "/api/schedule/manual-override",
+            json={
+                "task_id": str(tasks[i].id),
+                "new_start_date": start.isoformat(),
+                "new_end_date": (start + timedelta(days=1)).isoformat(),
+            },
+            headers=headers,
+        ),
+    }
+    label = f"{'request-scoped' if request_scoped else 'per-block'} {'warm' if warm else 'cold'}"
+    for name, call in routes.items():
+        dependencies.user_cache.clear()
+        dependencies.project_access.clear()
+        call(0)
+        queries.reset()
+        checkouts.clear()
+        commits.clear()
+        for i in range(requests):
+            if not warm:
+                dependencies.project_access.clear()
+            assert call(i).status_code == 200
+        print(
+            f"{label:<20} {name:<20} queries={queries.count / requests:.2f} "
+            f"checkouts={len(checkouts) / requests:.2f} commits={len(commits) / requests:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    for warm in (False, True):
+        for request_scoped in (False, True):
+            run(args.requests, request_scoped, warm)
+
+
+if __name__ == "__main__":
+    main()
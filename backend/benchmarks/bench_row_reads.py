@@ -0,0 +1,86 @@
+"""Hydration throughput: ORM instances versus Core column rows.
+
+Seeds one project with ``--tasks`` tasks and hydrates them into domain
+``Task`` objects three ways: by loading ``TaskModel`` instances (the previous
+read path), by selecting Core rows with a plain ``select``, and through
+``SqlAlchemyTaskRepository.list_by_project`` (Core rows on the session's
+connection with a cached ``lambda_stmt``).
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId, UtcDateTime
+from app.infrastructure.persistence.models import TaskModel
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+from benchmarks._support import make_engine, summarize, timer
+
+
+def orm_instances(session: Session, project_id: ProjectId) -> List[Task]:
+    stmt = select(TaskModel).where(TaskModel.project_id == project_id.value)
+    return [SqlAlchemyTaskRepository._to_entity(model) for model in session.execute(stmt).scalars()]
+
+
+def core_rows(session: Session, project_id: ProjectId) -> List[Task]:
+    stmt = select(*TaskModel.__table__.c).where(TaskModel.project_id == project_id.value)
+    return [SqlAlchemyTaskRepository._to_entity(row) for row in session.execute(stmt)]
+
+
+def repository(session: Session, project_id: ProjectId) -> List[Task]:
+    return SqlAlchemyTaskRepository(session).list_by_project(project_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{Path(directory) / 'rows.db'}")
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Rows", created_by=owner.id)
+        with factory() as session:
+            SqlAlchemyUserRepository(session).save(owner)
+            SqlAlchemyProjectRepository(session).save(project)
+            tasks = SqlAlchemyTaskRepository(session)
+            for i in range(args.tasks):
+                task = Task.create(project_id=project.id, title=f"Task {i}")
+                task.assigned_to = owner.id
+                task.expected_start_date = UtcDateTime.now()
+                task.expected_end_date = UtcDateTime.now()
+                tasks.save(task)
+            session.commit()
+
+        paths: List[tuple[str, Callable[[Session, ProjectId], List[Task]]]] = [
+            ("orm instances", orm_instances),
+            ("core rows", core_rows),
+            ("list_by_project", repository),
+        ]
+        for name, load in paths:
+            samples = []
+            for _ in range(args.repeats):
+                with factory() as session, timer() as elapsed:
+                    loaded = load(session, project.id)
+                samples.extend(elapsed)
+                assert len(loaded) == args.tasks
+            print(f"{name:<16} {summarize(samples)} rows/s={args.tasks / min(samples):.0f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Concurrent schedule overrides under per-project and global serialization.
+
+``--threads`` threads each apply ``--writes`` manual date overrides to the
+task of one of ``--projects`` projects, on a pooled SQLite file (WAL,
+deferred transactions, so the database does not serialize writers itself).
+Three lock modes are compared:
+
+* ``none``: no lock. Overrides of the same task race, and the losers fail
+  their version check or the database lock.
+* ``global``: every schedule write takes the same key, as a process-wide lock
+  would.
+* ``project``: ``ProjectLocks`` keyed by project, as the application runs.
+
+``--hold-ms`` keeps each writer inside its critical section for that long
+before it touches the database, standing in for the round trips a server
+database adds while the lock is held. After each run every task's history
+must form one unbroken chain of end dates.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.application.dtos.schedule_dtos import ManualDateOverrideInput
+from app.application.use_cases.manual_date_override import ManualDateOverrideUseCase
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId, UtcDateTime
+from app.infrastructure.database import create_db_engine, create_session_factory
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.project_locks import ProjectLocks
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.sqlite_profile import SqliteProfile
+
+BASE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+_GLOBAL_KEY = ProjectId.trusted(UUID(int=0))
+
+
+class _BenchLocks(ProjectLocks):
+    def __init__(self, mode: str, hold: float):
+        super().__init__(timeout=60.0)
+        self.mode = mode
+        self.hold = hold
+
+    def acquire(self, session: Session, project_id: ProjectId) -> None:
+        if self.mode == "global":
+            super().acquire(session, _GLOBAL_KEY)
+        elif self.mode == "project":
+            super().acquire(session, project_id)
+        time.sleep(self.hold)
+
+
+def run(path: Path, mode: str, threads: int, project_count: int, writes: int, hold: float) -> None:
+    engine = create_db_engine(f"sqlite:///{path}", sqlite_profile=SqliteProfile())
+    Base.metadata.create_all(engine)
+    session_factory = create_session_factory(engine)
+    locks = _BenchLocks(mode, hold)
+
+    def make_uow() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(
+            session_factory,
+            InMemoryEventBus(),
+            MockEmailService(),
+            SimpleLlmService(api_url=None, api_key=None),
+            project_locks=locks,
+        )
+
+    owner = User.create(email="owner@example.com", name="Owner")
+    tasks = []
+    with make_uow() as uow:
+        uow.users.save(owner)
+        for index in range(project_count):
+            project = Project.create(name=f"Proj {index}", created_by=owner.id)
+            task = Task.create(project_id=project.id, title=f"Task {index}")
+            task.expected_start_date = UtcDateTime(BASE - timedelta(days=1))
+            task.expected_end_date = UtcDateTime(BASE)
+            uow.projects.save(project)
+            uow.tasks.save(task)
+            tasks.append(task)
+        uow.commit()
+
+    def override(worker: int) -> int:
+        task = tasks[worker % project_count]
+        use_case = ManualDateOverrideUseCase(uow=make_uow())
+        failed = 0
+        for write in range(writes):
+            new_end = BASE + timedelta(hours=worker * writes + write + 1)
+            try:
+                use_case.execute(ManualDateOverrideInput(
+                    task_id=task.id,
+                    new_start_date=UtcDateTime(new_end - timedelta(days=1)),
+                    new_end_date=UtcDateTime(new_end),
+                ))
+            except (ConcurrencyConflict, OperationalError):
+                failed += 1
+        return failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        failed = sum(executor.map(override, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    broken = 0
+    with make_uow() as uow:
+        for task in tasks:
+            by_previous = {item.previous_end.value: item for item in uow.schedule_history.list_task_history(task.id)}
+            end = BASE
+            while end in by_previous:
+                end = by_previous.pop(end).new_end.value
+            broken += len(by_previous) + (end != uow.tasks.find_by_id(task.id).expected_end_date.value)
+    metrics = locks.metrics.snapshot()
+    print(
+        f"{mode:<8} projects={project_count:<3} writes/s={(threads * writes - failed) / elapsed:7.0f} "
+        f"failed={failed:<4} broken_chains={broken} lock_wait_avg_ms={metrics['wait_avg_ms']:.1f} "
+        f"p99_ms={metrics['wait_p99_ms']:.1f}"
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=20)
+    parser.add_argument("--projects", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--hold-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("none", "global", "project"):
+            for project_count in args.projects:
+                run(
+                    Path(directory) / f"{mode}-{project_count}.db",
+                    mode,
+                    args.threads,
+                    project_count,
+                    args.writes,
+                    args.hold_ms / 1000,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Concurrent selection of the same tasks by many members.
+
+``--selectors`` threads, each a different MID member, try to take one of
+``--tasks`` tasks at the same moment on a production-profile SQLite file.
+Two shapes are measured:
+
+* ``select``: ``SelectTaskUseCase``, which reads and writes in one
+  transaction. The first selector of a task wins, and the others fail its
+  status check.
+* ``read-then-write``: each client reads the task in one transaction and
+  assigns it in a later one, like a GET followed by a POST. Without version
+  checks every client "succeeds" and all but the last assignment are lost.
+  With them, one client per task wins and the rest get ``ConcurrencyConflict``.
+
+After each run, every task must be assigned to exactly one winner, with one
+assignment history row, and the member workload counters must reconcile.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.application.dtos.task_dtos import SelectTaskInput
+from app.application.use_cases.select_task import SelectTaskUseCase
+from app.domain.exceptions import BusinessRuleViolation, ConcurrencyConflict
+from app.domain.models.enums import MemberLevel, TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.task_assignment_history import TaskAssignmentHistory
+from app.domain.models.user import User
+from app.infrastructure.database import create_db_router
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.reconcile_member_workloads import reconcile_member_workloads
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.sqlite_profile import SqliteProfile
+
+
+def run(path: Path, shape: str, selectors: int, task_count: int) -> None:
+    router = create_db_router(f"sqlite:///{path}", sqlite_profile=SqliteProfile())
+    Base.metadata.create_all(router.primary)
+    event_bus = InMemoryEventBus()
+
+    def make_uow() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(
+            router.session_factory,
+            event_bus,
+            MockEmailService(),
+            SimpleLlmService(api_url=None, api_key=None),
+        )
+
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Contention", created_by=owner.id)
+    users = [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(selectors)]
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(task_count)]
+    for task in tasks:
+        task.difficulty = 1
+    with make_uow() as uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        for user in users:
+            uow.users.save(user)
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        uow.tasks.add_many(tasks)
+        uow.commit()
+
+    barrier = threading.Barrier(selectors)
+
+    def select(index: int) -> str:
+        user, task = users[index], tasks[index % task_count]
+        try:
+            if shape == "select":
+                barrier.wait()
+                uow = make_uow()
+                SelectTaskUseCase(uow, event_bus).execute(SelectTaskInput(task_id=task.id, user_id=user.id))
+                return "ok"
+            uow = make_uow()
+            with uow:
+                loaded = uow.tasks.find_by_id(task.id)
+            barrier.wait()
+            loaded.assigned_to = user.id
+            if loaded.status == TaskStatus.TODO:
+                loaded.transition_to(TaskStatus.DOING)
+            with uow:
+                uow.tasks.save(loaded)
+                uow.task_assignment_history.save(
+                    TaskAssignmentHistory.create(task_id=task.id, user_id=user.id, assignment_reason="select_task")
+                )
+                uow.commit()
+            return "ok"
+        except ConcurrencyConflict:
+            return "conflict"
+        except BusinessRuleViolation:
+            return "rejected"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=selectors) as executor:
+        outcomes = list(executor.map(select, range(selectors)))
+    elapsed = time.perf_counter() - start
+
+    lost = 0
+    with make_uow() as uow:
+        for task in tasks:
+            stored = uow.tasks.find_by_id(task.id)
+            winners = {history.user_id for history in uow.task_assignment_history.list_by_task(task.id)}
+            if len(winners) != 1 or stored.assigned_to not in winners:
+                lost += max(len(winners) - 1, 0) or 1
+    drifted = len(reconcile_member_workloads(router.primary, project.id))
+    counts = Counter(outcomes)
+    print(
+        f"{shape:<15} selectors={selectors} tasks={task_count} attempts/s={selectors / elapsed:.0f} "
+        f"ok={counts['ok']} conflict={counts['conflict']} rejected={counts['rejected']} "
+        f"lost_assignments={lost} drifted_counters={drifted}"
+    )
+    router.primary.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--selectors", type=int, default=100)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1, 10])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for shape in ("select", "read-then-write"):
+            for task_count in args.tasks:
+                run(Path(directory) / f"{shape}-{task_count}.db", shape, args.selectors, task_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Task selection cost as the project grows.
+
+``SelectTaskUseCase`` checks the member's capacity before assigning a task.
+The check reads the member's ``member_workloads`` row, so select latency and
+query count should stay flat from ``--sizes`` 1k to 50k tasks.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.application.dtos.task_dtos import SelectTaskInput
+from app.application.use_cases.select_task import SelectTaskUseCase
+from app.domain.models.enums import MemberLevel
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--selects", type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        engine = make_engine()
+        write = make_uow_factory(engine)
+        owner = User.create(email="owner@example.com", name="Owner")
+        project = Project.create(name="Select", created_by=owner.id)
+        workers = [User.create(email=f"worker{i}@example.com", name=f"Worker {i}") for i in range(args.selects)]
+        tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(size)]
+        for task in tasks:
+            task.difficulty = 1
+        with write() as uow:
+            uow.users.save(owner)
+            uow.projects.save(project)
+            for worker in workers:
+                uow.users.save(worker)
+                uow.project_members.save(
+                    ProjectMember.create_member(project.id, worker.id, level=MemberLevel.MID, base_capacity=10)
+                )
+            uow.tasks.add_many(tasks)
+
+        counter = QueryCounter(engine)
+        samples = []
+        for task, worker in zip(tasks, workers):
+            uow = write()
+            counter.reset()
+            with timer() as elapsed:
+                SelectTaskUseCase(uow, uow.event_bus).execute(SelectTaskInput(task_id=task.id, user_id=worker.id))
+            samples.extend(elapsed)
+        print(f"tasks={size:<6} select queries={counter.count:<3} {summarize(samples)}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Loading a project board: per-resource calls versus one snapshot.
+
+Seeds a project with ``--members`` members and ``--tasks`` tasks chained by
+dependencies, then loads the board the way the frontend did (project, team,
+dependencies per task, workload per member) and through
+``GetProjectSnapshotUseCase``. Reports SQL statements and latency for each.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.application.use_cases.get_employee_workload import GetEmployeeWorkloadUseCase
+from app.application.use_cases.get_project import GetProjectUseCase
+from app.application.use_cases.get_project_snapshot import GetProjectSnapshotUseCase
+from app.application.use_cases.list_team import ListTeamUseCase
+from app.domain.models.enums import MemberLevel
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.task_dependency import TaskDependency
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, summarize, timer
+
+
+def load_per_resource(uow, project_id: ProjectId) -> None:
+    GetProjectUseCase(uow).execute(project_id)
+    team = ListTeamUseCase(uow).execute(project_id, limit=1000).items
+    with uow:
+        for task in uow.tasks.list_by_project(project_id):
+            uow.task_dependencies.list_by_task(task.id)
+    for member in team:
+        GetEmployeeWorkloadUseCase(uow).execute(project_id, member.user_id)
+
+
+def load_snapshot(uow, project_id: ProjectId) -> None:
+    GetProjectSnapshotUseCase(uow).execute(project_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    queries = QueryCounter(engine)
+    write = make_uow_factory(engine)
+    read = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+
+    manager = User.create(email="manager@example.com", name="Manager")
+    project = Project.create(name="Board", created_by=manager.id)
+    with write() as uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+        for i in range(args.members - 1):
+            user = User.create(email=f"user{i}@example.com", name=f"User {i}")
+            uow.users.save(user)
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(args.tasks)]
+        for task in tasks:
+            uow.tasks.save(task)
+        for previous, task in zip(tasks, tasks[1:]):
+            uow.task_dependencies.save(TaskDependency.create(task.id, previous.id))
+
+    for name, load in (("per-resource", load_per_resource), ("snapshot", load_snapshot)):
+        samples = []
+        for _ in range(args.repeats):
+            queries.reset()
+            with timer() as elapsed:
+                load(read(), project.id)
+            samples.extend(elapsed)
+        print(f"{name:<13} queries={queries.count:<5} {summarize(samples)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""SQLite write throughput under concurrent clients.
+
+Compares the plain engine (default pragmas, pooled writers, deferred
+transactions) with the production profile (WAL, single writer connection,
+``BEGIN IMMEDIATE``). Each client runs a read-then-write transaction, the
+shape that trips ``database is locked`` on the plain engine.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+
+from app.domain.models.user import User
+from app.infrastructure.database import create_db_router
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.sqlite_profile import SqliteProfile
+from benchmarks._support import summarize, timer
+
+
+def run(directory: Path, profile: SqliteProfile | None, clients: int, writes: int) -> None:
+    label = "production" if profile else "plain"
+    router = create_db_router(f"sqlite:///{directory / f'{label}.db'}", sqlite_profile=profile)
+    Base.metadata.create_all(router.primary)
+    event_bus = InMemoryEventBus()
+    email_service = MockEmailService()
+    llm_service = SimpleLlmService(api_url=None, api_key=None)
+    errors = []
+
+    def write(index: int) -> float:
+        with timer() as elapsed:
+            try:
+                with SqlAlchemyUnitOfWork(router.session_factory, event_bus, email_service, llm_service) as uow:
+                    uow.users.find_by_email(f"user{index}@example.com")
+                    uow.users.save(User.create(email=f"user{index}@example.com", name=f"User {index}"))
+            except OperationalError:
+                errors.append(index)
+        return elapsed[0]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        samples = list(executor.map(write, range(writes)))
+    elapsed = time.perf_counter() - start
+    committed = writes - len(errors)
+    print(
+        f"{label:<11} clients={clients} commits/s={committed / elapsed:.0f} "
+        f"{summarize(samples)} failed={len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--writes", type=int, default=2000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in (None, SqliteProfile()):
+            run(Path(directory), profile, args.clients, args.writes)
+
+
+if __name__ == "__main__":
+    main()
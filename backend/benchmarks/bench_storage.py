@@ -0,0 +1,83 @@
+"""Table/index size and hydration speed per storage mode.
+
+Seeds one project with ``--tasks`` tasks into a SQLite file in each storage
+mode, then reports the on-disk size of the tasks table and its indexes (from
+``dbstat``) and the time to hydrate the project's tasks through the
+repository.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+from app.infrastructure.persistence.types import STORAGE_MODES
+from benchmarks._support import summarize, timer
+
+
+def run(directory: Path, mode: str, tasks: int, repeats: int) -> None:
+    engine = create_db_engine(f"sqlite:///{directory / f'{mode}.db'}", storage_mode=mode)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Storage", created_by=owner.id)
+    with factory() as session:
+        SqlAlchemyUserRepository(session).save(owner)
+        SqlAlchemyProjectRepository(session).save(project)
+        repository = SqlAlchemyTaskRepository(session)
+        for i in range(tasks):
+            task = Task.create(project_id=project.id, title=f"Task {i}")
+            task.assigned_to = owner.id
+            task.expected_start_date = UtcDateTime.now()
+            task.expected_end_date = UtcDateTime.now()
+            repository.save(task)
+        session.commit()
+
+    with engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
+        sizes = dict(connection.execute(text(
+            "SELECT d.name, SUM(d.pgsize) FROM dbstat AS d JOIN sqlite_master AS m ON m.name = d.name "
+            "WHERE m.tbl_name = 'tasks' GROUP BY d.name"
+        )).all())
+    table_size = sizes.pop("tasks", 0)
+    index_size = sum(sizes.values())
+
+    samples = []
+    for _ in range(repeats):
+        with factory() as session, timer() as elapsed:
+            loaded = SqlAlchemyTaskRepository(session).list_by_project(project.id)
+        samples.extend(elapsed)
+        assert len(loaded) == tasks
+    print(
+        f"{mode:<8} table={table_size / 1024:.0f}KiB indexes={index_size / 1024:.0f}KiB "
+        f"hydrate {tasks} tasks: {summarize(samples)} rows/s={tasks / min(samples):.0f}"
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in STORAGE_MODES:
+            run(Path(directory), mode, args.tasks, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Team workload: per-member calls versus one grouped aggregate.
+
+Seeds a project with ``--members`` members and ``--tasks`` tasks (a quarter
+of them DOING, spread across the members), then compares
+``GetEmployeeWorkloadUseCase`` called for every member against
+``GetTeamWorkloadUseCase``. The per-member path loads every task on each
+call, so only ``--sample`` members are timed and the total is extrapolated.
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.application.use_cases.get_employee_workload import GetEmployeeWorkloadUseCase
+from app.application.use_cases.get_team_workload import GetTeamWorkloadUseCase
+from app.domain.models.enums import MemberLevel, TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork
+from benchmarks._support import QueryCounter, make_engine, make_uow_factory, summarize, timer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    write = make_uow_factory(engine)
+    read = make_uow_factory(engine, uow_class=SqlAlchemyReadOnlyUnitOfWork, read_only=True)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Team", created_by=owner.id)
+    users = [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(args.members)]
+    tasks = []
+    for i in range(args.tasks):
+        task = Task.create(project_id=project.id, title=f"Task {i}")
+        task.difficulty = i % 5 + 1
+        task.assigned_to = users[i % args.members].id
+        task.status = TaskStatus.DOING if i % 4 == 0 else TaskStatus.TODO
+        tasks.append(task)
+    with write() as uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        for user in users:
+            uow.users.save(user)
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        uow.tasks.add_many(tasks)
+
+    counter = QueryCounter(engine)
+    samples = []
+    for user in users[:args.sample]:
+        with timer() as elapsed:
+            GetEmployeeWorkloadUseCase(read()).execute(project.id, user.id)
+        samples.extend(elapsed)
+    per_member = sum(samples) / len(samples)
+    print(
+        f"members={args.members} tasks={args.tasks} per-member  {summarize(samples)} "
+        f"-> team of {args.members} ~{per_member * args.members:.1f}s, {counter.count // len(samples)} queries/member"
+    )
+
+    samples = []
+    for _ in range(args.repeats):
+        counter.reset()
+        with timer() as elapsed:
+            workloads = GetTeamWorkloadUseCase(read()).execute(project.id)
+        samples.extend(elapsed)
+    print(
+        f"members={args.members} tasks={args.tasks} team        {summarize(samples)} "
+        f"rows={len(workloads)} queries={counter.count}"
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
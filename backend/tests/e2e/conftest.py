@@ -1,14 +1,12 @@
 """E2E test fixtures."""
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from typing import AsyncIterator, Iterator, Tuple
 from uuid import UUID
 
 import pytest
 from fastapi import Depends, Request
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.api import dependencies
 from app.domain.models.user import User
@@ -17,37 +15,96 @@ from app.infrastructure.email.email_service import MockEmailService
 from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 from app.infrastructure.llm.llm_service import SimpleLlmService
 from app.infrastructure.persistence.models import Base
-from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.database import (
+    create_async_db_engine,
+    create_async_session_factory,
+    create_db_engine,
+    create_session_factory,
+)
+from app.infrastructure.persistence.async_uow import (
+    AsyncSqlAlchemyReadOnlyUnitOfWork,
+    AsyncSqlAlchemyUnitOfWork,
+)
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
 from app.main import create_app
 
 
 @pytest.fixture(scope="function")
-def client() -> Tuple[TestClient, User, User]:
-    """Create a test client with dependency overrides."""
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        future=True,
-    )
+def client(tmp_path) -> Tuple[TestClient, User, User]:
+    """Create a test client with dependency overrides.
+
+    The database is a file so the sync and async engines share it.
+    """
+    database_url = f"sqlite:///{tmp_path / 'e2e.db'}"
+    engine = create_db_engine(database_url)
     Base.metadata.create_all(engine)
     session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    read_session_factory = create_session_factory(engine, read_only=True)
+    async_engine = create_async_db_engine(database_url)
+    async_session_factory = create_async_session_factory(async_engine)
+    async_read_session_factory = create_async_session_factory(async_engine, read_only=True)
 
     event_bus = InMemoryEventBus()
     email_service = MockEmailService()
     llm_service = SimpleLlmService(api_url=None, api_key=None)
 
-    def get_uow_override() -> SqlAlchemyUnitOfWork:
+    def make_uow(request_scoped: bool = False) -> SqlAlchemyUnitOfWork:
         return SqlAlchemyUnitOfWork(
             session_factory=session_factory,
             event_bus=event_bus,
             email_service=email_service,
             llm_service=llm_service,
+            request_scoped=request_scoped,
         )
 
+    def get_uow_override() -> Iterator[SqlAlchemyUnitOfWork]:
+        uow = make_uow(request_scoped=True)
+        try:
+            yield uow
+        finally:
+            uow.close()
+
+    def get_read_uow_override() -> Iterator[SqlAlchemyReadOnlyUnitOfWork]:
+        uow = SqlAlchemyReadOnlyUnitOfWork(
+            session_factory=read_session_factory,
+            event_bus=event_bus,
+            email_service=email_service,
+            llm_service=llm_service,
+        )
+        try:
+            yield uow
+        finally:
+            uow.close()
+
+    async def get_async_uow_override() -> AsyncIterator[AsyncSqlAlchemyUnitOfWork]:
+        uow = AsyncSqlAlchemyUnitOfWork(
+            session_factory=async_session_factory,
+            event_bus=event_bus,
+            email_service=email_service,
+            llm_service=llm_service,
+            request_scoped=True,
+        )
+        try:
+            yield uow
+        finally:
+            await uow.close()
+
+    async def get_async_read_uow_override() -> AsyncIterator[AsyncSqlAlchemyReadOnlyUnitOfWork]:
+        uow = AsyncSqlAlchemyReadOnlyUnitOfWork(
+            session_factory=async_read_session_factory,
+            event_bus=event_bus,
+            email_service=email_service,
+            llm_service=llm_service,
+            request_scoped=True,
+        )
+        try:
+            yield uow
+        finally:
+            await uow.close()
+
     manager = User(id=UserId(), email="manager@example.com", name="Manager")
     worker = User(id=UserId(), email="worker@example.com", name="Worker")
-    with get_uow_override() as uow:
+    with make_uow() as uow:
         uow.users.save(manager)
         uow.users.save(worker)
         uow.commit()
@@ -61,8 +118,19 @@ def client() -> Tuple[TestClient, User, User]:
         with uow:
             return uow.users.find_by_id(user_id)
 
+    async def get_current_user_async_override(
+        request: Request,
+        uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_uow_override),
+    ) -> User:
+        header = request.headers.get("X-User", "manager")
+        return await uow.users.find_by_id(manager.id if header == "manager" else worker.id)
+
     app = create_app()
     app.dependency_overrides[dependencies.get_unit_of_work] = get_uow_override
+    app.dependency_overrides[dependencies.get_read_unit_of_work] = get_read_uow_override
     app.dependency_overrides[dependencies.get_current_user] = get_current_user_override
+    app.dependency_overrides[dependencies.get_async_unit_of_work] = get_async_uow_override
+    app.dependency_overrides[dependencies.get_async_read_unit_of_work] = get_async_read_uow_override
+    app.dependency_overrides[dependencies.get_current_user_async] = get_current_user_async_override
 
     return TestClient(app), manager, worker
@@ -1,6 +1,12 @@
 """E2E tests for API endpoints."""
+import csv
+import io
+import json
 from datetime import datetime, timedelta, timezone
 
+from app.api.routes import tasks as task_routes
+from app.domain.exceptions import ConcurrencyConflict
+
 
 def test_auth_endpoints(client):
     """Register, login, and verify."""
@@ -32,3 +38,227 @@ def test_me_endpoint(client):
     response = test_client.get("/api/me", headers={"X-User": "manager"})
     assert response.status_code == 200
     assert response.json()["email"] == manager.email
+
+
+def test_team_is_paginated(client):
+    """Team pages follow the opaque cursor; a bad cursor is a 400."""
+    test_client, _manager, _worker = client
+    response = test_client.post("/api/projects/", json={"name": "Paged"}, headers={"X-User": "manager"})
+    project_id = response.json()["id"]
+    response = test_client.post(
+        f"/api/invites/project/{project_id}",
+        json={"email": "worker@example.com"},
+        headers={"X-User": "manager"},
+    )
+    test_client.post("/api/invites/accept", json={
+        "token": response.json()["token"],
+        "level": "mid",
+        "base_capacity": 10,
+    }, headers={"X-User": "worker"})
+
+    first = test_client.get(f"/api/employees/{project_id}/team?limit=1").json()
+    second = test_client.get(
+        f"/api/employees/{project_id}/team", params={"limit": 1, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert len(first["items"]) == 1
+    assert len(second["items"]) == 1
+    assert first["items"][0]["id"] != second["items"][0]["id"]
+    assert second["next_cursor"] is None
+
+    response = test_client.get(f"/api/employees/{project_id}/team", params={"cursor": "bogus"})
+    assert response.status_code == 400
+    assert response.json()["code"] == "invalid_cursor"
+
+
+def test_project_snapshot_supports_etag(client):
+    """Snapshot returns the board and 304 until the board changes."""
+    test_client, _manager, _worker = client
+    response = test_client.post("/api/projects/", json={"name": "Board"}, headers={"X-User": "manager"})
+    project_id = response.json()["id"]
+
+    response = test_client.get(f"/api/projects/{project_id}/snapshot")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["project"]["name"] == "Board"
+    assert len(body["members"]) == len(body["workloads"]) == 1
+    assert body["tasks"] == body["dependencies"] == body["roles"] == []
+    etag = response.headers["etag"]
+
+    response = test_client.get(f"/api/projects/{project_id}/snapshot", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    test_client.post("/api/tasks/", json={"project_id": project_id, "title": "New"})
+    response = test_client.get(f"/api/projects/{project_id}/snapshot", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [task["title"] for task in response.json()["tasks"]] == ["New"]
+
+
+def test_batch_get_tasks(client):
+    """Batch get returns found tasks in request order and lists missing IDs."""
+    test_client, _manager, _worker = client
+    response = test_client.post("/api/projects/", json={"name": "Batch"}, headers={"X-User": "manager"})
+    project_id = response.json()["id"]
+    ids = [
+        test_client.post("/api/tasks/", json={"project_id": project_id, "title": f"Task {i}"}).json()["id"]
+        for i in range(3)
+    ]
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    response = test_client.post("/api/tasks/batch-get", json={"ids": [ids[2], missing, ids[0]]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [ids[2], ids[0]]
+    assert body["items"][0]["title"] == "Task 2"
+    assert body["missing"] == [missing]
+
+
+def test_import_tasks_from_ndjson_and_csv(client):
+    """Manager imports tasks and dependency edges from NDJSON and CSV bodies."""
+    test_client, _manager, _worker = client
+    response = test_client.post("/api/projects/", json={"name": "Import"}, headers={"X-User": "manager"})
+    project_id = response.json()["id"]
+    ndjson = "\n".join(json.dumps(record) for record in [
+        {"type": "task", "ref": "design", "title": "Design", "difficulty": 3},
+        {"type": "task", "ref": "build", "title": "Build"},
+        {"type": "dependency", "ref": "build", "depends_on": "design"},
+    ])
+
+    response = test_client.post(
+        f"/api/projects/{project_id}/tasks/import",
+        content=ndjson,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["tasks"]) == {"design", "build"}
+    assert body["dependencies"] == 1
+
+    csv_body = (
+        "type,ref,title,description,role_id,difficulty,depends_on\r\n"
+        'task,a,"Write, review",,,,\r\n'
+        "task,b,Ship,,,,\r\n"
+        "dependency,a,,,,,b\r\n"
+        "dependency,b,,,,,a\r\n"
+    )
+    response = test_client.post(
+        f"/api/projects/{project_id}/tasks/import",
+        content=csv_body,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == "dependency_cycle"
+
+    snapshot = test_client.get(f"/api/projects/{project_id}/snapshot").json()
+    assert sorted(task["title"] for task in snapshot["tasks"]) == ["Build", "Design"]
+    assert snapshot["dependencies"][0]["task_id"] == body["tasks"]["build"]
+
+
+def test_import_tasks_requires_manager(client):
+    """Workers cannot import into a project."""
+    test_client, _manager, _worker = client
+    project_id = test_client.post("/api/projects/", json={"name": "Import"}).json()["id"]
+
+    response = test_client.post(
+        f"/api/projects/{project_id}/tasks/import",
+        content='{"type": "task", "ref": "a", "title": "A"}',
+        headers={"Content-Type": "application/x-ndjson", "X-User": "worker"},
+    )
+
+    assert response.status_code in (403, 404)
+
+
+def test_export_tasks_as_ndjson_and_csv(client):
+    """Exports stream every task of the project as NDJSON or CSV."""
+    test_client, _manager, _worker = client
+    project_id = test_client.post("/api/projects/", json={"name": "Export"}).json()["id"]
+    ids = {
+        test_client.post("/api/tasks/", json={"project_id": project_id, "title": f"Task, {i}"}).json()["id"]
+        for i in range(3)
+    }
+
+    response = test_client.get(f"/api/projects/{project_id}/export/tasks")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert {row["id"] for row in rows} == ids
+    assert rows[0]["status"] == "todo"
+
+    response = test_client.get(f"/api/projects/{project_id}/export/tasks", params={"format": "csv"})
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert {row["id"] for row in rows} == ids
+    assert {row["title"] for row in rows} == {"Task, 0", "Task, 1", "Task, 2"}
+
+    response = test_client.get(f"/api/projects/{project_id}/export/task_reports", params={"format": "csv"})
+    assert response.text.startswith("id,task_id,author_id,progress")
+    assert len(response.text.splitlines()) == 1
+
+
+def test_project_summary_tracks_task_writes(client):
+    """The summary endpoint reflects task creation, difficulty and cancellation."""
+    test_client, _manager, _worker = client
+    project_id = test_client.post("/api/projects/", json={"name": "Summary"}).json()["id"]
+    first, second = (
+        test_client.post("/api/tasks/", json={"project_id": project_id, "title": title}).json()["id"]
+        for title in ("First", "Second")
+    )
+    test_client.post("/api/tasks/difficulty/manual", json={"task_id": first, "difficulty": 5})
+    test_client.post(f"/api/tasks/{second}/cancel")
+
+    response = test_client.get(f"/api/projects/{project_id}/summary")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["task_count"] == 2
+    assert body["status_counts"]["todo"] == 1
+    assert body["status_counts"]["cancelled"] == 1
+    assert body["total_difficulty"] == 5
+    assert body["delayed_count"] == 0
+
+
+def test_project_changes_since_cursor(client):
+    """Polling from a cursor returns only what changed, with dependency tombstones."""
+    test_client, _manager, _worker = client
+    project_id = test_client.post("/api/projects/", json={"name": "Delta"}).json()["id"]
+    first, second = (
+        test_client.post("/api/tasks/", json={"project_id": project_id, "title": title}).json()["id"]
+        for title in ("First", "Second")
+    )
+
+    body = test_client.get(f"/api/projects/{project_id}/changes").json()
+    assert {task["id"] for task in body["tasks"]} == {first, second}
+    assert len(body["members"]) == 1
+    cursor = body["next_since"]
+
+    edge = {"task_id": second, "depends_on_id": first}
+    test_client.post("/api/tasks/dependencies", json=edge)
+    body = test_client.get(f"/api/projects/{project_id}/changes", params={"since": cursor}).json()
+    assert body["tasks"] == []
+    assert body["dependencies"] == [edge]
+
+    test_client.request("DELETE", "/api/tasks/dependencies", json=edge)
+    body = test_client.get(f"/api/projects/{project_id}/changes", params={"since": body["next_since"]}).json()
+    assert body["dependencies"] == []
+    assert body["deleted_dependencies"] == [edge]
+    assert body["has_more"] is False
+
+
+def test_concurrency_conflict_returns_409(client, monkeypatch):
+    """A write that lost a version race is reported as 409 with its code."""
+    test_client, _manager, _worker = client
+    project_id = test_client.post("/api/projects/", json={"name": "Race"}).json()["id"]
+    task_id = test_client.post("/api/tasks/", json={"project_id": project_id, "title": "Task"}).json()["id"]
+
+    def conflict(_self, _input_dto):
+        raise ConcurrencyConflict("Task was modified concurrently; reload and retry")
+
+    monkeypatch.setattr(task_routes.SetTaskDifficultyManualUseCase, "execute", conflict)
+    response = test_client.post("/api/tasks/difficulty/manual", json={"task_id": task_id, "difficulty": 3})
+    assert response.status_code == 409
+    assert response.json()["code"] == "concurrency_conflict"
@@ -0,0 +1,122 @@
+"""E2E tests for JWT verification across middleware and dependencies."""
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import dependencies
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.auth.jwt_service import JwtService
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.main import create_app
+
+
+def make_client():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    def get_uow_override() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(
+            session_factory=session_factory,
+            event_bus=InMemoryEventBus(),
+            email_service=MockEmailService(),
+            llm_service=SimpleLlmService(api_url=None, api_key=None),
+        )
+
+    user = User.create(email="jwt@example.com", name="Jwt")
+    with get_uow_override() as uow:
+        uow.users.save(user)
+
+    app = create_app()
+    app.dependency_overrides[dependencies.get_unit_of_work] = get_uow_override
+    return TestClient(app), user, engine
+
+
+def bearer(user: User) -> dict:
+    expires_at = UtcDateTime(datetime.now(timezone.utc) + timedelta(hours=1))
+    token = dependencies.jwt_service.create_token(str(user.id), expires_at)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_token_is_verified_once_per_request(monkeypatch):
+    """Middleware claims are reused by get_current_user."""
+    client, user, _engine = make_client()
+    dependencies.jwt_service.cache.clear()
+    headers = bearer(user)
+    calls = []
+    original = JwtService._decode
+
+    def counting_decode(self, value):
+        calls.append(value)
+        return original(self, value)
+
+    monkeypatch.setattr(JwtService, "_decode", counting_decode)
+
+    response = client.get("/api/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == "jwt@example.com"
+    assert len(calls) == 1
+
+    response = client.get("/api/me", headers=headers)
+    assert response.status_code == 200
+    assert len(calls) == 1
+
+
+def test_invalid_token_is_rejected():
+    """Bad tokens get a 401 from the middleware."""
+    client, _user, _engine = make_client()
+
+    response = client.get("/api/me", headers={"Authorization": "Bearer not-a-token"})
+
+    assert response.status_code == 401
+
+
+def test_missing_token_is_rejected():
+    """Requests without a bearer token are unauthorized."""
+    client, _user, _engine = make_client()
+
+    response = client.get("/api/me")
+
+    assert response.status_code == 401
+
+
+def test_cached_user_skips_database():
+    """Repeat requests resolve the current user without SQL."""
+    client, user, engine = make_client()
+    headers = bearer(user)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert client.get("/api/me", headers=headers).status_code == 200
+    assert len(statements) == 1
+
+    assert client.get("/api/me", headers=headers).status_code == 200
+    assert len(statements) == 1
+
+
+def test_user_cache_is_invalidated_on_save():
+    """Saving a user through the repository drops its cache entry."""
+    client, user, _engine = make_client()
+    headers = bearer(user)
+    assert client.get("/api/me", headers=headers).json()["name"] == "Jwt"
+
+    uow = client.app.dependency_overrides[dependencies.get_unit_of_work]()
+    uow.user_cache = dependencies.user_cache
+    with uow:
+        user.name = "Renamed"
+        uow.users.save(user)
+
+    assert client.get("/api/me", headers=headers).json()["name"] == "Renamed"
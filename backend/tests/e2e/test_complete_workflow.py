@@ -3,7 +3,7 @@
 
 def test_complete_workflow(client):
     """Manager creates project, worker completes task."""
-    test_client, _manager, _worker = client
+    test_client, _manager, worker = client
 
     # Create project
     response = test_client.post("/api/projects/", json={
@@ -58,6 +58,23 @@ def test_complete_workflow(client):
     response = test_client.post(f"/api/tasks/{task_id}/select", headers={"X-User": "worker"})
     assert response.status_code == 200
 
+    # Team and workload reflect the assignment
+    response = test_client.get(f"/api/employees/{project_id}/team", headers={"X-User": "manager"})
+    assert response.status_code == 200
+    assert str(worker.id) in {member["user_id"] for member in response.json()["items"]}
+
+    response = test_client.get(
+        f"/api/employees/{project_id}/workload/{worker.id}",
+        headers={"X-User": "manager"},
+    )
+    assert response.status_code == 200
+    assert response.json()["workload_score"] > 0
+
+    response = test_client.get(f"/api/employees/{project_id}/workload", headers={"X-User": "manager"})
+    assert response.status_code == 200
+    scores = {item["user_id"]: item["workload_score"] for item in response.json()["items"]}
+    assert scores[str(worker.id)] == 3
+
     # Complete task
     response = test_client.post(f"/api/tasks/{task_id}/complete", headers={"X-User": "worker"})
     assert response.status_code == 200
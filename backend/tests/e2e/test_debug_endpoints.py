@@ -0,0 +1,39 @@
+"""E2E tests for debug endpoints."""
+import pytest
+
+from app.config import settings
+
+
+@pytest.fixture
+def debug_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "debug_endpoints", True)
+
+
+def test_pool_metrics_endpoint(debug_enabled, client):
+    """The pool endpoint reports metrics for the primary engine."""
+    test_client, _manager, _worker = client
+
+    response = test_client.get("/api/debug/pool", headers={"X-User": "manager"})
+
+    assert response.status_code == 200
+    assert "primary" in response.json()
+    assert "replicas" in response.json()
+
+
+def test_lock_metrics_endpoint(debug_enabled, client):
+    """The locks endpoint reports project lock wait times."""
+    test_client, _manager, _worker = client
+
+    response = test_client.get("/api/debug/locks", headers={"X-User": "manager"})
+
+    assert response.status_code == 200
+    assert {"acquisitions", "timeouts", "wait_max_ms"} <= response.json()["project_locks"].keys()
+
+
+def test_debug_endpoints_are_off_by_default(client):
+    """Debug routes are not mounted unless enabled."""
+    test_client, _manager, _worker = client
+
+    response = test_client.get("/api/debug/pool", headers={"X-User": "manager"})
+
+    assert response.status_code == 404
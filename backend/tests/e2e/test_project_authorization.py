@@ -0,0 +1,117 @@
+"""E2E tests for manager-only and member-only routes."""
+from uuid import uuid4
+
+import pytest
+
+
+def create_project(test_client) -> str:
+    response = test_client.post("/api/projects/", json={"name": "Auth"}, headers={"X-User": "manager"})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def join_project(test_client, project_id: str) -> None:
+    response = test_client.post(
+        f"/api/invites/project/{project_id}",
+        json={"email": "worker@example.com"},
+        headers={"X-User": "manager"},
+    )
+    test_client.post("/api/invites/accept", json={
+        "token": response.json()["token"],
+        "level": "mid",
+        "base_capacity": 10,
+    }, headers={"X-User": "worker"})
+
+
+MEMBER_READS = [
+    "/api/projects/{project_id}/snapshot",
+    "/api/projects/{project_id}/export/tasks",
+    "/api/projects/{project_id}/changes",
+    "/api/projects/{project_id}/summary",
+    "/api/employees/{project_id}/workload",
+]
+
+
+@pytest.mark.parametrize("path", MEMBER_READS)
+def test_project_reads_require_membership(client, path):
+    """Project data is only readable by its members: 403 before joining, 200 after."""
+    test_client, _manager, _worker = client
+    project_id = create_project(test_client)
+
+    assert test_client.get(path.format(project_id=project_id), headers={"X-User": "worker"}).status_code == 403
+    assert test_client.get(path.format(project_id=uuid4()), headers={"X-User": "worker"}).status_code == 404
+    join_project(test_client, project_id)
+    assert test_client.get(path.format(project_id=project_id), headers={"X-User": "worker"}).status_code == 200
+
+
+def test_batch_get_hides_tasks_of_other_projects(client):
+    """Tasks of projects the caller does not belong to are reported as missing."""
+    test_client, _manager, _worker = client
+    project_id = create_project(test_client)
+    task_id = test_client.post("/api/tasks/", json={"project_id": project_id, "title": "Task"}).json()["id"]
+
+    body = test_client.post("/api/tasks/batch-get", json={"ids": [task_id]}, headers={"X-User": "worker"}).json()
+    assert body == {"items": [], "missing": [task_id]}
+    join_project(test_client, project_id)
+    body = test_client.post("/api/tasks/batch-get", json={"ids": [task_id]}, headers={"X-User": "worker"}).json()
+    assert [item["id"] for item in body["items"]] == [task_id]
+
+
+def test_non_manager_gets_403(client):
+    """Workers cannot use manager-only project routes."""
+    test_client, _manager, _worker = client
+    project_id = create_project(test_client)
+
+    response = test_client.post(
+        f"/api/projects/{project_id}/roles",
+        json={"name": "Engineer"},
+        headers={"X-User": "worker"},
+    )
+
+    assert response.status_code == 403
+
+
+def test_unknown_project_gets_404(client):
+    """Manager checks on unknown projects return 404."""
+    test_client, _manager, _worker = client
+
+    response = test_client.post(
+        f"/api/projects/{uuid4()}/roles",
+        json={"name": "Engineer"},
+        headers={"X-User": "manager"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_task_routes_check_task_project(client):
+    """Task-scoped manager routes resolve the project from the task."""
+    test_client, _manager, _worker = client
+    project_id = create_project(test_client)
+    response = test_client.post(
+        "/api/tasks/",
+        json={"project_id": project_id, "title": "Task"},
+        headers={"X-User": "manager"},
+    )
+    task_id = response.json()["id"]
+
+    response = test_client.post(
+        "/api/tasks/difficulty/manual",
+        json={"task_id": task_id, "difficulty": 3},
+        headers={"X-User": "worker"},
+    )
+    assert response.status_code == 403
+
+    response = test_client.post(
+        "/api/tasks/difficulty/manual",
+        json={"task_id": str(uuid4()), "difficulty": 3},
+        headers={"X-User": "manager"},
+    )
+    assert response.status_code == 404
+
+    response = test_client.post(
+        "/api/tasks/difficulty/manual",
+        json={"task_id": task_id, "difficulty": 3},
+        headers={"X-User": "manager"},
+    )
+    assert response.status_code == 200
@@ -5,16 +5,18 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.types import STORAGE_MODES, set_storage_mode
 
 
-@pytest.fixture(scope="function")
-def session_factory():
-    """Create an in-memory SQLite session factory."""
+@pytest.fixture(scope="function", params=STORAGE_MODES)
+def session_factory(request):
+    """Create an in-memory SQLite session factory for each storage mode."""
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         future=True,
     )
+    set_storage_mode(engine, request.param)
     Base.metadata.create_all(engine)
     return sessionmaker(bind=engine, expire_on_commit=False)
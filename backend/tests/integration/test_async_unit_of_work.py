@@ -0,0 +1,92 @@
+"""Integration tests for AsyncSqlAlchemyUnitOfWork."""
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.application.use_cases.list_team import ListTeamUseCase
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.user import User
+from app.infrastructure.database import (
+    create_async_db_engine,
+    create_async_session_factory,
+    create_db_engine,
+)
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.async_uow import (
+    AsyncSqlAlchemyReadOnlyUnitOfWork,
+    AsyncSqlAlchemyUnitOfWork,
+)
+from app.infrastructure.persistence.models import Base
+
+
+@pytest.fixture
+async def async_engine(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    Base.metadata.create_all(create_db_engine(url))
+    engine = create_async_db_engine(url)
+    yield engine
+    await engine.dispose()
+
+
+def make_uow(engine, uow_class=AsyncSqlAlchemyUnitOfWork, read_only=False, **kwargs):
+    return uow_class(
+        session_factory=create_async_session_factory(engine, read_only=read_only),
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+        **kwargs,
+    )
+
+
+async def test_repository_methods_are_awaitable(async_engine):
+    """Repository calls go through the async session."""
+    user = User.create(email="async@example.com", name="Async")
+
+    async with make_uow(async_engine) as uow:
+        await uow.users.save(user)
+
+    async with make_uow(async_engine) as uow:
+        found = await uow.users.find_by_id(user.id)
+    assert found is not None
+    assert found.email == "async@example.com"
+
+
+async def test_run_executes_sync_use_case(async_engine):
+    """Synchronous use cases run unchanged inside the async transaction."""
+    manager = User.create(email="manager@example.com", name="Manager")
+    project = Project.create(name="Async", created_by=manager.id)
+    async with make_uow(async_engine) as uow:
+        await uow.users.save(manager)
+        await uow.projects.save(project)
+        await uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+
+    uow = make_uow(async_engine, request_scoped=True)
+    page = await uow.run(lambda sync_uow: ListTeamUseCase(uow=sync_uow).execute(project.id))
+    await uow.close()
+
+    assert [member.user_id for member in page.items] == [manager.id]
+
+
+async def test_request_scoped_close_discards_uncommitted(async_engine):
+    """Work that was never committed is dropped when the request ends."""
+    user = User.create(email="dropped@example.com", name="Dropped")
+    uow = make_uow(async_engine, request_scoped=True)
+    await uow.users.save(user)
+    await uow.close()
+
+    async with make_uow(async_engine) as check:
+        assert await check.users.find_by_id(user.id) is None
+
+
+async def test_read_only_uow_rejects_writes(async_engine):
+    """Writes through a read-only async session fail in the database."""
+    uow = make_uow(async_engine, AsyncSqlAlchemyReadOnlyUnitOfWork, read_only=True)
+
+    with pytest.raises(OperationalError):
+        async with uow:
+            await uow.run(lambda sync_uow: (
+                sync_uow.users.save(User.create(email="ro@example.com", name="RO")),
+                sync_uow.session.flush(),
+            ))
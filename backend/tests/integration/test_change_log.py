@@ -0,0 +1,90 @@
+"""Integration tests for the change log behind delta sync."""
+from app.application.use_cases.list_project_changes import ListProjectChangesUseCase
+from app.domain.models.enums import ChangeEntity
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.task_dependency import TaskDependency
+from app.domain.models.user import User
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def test_writes_are_logged_per_project_in_order(session_factory):
+    """Task, member and dependency writes append change rows with growing seq."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    other = Project.create(name="Other", created_by=owner.id)
+    first = Task.create(project_id=project.id, title="First")
+    second = Task.create(project_id=project.id, title="Second")
+    member = ProjectMember.create_manager(project.id, owner.id)
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.projects.save(other)
+        uow.tasks.add_many([first, second])
+        uow.tasks.save(Task.create(project_id=other.id, title="Elsewhere"))
+        uow.project_members.save(member)
+        uow.task_dependencies.save(TaskDependency.create(second.id, first.id))
+        uow.task_dependencies.delete(second.id, first.id)
+        uow.task_dependencies.delete(second.id, first.id)
+        uow.commit()
+
+    with uow:
+        entries = uow.change_log.list_since(project.id, 0, 100)
+        tail = uow.change_log.list_since(project.id, entries[2].seq, 100)
+
+    assert [(entry.entity, entry.entity_id, entry.deleted) for entry in entries] == [
+        (ChangeEntity.TASK, first.id.value, False),
+        (ChangeEntity.TASK, second.id.value, False),
+        (ChangeEntity.MEMBER, member.id.value, False),
+        (ChangeEntity.DEPENDENCY, second.id.value, False),
+        (ChangeEntity.DEPENDENCY, second.id.value, True),
+    ]
+    assert entries[-1].related_id == first.id.value
+    assert [entry.seq for entry in entries] == sorted(entry.seq for entry in entries)
+    assert tail == entries[3:]
+
+
+def test_changes_since_cursor_return_current_state(session_factory):
+    """Only rows changed after the cursor come back, in their latest state."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(10)]
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many(tasks)
+        uow.commit()
+    cursor = ListProjectChangesUseCase(uow).execute(project.id).next_since
+
+    tasks[3].title = "Renamed"
+    with uow:
+        uow.tasks.save(tasks[3])
+        uow.tasks.save(tasks[3])
+        uow.task_dependencies.save(TaskDependency.create(tasks[3].id, tasks[4].id))
+        uow.commit()
+    changes = ListProjectChangesUseCase(uow).execute(project.id, since=cursor)
+
+    assert [task.title for task in changes.tasks] == ["Renamed"]
+    assert [(edge.task_id, edge.depends_on_id) for edge in changes.dependencies] == [(tasks[3].id, tasks[4].id)]
+    assert changes.deleted_dependencies == []
+    assert changes.has_more is False
+
+    page = ListProjectChangesUseCase(uow).execute(project.id, since=cursor, limit=2)
+    assert page.has_more is True
+    assert ListProjectChangesUseCase(uow).execute(project.id, since=page.next_since).tasks == []
@@ -0,0 +1,116 @@
+"""Integration tests for DatabaseRouter with SQLite file databases."""
+from sqlalchemy import text
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.database import DatabaseRouter, create_db_engine
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyProjectSummaryRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_engine(path):
+    engine = create_db_engine(f"sqlite:///{path}")
+    if path.parent.exists():
+        Base.metadata.create_all(engine)
+    return engine
+
+
+def make_router(tmp_path, clock, replica_paths=("replica0.db", "replica1.db")):
+    return DatabaseRouter(
+        make_engine(tmp_path / "primary.db"),
+        [make_engine(tmp_path / path) for path in replica_paths],
+        read_your_writes_seconds=5,
+        retry_seconds=30,
+        clock=clock,
+    )
+
+
+def bound_engine(factory):
+    return factory.kw["bind"]
+
+
+def test_reads_rotate_over_replicas(tmp_path):
+    """Reads without a sticky key go round-robin over the replicas."""
+    router = make_router(tmp_path, FakeClock())
+
+    picked = [bound_engine(router.read_session_factory()) for _ in range(4)]
+
+    assert picked == [router.replicas[0], router.replicas[1], router.replicas[0], router.replicas[1]]
+
+
+def test_recent_writer_reads_from_primary(tmp_path):
+    """A key that committed a write reads from the primary for the window."""
+    clock = FakeClock()
+    router = make_router(tmp_path, clock)
+
+    with router.session_factory(info={"sticky_key": "reader"}) as session:
+        session.execute(text("SELECT 1"))
+        session.commit()
+    with router.session_factory(info={"sticky_key": "writer"}) as session:
+        SqlAlchemyUserRepository(session).save(User.create(email="rw@example.com", name="RW"))
+        session.commit()
+
+    assert bound_engine(router.read_session_factory("reader")) in router.replicas
+    assert bound_engine(router.read_session_factory("writer")) is router.primary
+    clock.now += 5
+    assert bound_engine(router.read_session_factory("writer")) in router.replicas
+
+
+def test_core_statement_writes_keep_reads_on_primary(tmp_path):
+    """Bulk inserts and summary rebuilds bypass the flush but still pin the writer."""
+    router = make_router(tmp_path, FakeClock())
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    with router.session_factory() as session:
+        SqlAlchemyUserRepository(session).save(owner)
+        SqlAlchemyProjectRepository(session).save(project)
+        session.commit()
+
+    with router.session_factory(info={"sticky_key": "importer"}) as session:
+        SqlAlchemyTaskRepository(session).add_many([Task.create(project_id=project.id, title="Imported")])
+        session.commit()
+    with router.session_factory(info={"sticky_key": "rebuilder"}) as session:
+        SqlAlchemyProjectSummaryRepository(session).rebuild(project.id)
+        session.commit()
+
+    assert bound_engine(router.read_session_factory("importer")) is router.primary
+    assert bound_engine(router.read_session_factory("rebuilder")) is router.primary
+
+
+def test_unreachable_replica_is_skipped_until_it_recovers(tmp_path):
+    """A replica that fails its probe is skipped for the retry window."""
+    clock = FakeClock()
+    router = make_router(tmp_path, clock, ("replica0.db", "down/replica1.db"))
+    healthy, broken = router.replicas
+
+    assert router.check_health() == {healthy: True, broken: False}
+    assert {bound_engine(router.read_session_factory()) for _ in range(4)} == {healthy}
+
+    (tmp_path / "down").mkdir()
+    assert {bound_engine(router.read_session_factory()) for _ in range(4)} == {healthy}
+    clock.now += 30
+    assert {bound_engine(router.read_session_factory()) for _ in range(4)} == {healthy, broken}
+    assert router.is_healthy(broken)
+
+
+def test_all_replicas_down_falls_back_to_primary(tmp_path):
+    """Reads go to the primary when no replica is usable."""
+    router = make_router(tmp_path, FakeClock(), ("down/replica0.db",))
+
+    router.check_health()
+
+    assert bound_engine(router.read_session_factory()) is router.primary
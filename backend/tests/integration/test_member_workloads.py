@@ -0,0 +1,139 @@
+"""Integration tests for the maintained member workload counters."""
+from sqlalchemy import update
+
+from app.application.dtos.task_dtos import AbandonTaskInput, SelectTaskInput, SetTaskDifficultyInput
+from app.application.use_cases.abandon_task import AbandonTaskUseCase
+from app.application.use_cases.cancel_task import CancelTaskUseCase
+from app.application.use_cases.complete_task import CompleteTaskUseCase
+from app.application.use_cases.fire_employee import FireEmployeeUseCase
+from app.application.use_cases.remove_from_task import RemoveFromTaskUseCase
+from app.application.use_cases.resign_from_project import ResignFromProjectUseCase
+from app.application.use_cases.select_task import SelectTaskUseCase
+from app.application.use_cases.set_task_difficulty_manual import SetTaskDifficultyManualUseCase
+from app.domain.models.enums import AbandonmentType, MemberLevel
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence import repositories
+from app.infrastructure.persistence.models import MemberWorkloadModel, TaskModel
+from app.infrastructure.persistence.reconcile_member_workloads import reconcile_member_workloads
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def seed_project(uow, workers, tasks):
+    """Save a project with ``workers`` MID members and ``tasks`` tasks of difficulty 2."""
+    manager = User.create(email="manager@example.com", name="Manager")
+    users = [User.create(email=f"worker{i}@example.com", name=f"Worker {i}") for i in range(workers)]
+    project = Project.create(name="Proj", created_by=manager.id)
+    items = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(tasks)]
+    for task in items:
+        task.difficulty = 2
+    with uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+        for user in users:
+            uow.users.save(user)
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        uow.tasks.add_many(items)
+        uow.commit()
+    return project, users, items
+
+
+def test_counters_follow_every_workload_change(session_factory):
+    """Select, difficulty, complete, abandon, remove, cancel, fire and resign keep counters exact."""
+    uow = make_uow(session_factory)
+    project, (first, second), tasks = seed_project(uow, workers=2, tasks=8)
+    engine = session_factory.kw["bind"]
+
+    def score(user):
+        with uow:
+            return uow.member_workloads.get_doing_difficulty(project.id, user.id)
+
+    def select(task, user):
+        SelectTaskUseCase(uow, uow.event_bus).execute(SelectTaskInput(task_id=task.id, user_id=user.id))
+
+    for task in tasks[:5]:
+        select(task, first)
+    for task in tasks[5:]:
+        select(task, second)
+    assert (score(first), score(second)) == (10, 6)
+
+    SetTaskDifficultyManualUseCase(uow).execute(SetTaskDifficultyInput(task_id=tasks[0].id, difficulty=5))
+    assert score(first) == 13
+    CompleteTaskUseCase(uow, uow.event_bus).execute(tasks[0].id)
+    assert score(first) == 8
+    AbandonTaskUseCase(uow, uow.event_bus).execute(AbandonTaskInput(
+        task_id=tasks[1].id,
+        user_id=first.id,
+        abandonment_type=AbandonmentType.VOLUNTARY,
+    ))
+    assert score(first) == 6
+    RemoveFromTaskUseCase(uow).execute(tasks[2].id, first.id)
+    assert score(first) == 4
+    CancelTaskUseCase(uow).execute(tasks[3].id)
+    assert score(first) == 2
+    assert reconcile_member_workloads(engine) == []
+
+    FireEmployeeUseCase(uow).execute(project.id, first.id)
+    ResignFromProjectUseCase(uow).execute(project.id, second.id)
+    assert (score(first), score(second)) == (0, 0)
+    assert reconcile_member_workloads(engine) == []
+
+
+def test_reconcile_reports_and_repairs_drift(session_factory):
+    """Counters changed behind the repository's back are reported, then repaired."""
+    uow = make_uow(session_factory)
+    project, (worker,), tasks = seed_project(uow, workers=1, tasks=2)
+    SelectTaskUseCase(uow, uow.event_bus).execute(SelectTaskInput(task_id=tasks[0].id, user_id=worker.id))
+    engine = session_factory.kw["bind"]
+    with session_factory() as session, session.begin():
+        session.execute(update(MemberWorkloadModel).values(doing_difficulty=7))
+
+    drifts = reconcile_member_workloads(engine, project.id)
+    assert [(drift.user_id, drift.stored, drift.actual) for drift in drifts] == [(worker.id, 7, 2)]
+    assert reconcile_member_workloads(engine, project.id, repair=True) == drifts
+    assert reconcile_member_workloads(engine, project.id) == []
+    with uow:
+        assert uow.member_workloads.get_doing_difficulty(project.id, worker.id) == 2
+
+
+def test_repair_keeps_task_writes_committed_after_the_drift_was_read(session_factory, monkeypatch):
+    """A task write landing between the drift read and the repair is not overwritten."""
+    uow = make_uow(session_factory)
+    project, (worker,), tasks = seed_project(uow, workers=1, tasks=2)
+    SelectTaskUseCase(uow, uow.event_bus).execute(SelectTaskInput(task_id=tasks[0].id, user_id=worker.id))
+    engine = session_factory.kw["bind"]
+    with session_factory() as session, session.begin():
+        session.execute(update(MemberWorkloadModel).values(doing_difficulty=7))
+    add = repositories._add_member_workloads
+
+    def add_after_concurrent_write(session, deltas):
+        session.execute(update(TaskModel).where(TaskModel.id == tasks[0].id.value).values(difficulty=5))
+        session.execute(update(MemberWorkloadModel).values(doing_difficulty=MemberWorkloadModel.doing_difficulty + 3))
+        add(session, deltas)
+
+    monkeypatch.setattr(repositories, "_add_member_workloads", add_after_concurrent_write)
+    drifts = reconcile_member_workloads(engine, project.id, repair=True)
+    monkeypatch.undo()
+
+    assert [(drift.stored, drift.actual) for drift in drifts] == [(7, 2)]
+    assert reconcile_member_workloads(engine, project.id) == []
+    with uow:
+        assert uow.member_workloads.get_doing_difficulty(project.id, worker.id) == 5
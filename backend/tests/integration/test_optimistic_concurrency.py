@@ -0,0 +1,111 @@
+"""Integration tests for version checks on task and project writes."""
+import pytest
+from sqlalchemy import update
+
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UserId
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import TaskModel
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def seed_task(uow):
+    """Save a project with one task."""
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    task = Task.create(project_id=project.id, title="Task")
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.save(task)
+        uow.commit()
+    return project, task
+
+
+def test_stale_task_write_is_rejected(session_factory):
+    """A task read before another write landed cannot overwrite it."""
+    uow = make_uow(session_factory)
+    _project, task = seed_task(uow)
+    with uow:
+        first = uow.tasks.find_by_id(task.id)
+    with uow:
+        second = uow.tasks.find_by_id(task.id)
+
+    first.assigned_to = UserId()
+    with uow:
+        uow.tasks.save(first)
+        uow.commit()
+    second.assigned_to = UserId()
+    with pytest.raises(ConcurrencyConflict), uow:
+        uow.tasks.save(second)
+        uow.commit()
+
+    with uow:
+        stored = uow.tasks.find_by_id(task.id)
+    assert stored.assigned_to == first.assigned_to
+    assert stored.version == 1
+
+
+def test_task_changed_after_read_in_same_transaction_is_rejected(session_factory):
+    """The update only matches the row at the version that was read."""
+    uow = make_uow(session_factory)
+    _project, task = seed_task(uow)
+    with pytest.raises(ConcurrencyConflict), uow:
+        loaded = uow.tasks.find_by_id(task.id)
+        uow.session.connection().execute(
+            update(TaskModel).where(TaskModel.id == task.id.value).values(version=TaskModel.version + 1)
+        )
+        loaded.title = "Lost"
+        uow.tasks.save(loaded)
+
+
+def test_repeated_saves_in_one_unit_of_work_advance_the_version(session_factory):
+    """Saving the same entity twice in one transaction is not a conflict."""
+    uow = make_uow(session_factory)
+    project, task = seed_task(uow)
+    with uow:
+        loaded = uow.tasks.find_by_id(task.id)
+        loaded.title = "Renamed"
+        uow.tasks.save(loaded)
+        loaded.description = "Described"
+        uow.tasks.save(loaded)
+        stored_project = uow.projects.find_by_id(project.id)
+        stored_project.name = "Renamed"
+        uow.projects.save(stored_project)
+        uow.commit()
+
+    with uow:
+        assert uow.tasks.find_by_id(task.id).version == 2
+        assert uow.projects.find_by_id(project.id).version == 1
+
+
+def test_stale_project_write_is_rejected(session_factory):
+    """Projects get the same check as tasks."""
+    uow = make_uow(session_factory)
+    project, _task = seed_task(uow)
+    with uow:
+        first = uow.projects.find_by_id(project.id)
+    with uow:
+        second = uow.projects.find_by_id(project.id)
+    first.name = "First"
+    with uow:
+        uow.projects.save(first)
+        uow.commit()
+    second.name = "Second"
+    with pytest.raises(ConcurrencyConflict), uow:
+        uow.projects.save(second)
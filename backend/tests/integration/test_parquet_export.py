@@ -0,0 +1,87 @@
+"""Integration tests for the Parquet analytics export."""
+from datetime import timedelta
+
+import pytest
+
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+pq = pytest.importorskip("pyarrow.parquet")
+parquet_export = pytest.importorskip("app.infrastructure.analytics.parquet_export")
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def test_export_writes_batches_and_increments(session_factory, tmp_path):
+    """A full export writes every row; an incremental one only newer rows."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(5)]
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many(tasks)
+        uow.commit()
+    engine = session_factory.kw["bind"]
+
+    exports = parquet_export.export_analytics(engine, tmp_path, tables=["tasks", "projects"], batch_size=2)
+
+    assert [(export.table, export.rows) for export in exports] == [("tasks", 5), ("projects", 1)]
+    table = pq.read_table(tmp_path / "tasks")
+    assert sorted(table.column("id").to_pylist()) == sorted(str(task.id) for task in tasks)
+    assert set(table.column("status").to_pylist()) == {"todo"}
+    assert table.schema.field("created_at").type.tz == "UTC"
+
+    later = Task.create(project_id=project.id, title="Later")
+    later.created_at = UtcDateTime(max(task.created_at.value for task in tasks) + timedelta(seconds=1))
+    with uow:
+        uow.tasks.add_many([later])
+        uow.commit()
+
+    exports = parquet_export.export_analytics(engine, tmp_path, incremental=True, tables=["tasks", "projects"])
+
+    assert [(export.table, export.rows) for export in exports] == [("tasks", 1), ("projects", 0)]
+    assert pq.read_table(tmp_path / "tasks" / "part-00001.parquet").column("title").to_pylist() == ["Later"]
+    assert pq.read_table(tmp_path / "tasks").num_rows == 6
+
+
+def test_increment_keeps_rows_stamped_at_the_watermark(session_factory, tmp_path):
+    """A row committed after a run with the watermark's timestamp is exported once."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    first, late = (Task.create(project_id=project.id, title=title) for title in ("First", "Late"))
+    late.created_at = first.created_at
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many([first])
+        uow.commit()
+    engine = session_factory.kw["bind"]
+    parquet_export.export_analytics(engine, tmp_path, tables=["tasks"], batch_size=1)
+
+    with uow:
+        uow.tasks.add_many([late])
+        uow.commit()
+    (export,) = parquet_export.export_analytics(engine, tmp_path, incremental=True, tables=["tasks"])
+    assert export.rows == 1
+    (export,) = parquet_export.export_analytics(engine, tmp_path, incremental=True, tables=["tasks"])
+    assert export.rows == 0
+
+    assert sorted(pq.read_table(tmp_path / "tasks").column("title").to_pylist()) == ["First", "Late"]
+    assert export.watermark_keys == {(str(first.id),), (str(late.id),)}
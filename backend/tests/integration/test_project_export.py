@@ -0,0 +1,75 @@
+"""Integration tests for streaming project exports."""
+from sqlalchemy import event
+
+from app.application.dtos.export_dtos import ExportDataset, ExportInput
+from app.application.use_cases.export_project_data import ExportProjectDataUseCase
+from app.domain.models.enums import ProgressSource, ScheduleChangeReason
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.task_assignment_history import TaskAssignmentHistory
+from app.domain.models.task_report import TaskReport
+from app.domain.models.task_schedule_history import TaskScheduleHistory
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def test_export_streams_each_dataset_with_yield_per(session_factory):
+    """Every dataset is read from one cursor in batches, scoped to the project."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    other = Project.create(name="Other", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(5)]
+    now = UtcDateTime.now()
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.projects.save(other)
+        uow.tasks.add_many(tasks + [Task.create(project_id=other.id, title="Elsewhere")])
+        for task in tasks:
+            uow.schedule_history.save_task_history(TaskScheduleHistory.create(
+                task_id=task.id,
+                previous_start=now,
+                previous_end=now,
+                new_start=now,
+                new_end=now,
+                reason=ScheduleChangeReason.MANUAL_OVERRIDE,
+            ))
+            uow.task_assignment_history.save(TaskAssignmentHistory.create(task_id=task.id, user_id=owner.id))
+            uow.task_reports.save(TaskReport.create(
+                task_id=task.id, author_id=owner.id, progress=10, source=ProgressSource.MANUAL,
+            ))
+        uow.commit()
+
+    batch_sizes = []
+    event.listen(
+        session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda _conn, _cursor, _statement, _params, context, _many: batch_sizes.append(
+            context.execution_options.get("yield_per")
+        ),
+    )
+    for dataset in ExportDataset:
+        batch_sizes.clear()
+        rows = list(ExportProjectDataUseCase(uow).execute(
+            ExportInput(project_id=project.id, dataset=dataset, batch_size=2)
+        ))
+
+        exported = {row.id if dataset is ExportDataset.TASKS else row.task_id for row in rows}
+        assert len(rows) == 5
+        assert exported == {task.id for task in tasks}
+        assert batch_sizes[-1] == 2
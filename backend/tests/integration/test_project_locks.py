@@ -0,0 +1,180 @@
+"""Integration tests for per-project serialization of schedule writes."""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.application.dtos.schedule_dtos import ManualDateOverrideInput, UpdateProjectDateInput
+from app.application.use_cases.manual_date_override import ManualDateOverrideUseCase
+from app.application.use_cases.update_project_date import UpdateProjectDateUseCase
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.enums import ScheduleChangeReason
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.database import create_db_engine, create_session_factory
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.project_locks import ProjectLocks
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.sqlite_profile import SqliteProfile
+
+BASE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+THREADS_PER_PROJECT = 4
+WRITES_PER_THREAD = 5
+
+
+def make_session_factory(tmp_path):
+    """Create a pooled SQLite file database shared by many threads."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'locks.db'}", sqlite_profile=SqliteProfile())
+    Base.metadata.create_all(engine)
+    return create_session_factory(engine)
+
+
+def make_uow(session_factory, project_locks):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+        project_locks=project_locks,
+    )
+
+
+def seed_projects(uow, count):
+    """Save ``count`` scheduled projects with one scheduled task each."""
+    owner = User.create(email="owner@example.com", name="Owner")
+    projects, tasks = [], []
+    with uow:
+        uow.users.save(owner)
+        for index in range(count):
+            project = Project.create(
+                name=f"Proj {index}", created_by=owner.id, expected_end_date=UtcDateTime(BASE)
+            )
+            task = Task.create(project_id=project.id, title=f"Task {index}")
+            task.expected_start_date = UtcDateTime(BASE - timedelta(days=1))
+            task.expected_end_date = UtcDateTime(BASE)
+            uow.projects.save(project)
+            uow.tasks.save(task)
+            projects.append(project)
+            tasks.append(task)
+        uow.commit()
+    return projects, tasks
+
+
+def run_concurrently(work, count):
+    """Run ``work(worker)`` on ``count`` threads and re-raise any failure."""
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        for future in [executor.submit(work, worker) for worker in range(count)]:
+            future.result()
+
+
+def assert_chain(history, first_end, last_end):
+    """Each row continues from the end date the previous row left behind."""
+    by_previous = {item.previous_end.value: item for item in history}
+    assert len(by_previous) == len(history)
+    end = first_end
+    for _ in history:
+        end = by_previous[end].new_end.value
+    assert end == last_end
+
+
+def test_concurrent_overrides_keep_task_history_consistent(tmp_path):
+    """Overrides of one project never interleave, while two projects run side by side."""
+    session_factory = make_session_factory(tmp_path)
+    locks = ProjectLocks()
+    _projects, tasks = seed_projects(make_uow(session_factory, locks), 2)
+
+    def override(worker):
+        task = tasks[worker % len(tasks)]
+        use_case = ManualDateOverrideUseCase(uow=make_uow(session_factory, locks))
+        for write in range(WRITES_PER_THREAD):
+            new_end = BASE + timedelta(hours=worker * 100 + write + 1)
+            use_case.execute(ManualDateOverrideInput(
+                task_id=task.id,
+                new_start_date=UtcDateTime(new_end - timedelta(days=1)),
+                new_end_date=UtcDateTime(new_end),
+            ))
+
+    run_concurrently(override, THREADS_PER_PROJECT * len(tasks))
+
+    uow = make_uow(session_factory, locks)
+    with uow:
+        for task in tasks:
+            history = uow.schedule_history.list_task_history(task.id)
+            stored = uow.tasks.find_by_id(task.id)
+            assert len(history) == THREADS_PER_PROJECT * WRITES_PER_THREAD
+            assert_chain(history, BASE, stored.expected_end_date.value)
+    assert locks.metrics.snapshot()["acquisitions"] == THREADS_PER_PROJECT * WRITES_PER_THREAD * len(tasks)
+    assert locks.metrics.timeouts == 0
+
+
+def test_concurrent_project_date_updates_keep_history_consistent(tmp_path):
+    """Project date updates from many threads form one unbroken history."""
+    session_factory = make_session_factory(tmp_path)
+    locks = ProjectLocks()
+    projects, _tasks = seed_projects(make_uow(session_factory, locks), 1)
+    project = projects[0]
+
+    def update(worker):
+        use_case = UpdateProjectDateUseCase(uow=make_uow(session_factory, locks))
+        for write in range(WRITES_PER_THREAD):
+            use_case.execute(UpdateProjectDateInput(
+                project_id=project.id,
+                new_end_date=UtcDateTime(BASE + timedelta(hours=worker * 100 + write + 1)),
+                reason=ScheduleChangeReason.MANUAL_OVERRIDE,
+            ))
+
+    run_concurrently(update, THREADS_PER_PROJECT)
+
+    uow = make_uow(session_factory, locks)
+    with uow:
+        history = uow.schedule_history.list_project_history(project.id)
+        stored = uow.projects.find_by_id(project.id)
+    assert len(history) == THREADS_PER_PROJECT * WRITES_PER_THREAD
+    assert_chain(history, BASE, stored.expected_end_date.value)
+
+
+def test_held_lock_only_blocks_its_own_project(tmp_path):
+    """Another project locks immediately; the same project times out."""
+    session_factory = make_session_factory(tmp_path)
+    locks = ProjectLocks(timeout=0.1)
+    projects, _tasks = seed_projects(make_uow(session_factory, locks), 2)
+    holder = make_uow(session_factory, locks)
+
+    def lock(project):
+        uow = make_uow(session_factory, locks)
+        with uow:
+            uow.lock_project(project.id)
+
+    with holder, ThreadPoolExecutor(max_workers=1) as executor:
+        holder.lock_project(projects[0].id)
+        executor.submit(lock, projects[1]).result(timeout=1)
+        with pytest.raises(ConcurrencyConflict) as excinfo:
+            executor.submit(lock, projects[0]).result(timeout=1)
+
+    assert excinfo.value.code == "project_locked"
+    lock(projects[0])
+    assert locks.metrics.timeouts == 1
+    assert locks.metrics.acquisitions == 3
+
+
+def test_lock_is_reentrant_and_released_on_rollback(tmp_path):
+    """Locking twice in a transaction is a no-op; a rollback frees the project."""
+    session_factory = make_session_factory(tmp_path)
+    locks = ProjectLocks(timeout=0.1)
+    projects, _tasks = seed_projects(make_uow(session_factory, locks), 1)
+    uow = make_uow(session_factory, locks)
+
+    with pytest.raises(RuntimeError), uow:
+        uow.lock_project(projects[0].id)
+        uow.lock_project(projects[0].id)
+        raise RuntimeError("abort")
+
+    with uow:
+        uow.lock_project(projects[0].id)
+    assert locks.metrics.acquisitions == 2
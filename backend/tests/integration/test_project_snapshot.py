@@ -0,0 +1,73 @@
+"""Integration tests for the project snapshot."""
+from sqlalchemy import event
+
+from app.application.use_cases.get_project_snapshot import GetProjectSnapshotUseCase
+from app.domain.models.enums import MemberLevel
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.role import Role
+from app.domain.models.task import Task
+from app.domain.models.task_dependency import TaskDependency
+from app.domain.models.user import User
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def seed_project(uow, name, tasks):
+    """Save a project with a manager, a worker, a role and a chain of tasks."""
+    manager = User.create(email=f"{name}-manager@example.com", name="Manager")
+    worker = User.create(email=f"{name}-worker@example.com", name="Worker")
+    project = Project.create(name=name, created_by=manager.id)
+    chain = [Task.create(project_id=project.id, title=f"{name} {i}") for i in range(tasks)]
+    with uow:
+        uow.users.save(manager)
+        uow.users.save(worker)
+        uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+        uow.project_members.save(
+            ProjectMember.create_member(project.id, worker.id, level=MemberLevel.MID, base_capacity=10)
+        )
+        uow.roles.save(Role.create(project_id=project.id, name="Engineer"))
+        for task in chain:
+            uow.tasks.save(task)
+        for previous, task in zip(chain, chain[1:]):
+            uow.task_dependencies.save(TaskDependency.create(task.id, previous.id))
+        uow.commit()
+    return project
+
+
+def test_snapshot_uses_one_query_per_table(session_factory):
+    """The query count does not grow with the number of tasks."""
+    uow = make_uow(session_factory)
+    small = seed_project(uow, "small", tasks=2)
+    large = seed_project(uow, "large", tasks=30)
+    statements = []
+    event.listen(
+        session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    GetProjectSnapshotUseCase(make_uow(session_factory)).execute(small.id)
+    small_queries = len(statements)
+    statements.clear()
+    snapshot = GetProjectSnapshotUseCase(make_uow(session_factory)).execute(large.id)
+
+    assert len(statements) == small_queries == 5
+    assert len(snapshot.tasks) == 30
+    assert len(snapshot.dependencies) == 29
+    assert {item.task_id for item in snapshot.dependencies} <= {task.id for task in snapshot.tasks}
+    assert len(snapshot.members) == len(snapshot.workloads) == 2
+    assert [role.name for role in snapshot.roles] == ["Engineer"]
@@ -0,0 +1,122 @@
+"""Integration tests for the maintained project summary."""
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from app.application.use_cases.get_project_summary import GetProjectSummaryUseCase
+from app.domain.models.enums import TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import ProjectSummaryModel
+from app.infrastructure.persistence.rebuild_project_summaries import rebuild_project_summaries
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def _day(day: int) -> UtcDateTime:
+    return UtcDateTime(datetime(2024, 1, day, tzinfo=timezone.utc))
+
+
+def _save(uow, *tasks):
+    with uow:
+        for task in tasks:
+            uow.tasks.save(task)
+        uow.commit()
+
+
+def _summary(uow, project):
+    with uow:
+        return uow.project_summaries.get(project.id)
+
+
+def test_summary_follows_task_writes_and_matches_rebuild(session_factory):
+    """Each task write updates the summary to what a full rebuild computes."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(4)]
+    for i, task in enumerate(tasks):
+        task.difficulty = i + 1
+        task.expected_end_date = _day(10 + i)
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many(tasks[:3])
+        uow.commit()
+    _save(uow, tasks[3])
+
+    summary = _summary(uow, project)
+    assert summary.status_counts[TaskStatus.TODO] == 4
+    assert summary.total_difficulty == 10
+    assert summary.latest_expected_end == _day(13)
+
+    tasks[0].transition_to(TaskStatus.DOING)
+    tasks[1].transition_to(TaskStatus.DOING)
+    _save(uow, tasks[0], tasks[1])
+    tasks[1].transition_to(TaskStatus.DONE)
+    tasks[1].actual_end_date = _day(20)
+    tasks[2].transition_to(TaskStatus.CANCELLED)
+    tasks[3].expected_end_date = _day(5)
+    _save(uow, tasks[1], tasks[2], tasks[3])
+
+    summary = _summary(uow, project)
+    assert summary.status_counts == {
+        TaskStatus.TODO: 1,
+        TaskStatus.BLOCKED: 0,
+        TaskStatus.DOING: 1,
+        TaskStatus.DONE: 1,
+        TaskStatus.CANCELLED: 1,
+    }
+    assert summary.doing_difficulty == 1
+    assert summary.delayed_count == 1
+    assert summary.latest_expected_end == _day(12)
+
+    rebuild_project_summaries(session_factory.kw["bind"], project.id)
+    assert _summary(uow, project) == summary
+
+
+def test_rebuild_backfills_missing_rows(session_factory):
+    """The rebuild command repairs summaries that drifted from the tasks."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(3)]
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many(tasks)
+        uow.commit()
+    with session_factory() as session, session.begin():
+        session.execute(update(ProjectSummaryModel).values(todo_count=0))
+
+    assert rebuild_project_summaries(session_factory.kw["bind"]) == 1
+    assert GetProjectSummaryUseCase(uow).execute(project.id).status_counts[TaskStatus.TODO] == 3
+
+
+def test_summary_of_project_without_tasks_is_empty(session_factory):
+    """A project with no tasks reads as an all-zero summary."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.commit()
+
+    output = GetProjectSummaryUseCase(uow).execute(project.id)
+    assert output.task_count == 0
+    assert output.latest_expected_end is None
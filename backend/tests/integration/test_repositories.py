@@ -1,11 +1,19 @@
 """Integration tests for repositories and UoW."""
+from sqlalchemy import event, func, select
+
+from app.domain.models.enums import MemberLevel, ScheduleChangeReason, TaskStatus
 from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.project_schedule_history import ProjectScheduleHistory
+from app.domain.models.role import Role
 from app.domain.models.task import Task
 from app.domain.models.user import User
-from app.domain.models.value_objects import InviteToken, UtcDateTime
+from app.domain.models.value_objects import InviteToken, TaskId, UtcDateTime
 from app.infrastructure.email.email_service import MockEmailService
 from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence import repositories
+from app.infrastructure.persistence.models import ChangeLogModel, MemberWorkloadModel, ProjectSummaryModel
 from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
 
 
@@ -92,3 +100,188 @@ def test_magic_link_repository_save_and_find(session_factory):
 
     assert loaded is not None
     assert loaded.token.value == "token"
+
+
+def test_project_and_task_id_lookups(session_factory):
+    """Looks up managed project IDs and a task's project ID."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    task = Task.create(project_id=project.id, title="Task")
+
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.save(task)
+        uow.commit()
+
+    with uow:
+        project_ids = uow.projects.list_ids_by_created_by(owner.id)
+        task_project_id = uow.tasks.find_project_id(task.id)
+
+    assert project_ids == [project.id]
+    assert task_project_id == project.id
+
+
+def test_project_delete_clears_derived_rows(session_factory):
+    """Deleting a project removes its summary, workload counters and change log."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    task = Task.create(project_id=project.id, title="Task")
+    task.status = TaskStatus.DOING
+    task.assigned_to = owner.id
+    task.difficulty = 2
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.tasks.add_many([task])
+        uow.commit()
+
+    with uow:
+        uow.projects.delete(project.id)
+        uow.commit()
+
+    with session_factory() as session:
+        for model in (ProjectSummaryModel, MemberWorkloadModel, ChangeLogModel):
+            count = session.execute(
+                select(func.count()).select_from(model).where(model.project_id == project.id.value)
+            ).scalar()
+            assert count == 0, model.__tablename__
+
+
+def test_list_project_ids_by_user(session_factory):
+    """Lists only the projects the user is a member of."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    projects = [Project.create(name=f"Proj {index}", created_by=owner.id) for index in range(2)]
+
+    with uow:
+        uow.users.save(owner)
+        for project in projects:
+            uow.projects.save(project)
+        uow.project_members.save(ProjectMember.create_manager(projects[0].id, owner.id))
+        uow.commit()
+
+    with uow:
+        assert uow.project_members.list_project_ids_by_user(owner.id) == [projects[0].id]
+
+
+def test_list_by_project_reads_rows_per_project(session_factory):
+    """Row-based listing binds the project per call and sees unflushed saves."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    first = Project.create(name="First", created_by=owner.id)
+    second = Project.create(name="Second", created_by=owner.id)
+    task = Task.create(project_id=first.id, title="Task")
+    task.assigned_to = owner.id
+    task.expected_end_date = UtcDateTime()
+
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(first)
+        uow.projects.save(second)
+        uow.tasks.save(task)
+        pending = uow.tasks.list_by_project(first.id)
+        uow.commit()
+
+    with uow:
+        listed = uow.tasks.list_by_project(first.id)
+        other = uow.tasks.list_by_project(second.id)
+        cached = len(uow.session.identity_map)
+
+    assert [t.id for t in pending] == [task.id]
+    assert listed == [task]
+    assert other == []
+    assert cached == 0
+
+
+def test_keyset_pages_cover_every_row_once(session_factory):
+    """Pages follow (timestamp, id) order, break ties by id, and end with no cursor."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    joined_at = UtcDateTime()
+    members = []
+    for i in range(5):
+        user = User.create(email=f"user{i}@example.com", name=f"User {i}")
+        member = ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+        member.joined_at = joined_at
+        members.append((user, member))
+    history = [
+        ProjectScheduleHistory.create(
+            project_id=project.id,
+            previous_end=UtcDateTime(),
+            new_end=UtcDateTime(),
+            reason=ScheduleChangeReason.MANUAL_OVERRIDE,
+        )
+        for _ in range(3)
+    ]
+
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        for user, member in members:
+            uow.users.save(user)
+            uow.project_members.save(member)
+        for item in history:
+            uow.schedule_history.save_project_history(item)
+        uow.commit()
+
+    seen = []
+    cursor = None
+    with uow:
+        while True:
+            page = uow.project_members.page_by_project(project.id, 2, cursor)
+            seen.append([member.id for member in page.items])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        history_page = uow.schedule_history.page_project_history(project.id, 3)
+
+    assert [len(ids) for ids in seen] == [2, 2, 1]
+    flat = [member_id for ids in seen for member_id in ids]
+    assert sorted(flat, key=str) == sorted((member.id for _, member in members), key=str)
+    assert len(set(flat)) == 5
+    assert len(history_page.items) == 3
+    assert history_page.next_cursor is None
+
+
+def test_find_by_ids_chunks_and_keeps_request_order(session_factory, monkeypatch):
+    """Multi-get issues one IN query per chunk and returns hits in request order."""
+    monkeypatch.setattr(repositories, "_IN_CHUNK_SIZE", 2)
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {i}") for i in range(5)]
+    role = Role.create(project_id=project.id, name="Engineer")
+    member = ProjectMember.create_manager(project.id, owner.id)
+
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.roles.save(role)
+        uow.project_members.save(member)
+        for task in tasks:
+            uow.tasks.save(task)
+        uow.commit()
+
+    statements = []
+    event.listen(
+        session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+    wanted = [tasks[3].id, TaskId(), tasks[0].id, tasks[3].id, tasks[4].id]
+    with uow:
+        loaded = uow.tasks.find_by_ids(wanted)
+        task_queries = sum("FROM tasks" in statement for statement in statements)
+        users = uow.users.find_by_ids([owner.id])
+        roles = uow.roles.find_by_ids([role.id])
+        members = uow.project_members.find_by_ids([member.id])
+
+    assert [task.id for task in loaded] == [tasks[3].id, tasks[0].id, tasks[4].id]
+    assert task_queries == 2
+    assert users == [owner]
+    assert [item.name for item in roles] == ["Engineer"]
+    assert [item.id for item in members] == [member.id]
@@ -0,0 +1,166 @@
+"""Integration tests for the SQLite production profile."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+from app.domain.models.user import User
+from app.infrastructure.database import create_async_db_engine, create_async_session_factory, create_db_router
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.async_uow import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import SqlAlchemyUserRepository
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.pool import PoolSettings
+from app.infrastructure.sqlite_profile import SqliteProfile
+
+
+def make_router(tmp_path, pool=None):
+    router = create_db_router(f"sqlite:///{tmp_path / 'profile.db'}", pool=pool, sqlite_profile=SqliteProfile())
+    Base.metadata.create_all(router.primary)
+    return router
+
+
+def make_request_uow(router):
+    """Create a unit of work scoped to one request, as ``get_unit_of_work`` does."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=router.session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+        request_scoped=True,
+    )
+
+
+def test_connections_get_profile_pragmas(tmp_path):
+    """Writer and reader connections run in WAL mode with a busy timeout."""
+    router = make_router(tmp_path)
+
+    for engine in (router.primary, router.primary_reader):
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+
+
+def test_writer_is_single_connection_and_reader_is_pooled(tmp_path):
+    """Writes share one connection; reads use a separate pool."""
+    router = make_router(tmp_path)
+
+    assert router.primary.pool.size() == 1
+    assert router.primary_reader is not router.primary
+    assert router.read_engine() is router.primary_reader
+
+
+def test_reads_proceed_while_a_write_is_open(tmp_path):
+    """A reader sees the last committed state during an open write."""
+    router = make_router(tmp_path)
+    user = User.create(email="reader@example.com", name="Reader")
+    with router.session_factory() as session:
+        SqlAlchemyUserRepository(session).save(user)
+        session.commit()
+
+    with router.session_factory() as writer:
+        SqlAlchemyUserRepository(writer).save(User.create(email="pending@example.com", name="Pending"))
+        writer.flush()
+        with router.read_session_factory()() as reader:
+            count = reader.execute(text("SELECT COUNT(*) FROM users")).scalar()
+        writer.commit()
+
+    assert count == 1
+
+
+def test_concurrent_writers_queue_instead_of_failing(tmp_path):
+    """Writes from many threads all commit without lock errors."""
+    router = make_router(tmp_path)
+
+    def write(index):
+        with router.session_factory() as session:
+            repository = SqlAlchemyUserRepository(session)
+            repository.find_by_email(f"user{index}@example.com")
+            repository.save(User.create(email=f"user{index}@example.com", name=f"User {index}"))
+            session.commit()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(write, range(64)))
+
+    with router.read_session_factory()() as reader:
+        assert reader.execute(text("SELECT COUNT(*) FROM users")).scalar() == 64
+
+
+def test_request_that_only_read_does_not_hold_the_writer(tmp_path):
+    """A request still in flight after its user lookup lets another request write."""
+    router = make_router(tmp_path, pool=PoolSettings(timeout=1))
+    user = User.create(email="reader@example.com", name="Reader")
+    with router.session_factory() as session:
+        SqlAlchemyUserRepository(session).save(user)
+        session.commit()
+
+    def write_request():
+        uow = make_request_uow(router)
+        try:
+            with uow:
+                uow.users.save(User.create(email="writer@example.com", name="Writer"))
+                uow.commit()
+        finally:
+            uow.close()
+
+    streaming = make_request_uow(router)
+    try:
+        with streaming:
+            assert streaming.users.find_by_id(user.id) is not None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(write_request).result(timeout=5)
+    finally:
+        streaming.close()
+
+    with router.read_session_factory()() as reader:
+        assert reader.execute(text("SELECT COUNT(*) FROM users")).scalar() == 2
+
+
+async def test_async_request_that_only_read_does_not_hold_the_writer(tmp_path):
+    """The async unit of work also releases the writer after a read-only block."""
+    router = make_router(tmp_path)
+    user = User.create(email="reader@example.com", name="Reader")
+    with router.session_factory() as session:
+        SqlAlchemyUserRepository(session).save(user)
+        session.commit()
+    engine = create_async_db_engine(
+        f"sqlite:///{tmp_path / 'profile.db'}",
+        PoolSettings(timeout=1),
+        SqliteProfile(),
+        writer=True,
+    )
+    session_factory = create_async_session_factory(engine)
+
+    def make_async_request_uow():
+        return AsyncSqlAlchemyUnitOfWork(
+            session_factory=session_factory,
+            event_bus=InMemoryEventBus(),
+            email_service=MockEmailService(),
+            llm_service=SimpleLlmService(api_url=None, api_key=None),
+            request_scoped=True,
+        )
+
+    async def write_request():
+        uow = make_async_request_uow()
+        try:
+            async with uow:
+                await uow.users.save(User.create(email="writer@example.com", name="Writer"))
+                await uow.commit()
+        finally:
+            await uow.close()
+
+    streaming = make_async_request_uow()
+    try:
+        assert await streaming.users.find_by_id(user.id) is not None
+        assert not streaming.session.in_transaction()
+        await asyncio.wait_for(write_request(), timeout=5)
+    finally:
+        await streaming.close()
+        await engine.dispose()
+
+    with router.read_session_factory()() as reader:
+        assert reader.execute(text("SELECT COUNT(*) FROM users")).scalar() == 2
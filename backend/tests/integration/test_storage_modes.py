@@ -0,0 +1,68 @@
+"""Integration tests for the compact storage mode and its migration."""
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models.enums import TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.migrate_storage import migrate_storage
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyProjectRepository,
+    SqlAlchemyTaskRepository,
+    SqlAlchemyUserRepository,
+)
+
+
+def seed(engine):
+    Base.metadata.create_all(engine)
+    user = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Compact", created_by=user.id)
+    task = Task.create(project_id=project.id, title="Encode")
+    task.expected_start_date = UtcDateTime(datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc))
+    task.status = TaskStatus.DOING
+    with sessionmaker(bind=engine)() as session:
+        SqlAlchemyUserRepository(session).save(user)
+        SqlAlchemyProjectRepository(session).save(project)
+        SqlAlchemyTaskRepository(session).save(task)
+        session.commit()
+    return task
+
+
+def test_compact_mode_stores_blob_ids_codes_and_epochs(tmp_path):
+    """Compact SQLite columns hold 16-byte ids, enum codes and integers."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'compact.db'}", storage_mode="compact")
+    task = seed(engine)
+
+    with engine.connect() as connection:
+        row = connection.execute(text(
+            "SELECT typeof(id), length(id), typeof(status), status, typeof(expected_start_date) FROM tasks"
+        )).one()
+    assert tuple(row) == ("blob", 16, "integer", list(TaskStatus).index(TaskStatus.DOING), "integer")
+
+    with sessionmaker(bind=engine)() as session:
+        loaded = SqlAlchemyTaskRepository(session).find_by_id(task.id)
+    assert loaded.id == task.id
+    assert loaded.status is TaskStatus.DOING
+    assert loaded.expected_start_date.value == task.expected_start_date.value
+
+
+def test_migration_copies_text_database_into_compact(tmp_path):
+    """Every row survives a text to compact migration unchanged."""
+    source = create_db_engine(f"sqlite:///{tmp_path / 'text.db'}")
+    target = create_db_engine(f"sqlite:///{tmp_path / 'compact.db'}", storage_mode="compact")
+    task = seed(source)
+
+    copied = migrate_storage(source, target, batch_size=1)
+
+    assert copied["tasks"] == 1
+    assert copied["projects"] == 1
+    with sessionmaker(bind=source)() as old, sessionmaker(bind=target)() as new:
+        before = SqlAlchemyTaskRepository(old).find_by_id(task.id)
+        after = SqlAlchemyTaskRepository(new).find_by_id(task.id)
+    assert after == before
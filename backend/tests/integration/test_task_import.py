@@ -0,0 +1,57 @@
+"""Integration tests for the bulk task import."""
+from sqlalchemy import event
+
+from app.application.dtos.task_dtos import ImportDependencyRow, ImportTaskRow, ImportTasksInput
+from app.application.events.domain_events import TasksCreated
+from app.application.use_cases.import_tasks import ImportTasksUseCase
+from app.domain.models.project import Project
+from app.domain.models.user import User
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def test_import_inserts_in_chunked_transactions(session_factory):
+    """Tasks and edges are bulk inserted, one commit per chunk, one event."""
+    uow = make_uow(session_factory)
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Proj", created_by=owner.id)
+    with uow:
+        uow.users.save(owner)
+        uow.projects.save(project)
+        uow.commit()
+
+    events = []
+    uow.event_bus.register(TasksCreated, events.append)
+    commits = []
+    event.listen(session_factory.kw["bind"], "commit", lambda _conn: commits.append(1))
+    rows = [ImportTaskRow(ref=f"t{i}", title=f"Task {i}", difficulty=i) for i in range(5)]
+    edges = [ImportDependencyRow(task_ref=f"t{i + 1}", depends_on_ref=f"t{i}") for i in range(4)]
+
+    output = ImportTasksUseCase(uow=uow, event_bus=uow.event_bus, chunk_size=2).execute(
+        ImportTasksInput(project_id=project.id, tasks=rows, dependencies=edges + edges[:1])
+    )
+
+    assert len(commits) == 6  # project lookup, three task chunks, two edge chunks
+    assert output.dependencies == 4
+    with uow:
+        tasks = {task.id: task for task in uow.tasks.list_by_project(project.id)}
+        dependencies = uow.task_dependencies.list_by_project(project.id)
+    assert set(tasks) == set(output.task_ids.values())
+    assert tasks[output.task_ids["t3"]].difficulty == 3
+    assert {(d.task_id, d.depends_on_id) for d in dependencies} == {
+        (output.task_ids[f"t{i + 1}"], output.task_ids[f"t{i}"]) for i in range(4)
+    }
+    assert len(events) == 1
+    assert events[0].task_ids == tuple(output.task_ids.values())
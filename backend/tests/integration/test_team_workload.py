@@ -0,0 +1,82 @@
+"""Integration tests for the team workload aggregate."""
+from sqlalchemy import event
+
+from app.application.use_cases.get_employee_workload import GetEmployeeWorkloadUseCase
+from app.application.use_cases.get_team_workload import GetTeamWorkloadUseCase
+from app.domain.models.enums import MemberLevel, TaskStatus, WorkloadStatus
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def _task(project, user, status, difficulty):
+    task = Task.create(project_id=project.id, title="Task")
+    task.status = status
+    task.difficulty = difficulty
+    task.assigned_to = user.id
+    return task
+
+
+def test_team_workload_matches_per_member_workload(session_factory):
+    """One grouped query yields the same workloads as the per-member use case."""
+    uow = make_uow(session_factory)
+    manager = User.create(email="manager@example.com", name="Manager")
+    busy = User.create(email="busy@example.com", name="Busy")
+    idle = User.create(email="idle@example.com", name="Idle")
+    project = Project.create(name="Proj", created_by=manager.id)
+    other = Project.create(name="Other", created_by=manager.id)
+    with uow:
+        for user in (manager, busy, idle):
+            uow.users.save(user)
+        uow.projects.save(project)
+        uow.projects.save(other)
+        uow.project_members.save(ProjectMember.create_manager(project.id, manager.id))
+        for user in (busy, idle):
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        uow.tasks.add_many([
+            _task(project, busy, TaskStatus.DOING, 5),
+            _task(project, busy, TaskStatus.DOING, 8),
+            _task(project, busy, TaskStatus.DONE, 13),
+            _task(project, idle, TaskStatus.TODO, 3),
+            _task(other, busy, TaskStatus.DOING, 21),
+        ])
+        uow.commit()
+
+    statements = []
+    event.listen(
+        session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+    workloads = GetTeamWorkloadUseCase(make_uow(session_factory)).execute(project.id)
+
+    assert len(statements) == 2
+    by_user = {workload.user_id: workload for workload in workloads}
+    assert set(by_user) == {manager.id, busy.id, idle.id}
+    assert by_user[busy.id].workload_score == 13
+    assert by_user[busy.id].status == WorkloadStatus.TIGHT
+    assert by_user[idle.id].workload_score == 0
+    for user in (manager, busy, idle):
+        single = GetEmployeeWorkloadUseCase(make_uow(session_factory)).execute(project.id, user.id)
+        assert (single.workload_score, single.capacity, single.status) == (
+            by_user[user.id].workload_score,
+            by_user[user.id].capacity,
+            by_user[user.id].status,
+        )
@@ -0,0 +1,128 @@
+"""Integration tests for set-based unassignment when a member leaves a project."""
+import pytest
+
+from app.application.use_cases.fire_employee import FireEmployeeUseCase
+from app.application.use_cases.resign_from_project import ResignFromProjectUseCase
+from app.domain.exceptions import ConcurrencyConflict
+from app.domain.models.enums import AbandonmentType, ChangeEntity, MemberLevel, TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.database import DatabaseRouter, create_db_engine
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.rebuild_project_summaries import rebuild_project_summaries
+from app.infrastructure.persistence.reconcile_member_workloads import reconcile_member_workloads
+from app.infrastructure.persistence.uow import SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory, session_info=None):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+        session_info=session_info,
+    )
+
+
+def seed_project(uow):
+    """Save a project where ``leaver`` holds DOING, TODO and DONE tasks and ``stayer`` one DOING task."""
+    manager = User.create(email="manager@example.com", name="Manager")
+    leaver = User.create(email="leaver@example.com", name="Leaver")
+    stayer = User.create(email="stayer@example.com", name="Stayer")
+    project = Project.create(name="Proj", created_by=manager.id)
+    statuses = [TaskStatus.DOING, TaskStatus.DOING, TaskStatus.TODO, TaskStatus.DONE, TaskStatus.DOING]
+    tasks = []
+    for index, status in enumerate(statuses):
+        task = Task.create(project_id=project.id, title=f"Task {index}")
+        task.difficulty = index + 1
+        task.status = status
+        task.assigned_to = stayer.id if index == 4 else leaver.id
+        tasks.append(task)
+    with uow:
+        uow.users.save(manager)
+        uow.projects.save(project)
+        for user in (leaver, stayer):
+            uow.users.save(user)
+            uow.project_members.save(
+                ProjectMember.create_member(project.id, user.id, level=MemberLevel.MID, base_capacity=10)
+            )
+        uow.tasks.add_many(tasks)
+        uow.commit()
+    return project, leaver, stayer, tasks
+
+
+@pytest.mark.parametrize("use_case, abandonment_type", [
+    (FireEmployeeUseCase, AbandonmentType.FIRED_FROM_PROJECT),
+    (ResignFromProjectUseCase, AbandonmentType.RESIGNED),
+])
+def test_leaving_member_releases_all_tasks(session_factory, use_case, abandonment_type):
+    """Tasks are unassigned, DOING ones return to TODO, and derived tables stay exact."""
+    uow = make_uow(session_factory)
+    project, leaver, stayer, tasks = seed_project(uow)
+    with uow:
+        changes_before = len(uow.change_log.list_since(project.id, 0, 100))
+
+    use_case(uow).execute(project.id, leaver.id)
+
+    with uow:
+        stored = uow.tasks.find_by_ids([task.id for task in tasks])
+        assert [task.status for task in stored] == [
+            TaskStatus.TODO, TaskStatus.TODO, TaskStatus.TODO, TaskStatus.DONE, TaskStatus.DOING,
+        ]
+        assert [task.assigned_to for task in stored] == [None, None, None, None, stayer.id]
+        assert [task.version for task in stored] == [1, 1, 1, 1, 0]
+        for task in tasks[:4]:
+            (abandonment,) = uow.task_abandonments.list_by_task(task.id)
+            assert (abandonment.user_id, abandonment.abandonment_type) == (leaver.id, abandonment_type)
+        assert uow.task_abandonments.list_by_task(tasks[4].id) == []
+        changes = uow.change_log.list_since(project.id, 0, 100)[changes_before:]
+        assert {(change.entity, change.entity_id) for change in changes} == {
+            (ChangeEntity.TASK, task.id.value) for task in tasks[:4]
+        }
+        assert uow.member_workloads.get_doing_difficulty(project.id, leaver.id) == 0
+        assert uow.member_workloads.get_doing_difficulty(project.id, stayer.id) == 5
+        summary = uow.project_summaries.get(project.id)
+
+    assert summary.status_counts[TaskStatus.DOING] == 1
+    assert summary.doing_difficulty == 5
+    assert reconcile_member_workloads(session_factory.kw["bind"]) == []
+    rebuild_project_summaries(session_factory.kw["bind"], project.id)
+    with uow:
+        assert uow.project_summaries.get(project.id) == summary
+
+
+def test_task_read_before_release_cannot_overwrite_it(session_factory):
+    """The released tasks get a new version, so older copies are rejected."""
+    uow = make_uow(session_factory)
+    project, leaver, _stayer, tasks = seed_project(uow)
+    with uow:
+        stale = uow.tasks.find_by_id(tasks[0].id)
+
+    FireEmployeeUseCase(uow).execute(project.id, leaver.id)
+
+    stale.difficulty = 8
+    with pytest.raises(ConcurrencyConflict), uow:
+        uow.tasks.save(stale)
+        uow.commit()
+
+
+def test_release_keeps_the_caller_reading_from_primary(tmp_path):
+    """Releasing tasks runs only Core statements, yet still counts as a write for routing."""
+    engines = [create_db_engine(f"sqlite:///{tmp_path / name}") for name in ("primary.db", "replica.db")]
+    for engine in engines:
+        Base.metadata.create_all(engine)
+    router = DatabaseRouter(engines[0], engines[1:])
+    project, leaver, _stayer, _tasks = seed_project(make_uow(router.session_factory))
+
+    uow = make_uow(router.session_factory, {"sticky_key": "manager"})
+    with uow:
+        assert len(uow.tasks.unassign_user(project.id, leaver.id)) == 4
+        uow.commit()
+
+    assert router.read_session_factory("manager").kw["bind"] is router.primary
@@ -0,0 +1,151 @@
+"""Integration tests for SqlAlchemyUnitOfWork transaction scoping."""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app.domain.models.user import User
+from app.infrastructure.database import create_session_factory
+from app.infrastructure.email.email_service import MockEmailService
+from app.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from app.infrastructure.llm.llm_service import SimpleLlmService
+from app.infrastructure.persistence.uow import SqlAlchemyReadOnlyUnitOfWork, SqlAlchemyUnitOfWork
+
+
+def make_uow(session_factory, request_scoped=False):
+    """Create a unit of work for tests."""
+    return SqlAlchemyUnitOfWork(
+        session_factory=session_factory,
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+        request_scoped=request_scoped,
+    )
+
+
+def count_commits(session_factory):
+    commits = []
+    event.listen(session_factory.kw["bind"], "commit", lambda _conn: commits.append(1))
+    return commits
+
+
+def test_nested_blocks_join_outer_session(session_factory):
+    """Inner blocks reuse the outer session and do not commit."""
+    uow = make_uow(session_factory)
+    commits = count_commits(session_factory)
+    user = User.create(email="nested@example.com", name="Nested")
+
+    with uow:
+        outer_session = uow.session
+        with uow:
+            assert uow.session is outer_session
+            uow.users.save(user)
+        assert commits == []
+
+    assert len(commits) == 1
+    with uow:
+        assert uow.users.find_by_id(user.id) is not None
+
+
+def test_request_scoped_blocks_share_one_session(session_factory):
+    """Successive blocks of a request share a session until close()."""
+    uow = make_uow(session_factory, request_scoped=True)
+    commits = count_commits(session_factory)
+    user = User.create(email="scoped@example.com", name="Scoped")
+
+    with uow:
+        first_session = uow.session
+    with uow:
+        assert uow.session is first_session
+        uow.users.save(user)
+        uow.commit()
+    uow.close()
+
+    assert len(commits) == 1
+    assert uow.session is None
+    with make_uow(session_factory) as check:
+        assert check.users.find_by_id(user.id) is not None
+
+
+def test_request_scoped_close_discards_uncommitted(session_factory):
+    """Work that was never committed is dropped when the request ends."""
+    uow = make_uow(session_factory, request_scoped=True)
+    user = User.create(email="dropped@example.com", name="Dropped")
+
+    with uow:
+        uow.users.save(user)
+    uow.close()
+
+    with make_uow(session_factory) as check:
+        assert check.users.find_by_id(user.id) is None
+
+
+def test_request_scoped_rolls_back_on_error(session_factory):
+    """An error in the outermost block rolls back the request."""
+    uow = make_uow(session_factory, request_scoped=True)
+    user = User.create(email="error@example.com", name="Error")
+
+    with pytest.raises(RuntimeError):
+        with uow:
+            uow.users.save(user)
+            uow.session.flush()
+            raise RuntimeError("boom")
+    uow.close()
+
+    with make_uow(session_factory) as check:
+        assert check.users.find_by_id(user.id) is None
+
+
+def make_read_uow(session_factory):
+    """Create a read-only unit of work on a read-only session factory."""
+    return SqlAlchemyReadOnlyUnitOfWork(
+        session_factory=create_session_factory(session_factory.kw["bind"], read_only=True),
+        event_bus=InMemoryEventBus(),
+        email_service=MockEmailService(),
+        llm_service=SimpleLlmService(api_url=None, api_key=None),
+    )
+
+
+def test_repositories_are_built_on_first_access(session_factory):
+    """Only the repositories a block touches are constructed."""
+    uow = make_uow(session_factory)
+
+    with uow:
+        assert "users" not in vars(uow)
+        users = uow.users
+        assert uow.users is users
+        assert "tasks" not in vars(uow)
+
+    with uow:
+        assert "users" not in vars(uow)
+        assert uow.users is not users
+
+
+def test_read_only_uow_never_commits(session_factory):
+    """A read-only block reads committed data and ends in a rollback."""
+    user = User.create(email="reader@example.com", name="Reader")
+    with make_uow(session_factory) as uow:
+        uow.users.save(user)
+
+    commits = count_commits(session_factory)
+    uow = make_read_uow(session_factory)
+    with uow:
+        assert uow.users.find_by_id(user.id) is not None
+        uow.commit()
+
+    assert commits == []
+
+
+def test_read_only_uow_rejects_writes(session_factory):
+    """Writes through a read-only session fail in the database."""
+    uow = make_read_uow(session_factory)
+
+    with pytest.raises(OperationalError):
+        with uow:
+            uow.users.save(User.create(email="writer@example.com", name="Writer"))
+            uow.session.flush()
+
+    user = User.create(email="after@example.com", name="After")
+    with make_uow(session_factory) as rw:
+        rw.users.save(user)
+    with make_uow(session_factory) as check:
+        assert check.users.find_by_id(user.id) is not None
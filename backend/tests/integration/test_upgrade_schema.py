@@ -0,0 +1,116 @@
+"""Integration tests for upgrading a database created before the current schema."""
+from sqlalchemy import Column, MetaData, Table, inspect, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.models.enums import TaskStatus
+from app.domain.models.project import Project
+from app.domain.models.task import Task
+from app.domain.models.user import User
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.persistence.migrate_storage import migrate_storage
+from app.infrastructure.persistence.models import Base
+from app.infrastructure.persistence.repositories import (
+    SqlAlchemyMemberWorkloadRepository,
+    SqlAlchemyProjectRepository,
+    SqlAlchemyProjectSummaryRepository,
+    SqlAlchemyTaskRepository,
+)
+from app.infrastructure.persistence.upgrade_schema import upgrade_schema
+
+NEW_TABLES = {"project_summaries", "member_workloads", "change_log"}
+
+
+def create_legacy_database(engine):
+    """Create the schema as it was before versions, derived tables and composite indexes."""
+    legacy = MetaData()
+    tables = {}
+    for table in Base.metadata.sorted_tables:
+        if table.name in NEW_TABLES:
+            continue
+        tables[table.name] = Table(table.name, legacy, *[
+            Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+            for column in table.c
+            if column.name != "version"
+        ])
+    legacy.create_all(engine)
+    return tables
+
+
+def seed_legacy(engine, tables):
+    """Insert a user, a project and two tasks, one of them DOING."""
+    owner = User.create(email="owner@example.com", name="Owner")
+    project = Project.create(name="Legacy", created_by=owner.id)
+    tasks = [Task.create(project_id=project.id, title=f"Task {index}") for index in range(2)]
+    tasks[0].status = TaskStatus.DOING
+    tasks[0].assigned_to = owner.id
+    tasks[0].difficulty = 3
+    with engine.begin() as connection:
+        connection.execute(insert(tables["users"]).values(
+            id=owner.id.value, email=owner.email, name=owner.name, created_at=owner.created_at.value,
+        ))
+        connection.execute(insert(tables["projects"]).values(
+            id=project.id.value,
+            name=project.name,
+            created_by=owner.id.value,
+            status=project.status,
+            llm_enabled=False,
+            created_at=project.created_at.value,
+        ))
+        connection.execute(insert(tables["tasks"]), [
+            {
+                "id": task.id.value,
+                "project_id": project.id.value,
+                "title": task.title,
+                "status": task.status,
+                "difficulty": task.difficulty,
+                "assigned_to": task.assigned_to.value if task.assigned_to else None,
+                "created_at": task.created_at.value,
+            }
+            for task in tasks
+        ])
+    return project, tasks
+
+
+def test_upgrade_adds_columns_tables_and_indexes(tmp_path):
+    """A pre-upgrade database becomes usable, and a second run changes nothing."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    project, tasks = seed_legacy(engine, create_legacy_database(engine))
+
+    steps = upgrade_schema(engine)
+
+    assert "add column tasks.version" in steps
+    assert "add column projects.version" in steps
+    assert {f"create table {name}" for name in NEW_TABLES} <= set(steps)
+    assert "create index ix_tasks_project_id_status_assigned_to" in steps
+    assert "repair member_workloads (1 counters)" in steps
+    assert upgrade_schema(engine) == []
+    assert {index["name"] for index in inspect(engine).get_indexes("tasks")} == {
+        index.name for index in Base.metadata.tables["tasks"].indexes
+    }
+    with sessionmaker(bind=engine)() as session:
+        stored = SqlAlchemyTaskRepository(session).find_by_ids([task.id for task in tasks])
+        assert [task.version for task in stored] == [0, 0]
+        assert SqlAlchemyProjectRepository(session).find_by_id(project.id).version == 0
+        summary = SqlAlchemyProjectSummaryRepository(session).get(project.id)
+        workload = SqlAlchemyMemberWorkloadRepository(session).get_doing_difficulty(
+            project.id, tasks[0].assigned_to
+        )
+    assert workload == 3
+    assert summary.status_counts[TaskStatus.DOING] == 1
+    assert summary.doing_difficulty == 3
+
+
+def test_migrate_storage_copies_a_pre_upgrade_database(tmp_path):
+    """Tables and columns missing from the source are created and filled in the target."""
+    source = create_db_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    target = create_db_engine(f"sqlite:///{tmp_path / 'compact.db'}", storage_mode="compact")
+    project, tasks = seed_legacy(source, create_legacy_database(source))
+
+    copied = migrate_storage(source, target)
+
+    assert copied["tasks"] == 2
+    with sessionmaker(bind=target)() as session:
+        stored = SqlAlchemyTaskRepository(session).find_by_ids([task.id for task in tasks])
+        assert [task.version for task in stored] == [0, 0]
+        assert SqlAlchemyProjectSummaryRepository(session).get(project.id).doing_difficulty == 3
+        assert SqlAlchemyMemberWorkloadRepository(session).get_doing_difficulty(project.id, tasks[0].assigned_to) == 3
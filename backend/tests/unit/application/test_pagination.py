@@ -0,0 +1,27 @@
+"""Tests for pagination cursors."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.dtos.pagination import Cursor
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import UtcDateTime
+
+
+def test_cursor_round_trips_through_token():
+    """A decoded token equals the encoded cursor."""
+    cursor = Cursor(UtcDateTime(datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)), uuid4())
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "WzEsMl0"])
+def test_cursor_decode_rejects_garbage(token):
+    """Malformed tokens raise a business rule violation."""
+    with pytest.raises(BusinessRuleViolation) as exc_info:
+        Cursor.decode(token)
+    assert exc_info.value.code == "invalid_cursor"
@@ -16,7 +16,7 @@ from app.application.ports.task_assignment_history_repository import TaskAssignm
 from app.application.ports.task_dependency_repository import TaskDependencyRepository
 from app.application.ports.task_report_repository import TaskReportRepository
 from app.application.ports.task_repository import TaskRepository
-from app.application.ports.unit_of_work import UnitOfWork
+from app.application.ports.unit_of_work import AsyncUnitOfWork, UnitOfWork
 from app.application.ports.user_repository import UserRepository
 
 
@@ -39,6 +39,7 @@ def test_ports_are_protocols():
         TaskReportRepository,
         TaskRepository,
         UnitOfWork,
+        AsyncUnitOfWork,
         UserRepository,
     ]
     assert all(issubclass(port, Protocol) for port in ports)
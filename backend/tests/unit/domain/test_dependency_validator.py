@@ -1,6 +1,6 @@
 """Tests for dependency validator."""
 from app.domain.models.value_objects import TaskId
-from app.domain.services.dependency_validator import detect_cycle
+from app.domain.services.dependency_validator import detect_cycle, has_cycle
 
 
 def test_detect_cycle_self_dependency():
@@ -24,3 +24,15 @@ def test_detect_cycle_no_cycle():
     b = TaskId()
     existing = {b: []}
     assert detect_cycle(a, b, existing) is False
+
+
+def test_has_cycle_finds_cycle_in_graph():
+    """Cycle anywhere in the graph is found."""
+    a, b, c, d = TaskId(), TaskId(), TaskId(), TaskId()
+    assert has_cycle({d: [a], a: [b], b: [c], c: [a]}) is True
+
+
+def test_has_cycle_accepts_dag():
+    """Shared dependencies without a cycle are accepted."""
+    a, b, c, d = TaskId(), TaskId(), TaskId(), TaskId()
+    assert has_cycle({a: [b, c], b: [d], c: [d]}) is False
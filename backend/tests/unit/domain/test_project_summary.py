@@ -0,0 +1,48 @@
+"""Tests for ProjectSummary domain model."""
+from datetime import datetime, timezone
+
+from app.domain.models.enums import TaskStatus
+from app.domain.models.project_summary import ProjectSummary
+from app.domain.models.task import Task
+from app.domain.models.value_objects import ProjectId, UtcDateTime
+
+
+def _day(day: int) -> UtcDateTime:
+    return UtcDateTime(datetime(2024, 1, day, tzinfo=timezone.utc))
+
+
+def test_add_counts_status_difficulty_and_delay():
+    """Adding tasks updates counts, difficulty totals, delays and latest end."""
+    project_id = ProjectId()
+    doing = Task.create(project_id=project_id, title="Doing")
+    doing.status = TaskStatus.DOING
+    doing.difficulty = 5
+    doing.expected_end_date = _day(10)
+    late = Task.create(project_id=project_id, title="Late")
+    late.status = TaskStatus.DONE
+    late.difficulty = 3
+    late.expected_end_date = _day(2)
+    late.actual_end_date = _day(4)
+
+    summary = ProjectSummary(project_id)
+    summary.add(doing)
+    summary.add(late)
+
+    assert summary.task_count == 2
+    assert summary.status_counts[TaskStatus.DOING] == 1
+    assert summary.status_counts[TaskStatus.DONE] == 1
+    assert summary.total_difficulty == 8
+    assert summary.doing_difficulty == 5
+    assert summary.delayed_count == 1
+    assert summary.latest_expected_end == _day(10)
+
+
+def test_add_with_negative_sign_reverts_counts():
+    """Removing a task's previous state cancels its contribution."""
+    task = Task.create(project_id=ProjectId(), title="A")
+    task.difficulty = 2
+    summary = ProjectSummary(task.project_id)
+    summary.add(task)
+    summary.add(task, -1)
+    assert summary.task_count == 0
+    assert summary.total_difficulty == 0
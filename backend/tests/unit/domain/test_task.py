@@ -22,3 +22,11 @@ def test_task_transition_invalid_raises():
     task = Task.create(project_id=ProjectId(), title="Test")
     with pytest.raises(BusinessRuleViolation):
         task.transition_to(TaskStatus.DONE)
+
+
+def test_task_is_slotted():
+    """Task instances have no per-instance dict."""
+    task = Task.create(project_id=ProjectId(), title="Test")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unknown = 1
@@ -1,6 +1,9 @@
 """Tests for value objects."""
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
+
+import pytest
 
 from app.domain.models.value_objects import (
     InviteToken,
@@ -49,3 +52,26 @@ def test_utc_datetime_comparisons():
     assert first <= second
     assert second > first
     assert second >= first
+
+
+def test_trusted_id_equals_validated_id():
+    """trusted() builds the same value as the constructor."""
+    raw = uuid4()
+    trusted = TaskId.trusted(raw)
+    assert trusted == TaskId(raw)
+    assert hash(trusted) == hash(TaskId(raw))
+    assert str(trusted) == str(raw)
+
+
+def test_trusted_utc_datetime_keeps_value():
+    """UtcDateTime.trusted stores an aware datetime as given."""
+    value = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert UtcDateTime.trusted(value) == UtcDateTime(value)
+
+
+def test_value_objects_are_slotted_and_frozen():
+    """Value objects carry no instance dict and stay immutable."""
+    user_id = UserId.trusted(uuid4())
+    assert not hasattr(user_id, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        user_id.value = uuid4()
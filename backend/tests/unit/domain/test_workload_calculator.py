@@ -36,7 +36,14 @@ def test_calculate_workload_status_thresholds():
 
 def test_would_be_impossible_detects_overload():
     """Adding task should not exceed IMPOSSIBLE."""
-    current = []
     new_task = Task.create(project_id=ProjectId(), title="A")
     new_task.difficulty = 20
-    assert would_be_impossible(current, new_task, base_capacity=10, level=MemberLevel.MID)
+    assert would_be_impossible(0, new_task, base_capacity=10, level=MemberLevel.MID)
+
+
+def test_would_be_impossible_counts_current_score():
+    """The current workload score is added to the new task's difficulty."""
+    new_task = Task.create(project_id=ProjectId(), title="A")
+    new_task.difficulty = 5
+    assert not would_be_impossible(0, new_task, base_capacity=10, level=MemberLevel.MID)
+    assert would_be_impossible(11, new_task, base_capacity=10, level=MemberLevel.MID)
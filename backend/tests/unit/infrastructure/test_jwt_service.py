@@ -0,0 +1,97 @@
+"""Tests for JwtService and the verified-token cache."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.value_objects import UtcDateTime
+from app.infrastructure.auth.jwt_service import JwtService
+from app.infrastructure.auth.token_cache import VerifiedTokenCache
+
+
+def make_token(service: JwtService, subject: str = "user-1", hours: int = 1) -> str:
+    expires_at = UtcDateTime(datetime.now(timezone.utc) + timedelta(hours=hours))
+    return service.create_token(subject, expires_at)
+
+
+def test_create_and_verify_token():
+    """Round-trips the subject claim."""
+    service = JwtService("secret")
+    token = make_token(service)
+
+    assert service.verify_token(token)["sub"] == "user-1"
+
+
+def test_verify_rejects_tampered_token():
+    """Tokens signed with another secret are rejected."""
+    token = make_token(JwtService("other-secret"))
+
+    with pytest.raises(BusinessRuleViolation):
+        JwtService("secret").verify_token(token)
+
+
+def test_verify_uses_cache_after_first_decode(monkeypatch):
+    """A token is decoded only once while cached."""
+    service = JwtService("secret")
+    token = make_token(service)
+    calls = []
+    original = service._decode
+    monkeypatch.setattr(service, "_decode", lambda value: calls.append(value) or original(value))
+
+    service.verify_token(token)
+    service.verify_token(token)
+
+    assert len(calls) == 1
+
+
+def test_invalid_tokens_are_not_cached():
+    """Failed verifications leave the cache empty."""
+    service = JwtService("secret")
+
+    with pytest.raises(BusinessRuleViolation):
+        service.verify_token("not-a-token")
+
+    assert len(service.cache) == 0
+
+
+def test_cache_drops_expired_entries():
+    """Entries are evicted once exp has passed."""
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_size=10, clock=lambda: now[0])
+    cache.put("token", {"sub": "user-1", "exp": 1010})
+
+    assert cache.get("token") == {"sub": "user-1", "exp": 1010}
+    now[0] = 1010.0
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded_lru():
+    """Least recently used entries are evicted first."""
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put("a", {"sub": "a"})
+    cache.put("b", {"sub": "b"})
+    cache.get("a")
+    cache.put("c", {"sub": "c"})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_cache_returns_copies():
+    """Mutating returned claims does not change the cache."""
+    cache = VerifiedTokenCache()
+    cache.put("token", {"sub": "user-1"})
+
+    cache.get("token")["sub"] = "someone-else"
+
+    assert cache.get("token")["sub"] == "user-1"
+
+
+def test_zero_size_disables_cache():
+    """A cache size of zero stores nothing."""
+    cache = VerifiedTokenCache(max_size=0)
+    cache.put("token", {"sub": "user-1"})
+
+    assert cache.get("token") is None
@@ -0,0 +1,55 @@
+"""Tests for pool settings and instrumentation."""
+import pytest
+from sqlalchemy import exc, text
+
+from app.infrastructure.database import create_db_engine
+from app.infrastructure.pool import InstrumentedQueuePool, PoolSettings, pool_metrics
+
+
+def test_file_database_uses_configured_instrumented_pool(tmp_path):
+    """Pool settings reach the engine's instrumented queue pool."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", PoolSettings(size=3, max_overflow=2))
+
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._pre_ping is True
+
+
+def test_memory_database_keeps_default_pool():
+    """In-memory SQLite is not given a queue pool."""
+    engine = create_db_engine("sqlite:///:memory:")
+
+    assert not isinstance(engine.pool, InstrumentedQueuePool)
+    assert "status" in pool_metrics(engine.pool)
+
+
+def test_metrics_track_checkouts_and_overflow(tmp_path):
+    """Snapshots report checkouts, checked-out connections and overflow."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", PoolSettings(size=1, max_overflow=1))
+
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        busy = pool_metrics(engine.pool)
+    idle = pool_metrics(engine.pool)
+
+    assert busy["checkouts"] == 2
+    assert busy["checked_out"] == 2
+    assert busy["overflow"] == 1
+    assert idle["checked_out"] == 0
+    assert idle["wait_max_ms"] >= 0
+
+
+def test_metrics_count_timeouts(tmp_path):
+    """A checkout that times out is counted."""
+    engine = create_db_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        PoolSettings(size=1, max_overflow=0, timeout=0.01),
+    )
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    assert pool_metrics(engine.pool)["timeouts"] == 1
@@ -0,0 +1,131 @@
+"""Tests for ProjectAccessIndex and the ProjectAccess dependency."""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies import ProjectAccess
+from app.domain.models.project import Project
+from app.domain.models.user import User
+from app.domain.models.value_objects import ProjectId, TaskId
+from app.infrastructure.auth.project_access import ProjectAccessIndex
+
+
+class TestProjectAccessIndex:
+    """Test suite for the cached project permission index."""
+
+    def setup_method(self):
+        self.index = ProjectAccessIndex()
+        self.uow = MagicMock()
+        self.user = User.create(email="manager@example.com", name="Manager")
+        self.project_id = ProjectId()
+        self.uow.projects.list_ids_by_created_by.return_value = [self.project_id]
+
+    def test_loads_managed_projects_once(self):
+        """Managed projects are cached after the first load."""
+        first = self.index.managed_projects(self.uow, self.user.id)
+        second = self.index.managed_projects(self.uow, self.user.id)
+
+        assert first == second == frozenset({self.project_id})
+        self.uow.projects.list_ids_by_created_by.assert_called_once_with(self.user.id)
+
+    def test_revoke_forces_reload(self):
+        """Revocation drops the cached grants."""
+        self.index.managed_projects(self.uow, self.user.id)
+        self.index.revoke(self.user.id)
+        self.index.managed_projects(self.uow, self.user.id)
+
+        assert self.uow.projects.list_ids_by_created_by.call_count == 2
+
+    def test_load_racing_with_revoke_is_not_cached(self):
+        """A load that started before a revocation is discarded."""
+        def revoke_during_load(user_id):
+            self.index.revoke(user_id)
+            return [self.project_id]
+
+        self.uow.projects.list_ids_by_created_by.side_effect = revoke_during_load
+        self.index.managed_projects(self.uow, self.user.id)
+        self.index.managed_projects(self.uow, self.user.id)
+
+        assert self.uow.projects.list_ids_by_created_by.call_count == 2
+
+    def test_caches_task_project(self):
+        """Task to project lookups hit the database once."""
+        task_id = TaskId()
+        self.uow.tasks.find_project_id.return_value = self.project_id
+
+        assert self.index.project_for_task(self.uow, task_id) == self.project_id
+        assert self.index.project_for_task(self.uow, task_id) == self.project_id
+        self.uow.tasks.find_project_id.assert_called_once_with(task_id)
+
+    def test_missing_task_is_not_cached(self):
+        """Unknown tasks return None and are looked up again."""
+        self.uow.tasks.find_project_id.return_value = None
+
+        assert self.index.project_for_task(self.uow, TaskId()) is None
+
+
+class TestProjectAccess:
+    """Test suite for the request-level ProjectAccess helper."""
+
+    def setup_method(self):
+        self.index = ProjectAccessIndex()
+        self.uow = MagicMock()
+        self.user = User.create(email="manager@example.com", name="Manager")
+        self.project = Project.create(name="Proj", created_by=self.user.id)
+        self.uow.projects.list_ids_by_created_by.return_value = [self.project.id]
+        self.access = ProjectAccess(self.user, self.uow, self.index)
+
+    def test_manager_passes_without_loading_project(self):
+        """Cached grants never load the project."""
+        self.access.require_manager(self.project.id)
+        self.access.require_manager(self.project.id)
+
+        self.uow.projects.find_by_id.assert_not_called()
+        self.uow.projects.list_ids_by_created_by.assert_called_once()
+
+    def test_missing_project_is_404(self):
+        """Unknown projects raise 404."""
+        self.uow.projects.find_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.access.require_manager(ProjectId())
+
+        assert exc_info.value.status_code == 404
+
+    def test_non_manager_is_403(self):
+        """Projects managed by someone else raise 403."""
+        other = Project.create(name="Other", created_by=User.create(email="o@example.com", name="O").id)
+        self.uow.projects.find_by_id.return_value = other
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.access.require_manager(other.id)
+
+        assert exc_info.value.status_code == 403
+
+    def test_stale_index_is_refreshed(self):
+        """A project missing from a stale index is granted and reloaded."""
+        self.uow.projects.list_ids_by_created_by.return_value = []
+        self.uow.projects.find_by_id.return_value = self.project
+        self.access.require_manager(self.project.id)
+
+        self.uow.projects.list_ids_by_created_by.return_value = [self.project.id]
+        self.access.require_manager(self.project.id)
+
+        self.uow.projects.find_by_id.assert_called_once()
+
+    def test_readable_projects_include_memberships(self):
+        """Managed projects and memberships are both readable."""
+        joined = ProjectId()
+        self.uow.project_members.list_project_ids_by_user.return_value = [joined]
+
+        assert self.access.readable_projects() == {self.project.id, joined}
+
+    def test_missing_task_is_404(self):
+        """Task checks raise 404 for unknown tasks."""
+        self.uow.tasks.find_project_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            self.access.require_task_manager(TaskId())
+
+        assert exc_info.value.status_code == 404
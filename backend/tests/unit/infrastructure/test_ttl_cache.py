@@ -0,0 +1,56 @@
+"""Tests for TtlCache."""
+from app.infrastructure.cache.ttl_cache import TtlCache
+
+
+def test_get_returns_stored_value():
+    """Stored values are returned until they expire."""
+    cache = TtlCache(ttl_seconds=10)
+    cache.put("key", "value")
+
+    assert cache.get("key") == "value"
+
+
+def test_entries_expire_after_ttl():
+    """Entries older than the TTL are dropped."""
+    now = [0.0]
+    cache = TtlCache(ttl_seconds=5, clock=lambda: now[0])
+    cache.put("key", "value")
+
+    now[0] = 4.9
+    assert cache.get("key") == "value"
+    now[0] = 5.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_removes_entry():
+    """Explicit invalidation drops a single entry."""
+    cache = TtlCache(ttl_seconds=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_cache_evicts_least_recently_used():
+    """The cache never grows past max_size."""
+    cache = TtlCache(ttl_seconds=10, max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_zero_ttl_disables_cache():
+    """A non-positive TTL stores nothing."""
+    cache = TtlCache(ttl_seconds=0)
+    cache.put("key", "value")
+
+    assert cache.get("key") is None
@@ -2,15 +2,15 @@
 import pytest
 from unittest.mock import MagicMock
 
+from app.application.dtos.pagination import Page
 from app.application.use_cases.change_employee_role import ChangeEmployeeRoleUseCase
 from app.application.use_cases.get_employee_workload import GetEmployeeWorkloadUseCase
 from app.application.use_cases.list_team import ListTeamUseCase
 from app.application.use_cases.resign_from_project import ResignFromProjectUseCase
 from app.domain.exceptions import BusinessRuleViolation
-from app.domain.models.enums import MemberLevel, TaskStatus, WorkloadStatus
+from app.domain.models.enums import AbandonmentType, MemberLevel, WorkloadStatus
 from app.domain.models.project_member import ProjectMember
-from app.domain.models.task import Task
-from app.domain.models.value_objects import ProjectId, RoleId, UserId
+from app.domain.models.value_objects import ProjectId, RoleId, TaskId, UserId
 
 
 def test_resign_from_project_unassigns_tasks():
@@ -25,16 +25,16 @@ def test_resign_from_project_unassigns_tasks():
         base_capacity=10,
     )
     uow.project_members.find_by_project_and_user.return_value = member
-    task = Task.create(project_id=project_id, title="Task")
-    task.status = TaskStatus.DOING
-    task.assigned_to = user_id
-    uow.tasks.list_by_project.return_value = [task]
+    task_id = TaskId()
+    uow.tasks.unassign_user.return_value = [task_id]
     use_case = ResignFromProjectUseCase(uow)
 
     use_case.execute(project_id, user_id)
 
-    uow.tasks.save.assert_called_once()
-    uow.task_abandonments.save.assert_called_once()
+    uow.tasks.unassign_user.assert_called_once_with(project_id, user_id)
+    (abandonments,), _ = uow.task_abandonments.add_many.call_args
+    assert [abandonment.task_id for abandonment in abandonments] == [task_id]
+    assert abandonments[0].abandonment_type == AbandonmentType.RESIGNED
     uow.commit.assert_called_once()
 
 
@@ -47,12 +47,13 @@ def test_list_team_returns_members():
         level=MemberLevel.MID,
         base_capacity=10,
     )
-    uow.project_members.list_by_project.return_value = [member]
+    uow.project_members.page_by_project.return_value = Page([member])
     use_case = ListTeamUseCase(uow)
 
     result = use_case.execute(member.project_id)
 
-    assert result[0].user_id == member.user_id
+    assert result.items[0].user_id == member.user_id
+    assert result.next_cursor is None
 
 
 def test_get_employee_workload_computes_status():
@@ -67,16 +68,15 @@ def test_get_employee_workload_computes_status():
         base_capacity=10,
     )
     uow.project_members.find_by_project_and_user.return_value = member
-    task = Task.create(project_id=project_id, title="Task")
-    task.status = TaskStatus.DOING
-    task.assigned_to = user_id
-    task.difficulty = 8
-    uow.tasks.list_by_project.return_value = [task]
+    uow.member_workloads.get_doing_difficulty.return_value = 8
     use_case = GetEmployeeWorkloadUseCase(uow)
 
     result = use_case.execute(project_id, user_id)
 
+    assert result.workload_score == 8
     assert result.status == WorkloadStatus.HEALTHY
+    uow.member_workloads.get_doing_difficulty.assert_called_once_with(project_id, user_id)
+    uow.tasks.list_by_project.assert_not_called()
 
 
 def test_change_employee_role_updates_member():
@@ -4,11 +4,9 @@ from unittest.mock import MagicMock
 
 from app.application.use_cases.fire_employee import FireEmployeeUseCase
 from app.domain.exceptions import BusinessRuleViolation
-from app.domain.models.enums import TaskStatus
-from app.domain.models.enums import MemberLevel
+from app.domain.models.enums import AbandonmentType, MemberLevel
 from app.domain.models.project_member import ProjectMember
-from app.domain.models.task import Task
-from app.domain.models.value_objects import ProjectId, UserId
+from app.domain.models.value_objects import ProjectId, TaskId, UserId
 
 
 class TestFireEmployeeUseCase:
@@ -29,15 +27,15 @@ class TestFireEmployeeUseCase:
 
     def test_fires_employee_and_unassigns_tasks(self):
         """Unassigns tasks and records abandonments."""
-        task = Task.create(project_id=self.project_id, title="Task")
-        task.status = TaskStatus.DOING
-        task.assigned_to = self.user_id
-        self.uow.tasks.list_by_project.return_value = [task]
+        task_id = TaskId()
+        self.uow.tasks.unassign_user.return_value = [task_id]
 
         self.use_case.execute(self.project_id, self.user_id)
 
-        self.uow.tasks.save.assert_called_once()
-        self.uow.task_abandonments.save.assert_called_once()
+        self.uow.tasks.unassign_user.assert_called_once_with(self.project_id, self.user_id)
+        (abandonments,), _ = self.uow.task_abandonments.add_many.call_args
+        assert [abandonment.task_id for abandonment in abandonments] == [task_id]
+        assert abandonments[0].abandonment_type == AbandonmentType.FIRED_FROM_PROJECT
         self.uow.commit.assert_called_once()
 
     def test_fails_if_member_missing(self):
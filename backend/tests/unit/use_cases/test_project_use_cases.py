@@ -6,10 +6,14 @@ from app.application.dtos.project_dtos import CreateRoleInput, ConfigureProjectL
 from app.application.use_cases.configure_project_llm import ConfigureProjectLlmUseCase
 from app.application.use_cases.create_role import CreateRoleUseCase
 from app.application.use_cases.get_project import GetProjectUseCase
+from app.application.use_cases.get_project_snapshot import GetProjectSnapshotUseCase
 from app.application.use_cases.view_invite import ViewInviteUseCase
 from app.domain.exceptions import BusinessRuleViolation
+from app.domain.models.enums import MemberLevel, TaskStatus, WorkloadStatus
 from app.domain.models.project import Project
 from app.domain.models.project_invite import ProjectInvite
+from app.domain.models.project_member import ProjectMember
+from app.domain.models.task import Task
 from app.domain.models.value_objects import InviteToken, ProjectId, UserId
 
 
@@ -85,3 +89,37 @@ def test_view_invite_fails_if_missing():
 
     with pytest.raises(BusinessRuleViolation):
         use_case.execute(InviteToken("missing"))
+
+
+def test_get_project_snapshot_derives_workloads():
+    """Snapshot includes every member's workload from the loaded tasks."""
+    uow = MagicMock()
+    project = Project.create(name="Proj", created_by=UserId())
+    busy = ProjectMember.create_member(project.id, UserId(), level=MemberLevel.MID, base_capacity=10)
+    idle = ProjectMember.create_member(project.id, UserId(), level=MemberLevel.MID, base_capacity=10)
+    task = Task.create(project_id=project.id, title="Task")
+    task.status = TaskStatus.DOING
+    task.difficulty = 9
+    task.assigned_to = busy.user_id
+    uow.projects.find_by_id.return_value = project
+    uow.project_members.list_by_project.return_value = [busy, idle]
+    uow.roles.list_by_project.return_value = []
+    uow.tasks.list_by_project.return_value = [task]
+    uow.task_dependencies.list_by_project.return_value = []
+
+    snapshot = GetProjectSnapshotUseCase(uow).execute(project.id)
+
+    workloads = {workload.user_id: workload for workload in snapshot.workloads}
+    assert workloads[busy.user_id].workload_score == 9
+    assert workloads[busy.user_id].status == WorkloadStatus.HEALTHY
+    assert workloads[idle.user_id].workload_score == 0
+    assert [item.id for item in snapshot.tasks] == [task.id]
+
+
+def test_get_project_snapshot_fails_if_project_missing():
+    """Fails if project missing."""
+    uow = MagicMock()
+    uow.projects.find_by_id.return_value = None
+
+    with pytest.raises(BusinessRuleViolation):
+        GetProjectSnapshotUseCase(uow).execute(ProjectId())
@@ -3,6 +3,7 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+from app.application.dtos.pagination import Page
 from app.application.dtos.schedule_dtos import ManualDateOverrideInput, UpdateProjectDateInput
 from app.application.use_cases.detect_delay import DetectDelayUseCase
 from app.application.use_cases.manual_date_override import ManualDateOverrideUseCase
@@ -87,14 +88,14 @@ def test_view_schedule_history_returns_lists():
         new_end=UtcDateTime(),
         reason=ScheduleChangeReason.MANUAL_OVERRIDE,
     )
-    uow.schedule_history.list_project_history.return_value = [project_history]
-    uow.schedule_history.list_task_history.return_value = [task_history]
+    uow.schedule_history.page_project_history.return_value = Page([project_history])
+    uow.schedule_history.page_task_history.return_value = Page([task_history])
     use_case = ViewScheduleHistoryUseCase(uow)
 
     projects, tasks = use_case.execute(project_id=project_history.project_id, task_id=task_history.task_id)
 
-    assert len(projects) == 1
-    assert len(tasks) == 1
+    assert len(projects.items) == 1
+    assert len(tasks.items) == 1
 
 
 def test_detect_delay_fails_if_task_missing():
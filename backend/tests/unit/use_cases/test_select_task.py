@@ -33,7 +33,7 @@ class TestSelectTaskUseCase:
     def test_selects_task_successfully(self):
         """Selects task and assigns user."""
         self.task.difficulty = 3
-        self.uow.tasks.list_by_project.return_value = []
+        self.uow.member_workloads.get_doing_difficulty.return_value = 0
         input_dto = SelectTaskInput(task_id=self.task.id, user_id=self.user_id)
 
         result = self.use_case.execute(input_dto)
@@ -46,7 +46,7 @@ class TestSelectTaskUseCase:
     def test_fails_if_difficulty_not_set(self):
         """Cannot select task without difficulty."""
         self.task.difficulty = None
-        self.uow.tasks.list_by_project.return_value = []
+        self.uow.member_workloads.get_doing_difficulty.return_value = 0
         input_dto = SelectTaskInput(task_id=self.task.id, user_id=self.user_id)
 
         with pytest.raises(BusinessRuleViolation):
@@ -56,7 +56,7 @@ class TestSelectTaskUseCase:
         """Managers cannot claim tasks."""
         self.task.difficulty = 3
         self.member.is_manager = True
-        self.uow.tasks.list_by_project.return_value = []
+        self.uow.member_workloads.get_doing_difficulty.return_value = 0
         input_dto = SelectTaskInput(task_id=self.task.id, user_id=self.user_id)
 
         with pytest.raises(BusinessRuleViolation):
@@ -65,11 +65,7 @@ class TestSelectTaskUseCase:
     def test_fails_if_workload_impossible(self):
         """Workload cannot become IMPOSSIBLE."""
         self.task.difficulty = 10
-        existing = Task.create(project_id=self.project_id, title="Existing")
-        existing.status = TaskStatus.DOING
-        existing.assigned_to = self.user_id
-        existing.difficulty = 6
-        self.uow.tasks.list_by_project.return_value = [existing]
+        self.uow.member_workloads.get_doing_difficulty.return_value = 6
         input_dto = SelectTaskInput(task_id=self.task.id, user_id=self.user_id)
 
         with pytest.raises(BusinessRuleViolation):
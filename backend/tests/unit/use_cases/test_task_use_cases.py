@@ -4,14 +4,19 @@ from unittest.mock import MagicMock
 
 from app.application.dtos.task_dtos import (
     CalculateProgressInput,
+    ImportDependencyRow,
+    ImportTaskRow,
+    ImportTasksInput,
     SetTaskDifficultyInput,
     TaskDependencyInput,
     TaskReportInput,
 )
 from app.application.use_cases.add_task_dependency import AddTaskDependencyUseCase
 from app.application.use_cases.add_task_report import AddTaskReportUseCase
+from app.application.use_cases.batch_get_tasks import BatchGetTasksUseCase
 from app.application.use_cases.calculate_progress_llm import CalculateProgressLlmUseCase
 from app.application.use_cases.calculate_task_difficulty_llm import CalculateTaskDifficultyLlmUseCase
+from app.application.use_cases.import_tasks import ImportTasksUseCase
 from app.application.use_cases.remove_from_task import RemoveFromTaskUseCase
 from app.application.use_cases.remove_task_dependency import RemoveTaskDependencyUseCase
 from app.application.use_cases.set_task_difficulty_manual import SetTaskDifficultyManualUseCase
@@ -145,3 +150,53 @@ def test_remove_from_task_fails_when_not_assigned():
 
     with pytest.raises(BusinessRuleViolation):
         use_case.execute(task.id, UserId())
+
+
+def test_batch_get_tasks_uses_one_multi_get():
+    """Fetches all requested tasks through find_by_ids."""
+    uow = MagicMock()
+    task = Task.create(project_id=ProjectId(), title="Task")
+    uow.tasks.find_by_ids.return_value = [task]
+
+    result = BatchGetTasksUseCase(uow).execute([task.id, TaskId()])
+
+    assert [item.id for item in result] == [task.id]
+    uow.tasks.find_by_ids.assert_called_once()
+    uow.tasks.find_by_id.assert_not_called()
+
+
+def test_import_tasks_rejects_cycle_before_writing():
+    """A cycle anywhere in the imported graph fails the import with no writes."""
+    uow = MagicMock()
+    event_bus = MagicMock()
+    use_case = ImportTasksUseCase(uow, event_bus)
+
+    with pytest.raises(BusinessRuleViolation) as exc:
+        use_case.execute(ImportTasksInput(
+            project_id=ProjectId(),
+            tasks=[ImportTaskRow(ref=ref, title=ref) for ref in "abc"],
+            dependencies=[
+                ImportDependencyRow(task_ref="a", depends_on_ref="b"),
+                ImportDependencyRow(task_ref="b", depends_on_ref="c"),
+                ImportDependencyRow(task_ref="c", depends_on_ref="a"),
+            ],
+        ))
+
+    assert exc.value.code == "dependency_cycle"
+    uow.tasks.add_many.assert_not_called()
+    event_bus.emit.assert_not_called()
+
+
+def test_import_tasks_rejects_unknown_ref():
+    """Edges must point at tasks of the same import."""
+    uow = MagicMock()
+    use_case = ImportTasksUseCase(uow, MagicMock())
+
+    with pytest.raises(BusinessRuleViolation) as exc:
+        use_case.execute(ImportTasksInput(
+            project_id=ProjectId(),
+            tasks=[ImportTaskRow(ref="a", title="A")],
+            dependencies=[ImportDependencyRow(task_ref="a", depends_on_ref="missing")],
+        ))
+
+    assert exc.value.code == "unknown_task_ref"
@@ -5,7 +5,7 @@ from unittest.mock import Mock, MagicMock
 from app.application.dtos.task_dtos import SelectTaskInput
 from app.application.use_cases.select_task import SelectTaskUseCase
 from app.domain.exceptions import BusinessRuleViolation
-from app.domain.models.enums import MemberLevel, TaskStatus
+from app.domain.models.enums import MemberLevel
 from app.domain.models.project_member import ProjectMember
 from app.domain.models.task import Task
 from app.domain.models.value_objects import ProjectId, UserId
@@ -28,11 +28,7 @@ def test_select_task_blocks_impossible_workload():
         base_capacity=10,
     )
     uow.project_members.find_by_project_and_user.return_value = member
-    existing = Task.create(project_id=project_id, title="Existing")
-    existing.status = TaskStatus.DOING
-    existing.assigned_to = user_id
-    existing.difficulty = 6
-    uow.tasks.list_by_project.return_value = [existing]
+    uow.member_workloads.get_doing_difficulty.return_value = 6
 
     with pytest.raises(BusinessRuleViolation):
         use_case.execute(SelectTaskInput(task_id=task.id, user_id=user_id))